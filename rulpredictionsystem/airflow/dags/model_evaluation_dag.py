@@ -5,7 +5,10 @@ This DAG compares newly trained models against production models and
 automatically promotes better performing models to production.
 
 Features:
+- New candidates and the production model looked up in the model registry
 - Load and compare multiple model versions
+- Tournament ranking of the staging model and candidates (models/candidates/<name>/)
+- Permutation feature importance, recorded for the model exporter
 - Calculate comprehensive performance metrics
 - Generate comparison reports
 - Automated model promotion with approval gates
@@ -19,7 +22,7 @@ import os
 import sys
 import json
 from datetime import datetime, timedelta
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 
 from airflow import DAG
 from airflow.operators.python import PythonOperator, BranchPythonOperator
@@ -28,20 +31,25 @@ from airflow.operators.email import EmailOperator
 from airflow.utils.task_group import TaskGroup
 from airflow.models import Variable
 from airflow.utils.trigger_rule import TriggerRule
-from airflow.exceptions import AirflowException
+from airflow.exceptions import AirflowException, AirflowSkipException
 from airflow.sensors.filesystem import FileSensor
 
 # Add custom paths
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+# Only lightweight plugin modules are imported at the top level: the
+# scheduler re-parses this file often, so numerical and ML libraries are
+# imported inside the task callables that use them
 from plugins.model_utils import (
     load_model,
-    calculate_metrics,
-    compare_models,
+    find_model_file,
+    rank_models,
     promote_model,
     generate_evaluation_report,
     send_slack_notification
 )
+from plugins.model_registry import ModelRegistry, model_version_for
+from plugins.artifact_checksum import artifact_checksum, verify_artifact, ArtifactIntegrityError
 
 # Configuration
 PROJECT_ROOT = os.getenv(
@@ -52,13 +60,30 @@ PROJECT_ROOT = os.getenv(
 MODELS_DIR = os.path.join(PROJECT_ROOT, 'models')
 PRODUCTION_MODEL_DIR = os.path.join(MODELS_DIR, 'production')
 STAGING_MODEL_DIR = os.path.join(MODELS_DIR, 'staging')
+CANDIDATES_DIR = os.path.join(MODELS_DIR, 'candidates')
 EVALUATION_DIR = os.path.join(PROJECT_ROOT, 'airflow', 'logs', 'evaluations')
 TEST_DATA_DIR = os.path.join(PROJECT_ROOT, 'data', 'test')
+PREDICTION_CACHE_DIR = os.path.join(EVALUATION_DIR, 'prediction_cache')
+PREDICTIONS_DIR = os.path.join(EVALUATION_DIR, 'predictions')
 
 # Email configuration
 ALERT_EMAIL = Variable.get('alert_email', default_var='admin@example.com')
 APPROVAL_EMAIL = Variable.get('approval_email', default_var='ml-team@example.com')
 
+# Score staging, production and candidate models in one task over a shared
+# test set instead of one task per model
+CO_SCHEDULED_EVALUATION = Variable.get(
+    'evaluation_co_scheduled', default_var='true'
+).lower() == 'true'
+
+# Tasks that push the per-model evaluation results
+if CO_SCHEDULED_EVALUATION:
+    STAGING_RESULTS_TASK = 'evaluation_group.evaluate_all_models'
+    PRODUCTION_RESULTS_TASK = 'evaluation_group.evaluate_all_models'
+else:
+    STAGING_RESULTS_TASK = 'evaluation_group.evaluate_staging_model'
+    PRODUCTION_RESULTS_TASK = 'evaluation_group.evaluate_production_model'
+
 # Performance thresholds for automatic promotion
 PERFORMANCE_THRESHOLDS = {
     'mae_improvement': 0.05,  # 5% improvement required
@@ -66,6 +91,8 @@ PERFORMANCE_THRESHOLDS = {
     'r2_improvement': 0.02,
     'min_r2_score': 0.85,
     'max_mae': 10.0,
+    'max_p_value': 0.05,  # paired bootstrap significance of MAE/RMSE improvements
+    'max_p99_regression': 1.5,  # p99 latency at most 1.5x production at every batch size
 }
 
 # Default arguments
@@ -85,12 +112,94 @@ default_args = {
 def check_new_model_available(**context) -> bool:
     """
     Check if a new model is available for evaluation.
+
+    Unevaluated candidates and the production model come from the model
+    registry: the newest candidate is evaluated as the staging model, older
+    ones join the tournament as candidate_<version>. The staging and
+    candidate directories are only scanned when the registry is unreachable.
     """
     print("Checking for new models to evaluate...")
 
-    staging_path = os.path.join(STAGING_MODEL_DIR, 'model.h5')
+    registry = ModelRegistry()
+
+    try:
+        candidates = registry.candidates()
+        production = registry.production_model()
+    except Exception as e:
+        print(f"Model registry unavailable ({str(e)}), checking staging directory")
+        return _check_staging_directory(**context)
+
+    contenders = {}
+
+    for candidate in candidates:
+        model_version = candidate['model_version']
+
+        if not os.path.exists(candidate['model_path']):
+            print(f"Candidate {model_version} artifact missing: {candidate['model_path']}")
+            continue
+
+        # Training runs overwrite the staging artifact, so an older row's
+        # path may hold a newer model; it can no longer be evaluated
+        current_version = model_version_for(artifact_checksum(candidate['model_path'])['digest'])
+        if current_version != model_version:
+            print(f"Candidate {model_version} artifact was overwritten by {current_version}")
+            registry.mark_evaluated(
+                model_version,
+                metrics={'stale_artifact': f"{candidate['model_path']} holds {current_version}"},
+                status='rejected'
+            )
+            continue
+
+        # A corrupt or partial artifact is rejected without being evaluated
+        try:
+            checksum_verified = verify_artifact(candidate['model_path'])
+        except ArtifactIntegrityError as e:
+            print(f"Candidate {model_version} failed verification: {str(e)}")
+            registry.mark_evaluated(
+                model_version,
+                metrics={'integrity_error': str(e)},
+                status='rejected'
+            )
+            continue
+
+        model_name = 'staging_model' if not contenders else f'candidate_{model_version}'
+        contenders[model_name] = {
+            'path': candidate['model_path'],
+            'model_version': model_version,
+            'registered_at': str(candidate['created_at']),
+            'size_mb': os.path.getsize(candidate['model_path']) / (1024 * 1024),
+            'checksum_verified': checksum_verified,
+        }
+
+    if not contenders:
+        print("No unevaluated candidate in the model registry")
+        return False
+
+    if production is not None and not os.path.exists(production['model_path']):
+        raise AirflowException(
+            f"Production model {production['model_version']} artifact missing: {production['model_path']}"
+        )
+
+    print(f"New model found: {contenders['staging_model']['model_version']} "
+          f"registered at {contenders['staging_model']['registered_at']}")
 
-    if not os.path.exists(staging_path):
+    _push_evaluation_models(context, 'registry', contenders, production and {
+        'path': production['model_path'],
+        'model_version': production['model_version'],
+    })
+
+    return True
+
+
+def _check_staging_directory(**context) -> bool:
+    """
+    Filesystem fallback of check_new_model_available: a staging model newer
+    than the last evaluation, the models under CANDIDATES_DIR and the model
+    in the production directory.
+    """
+    staging_path = find_model_file(STAGING_MODEL_DIR)
+
+    if staging_path is None:
         print("No new model found in staging directory")
         return False
 
@@ -110,19 +219,84 @@ def check_new_model_available(**context) -> bool:
                 print(f"Model already evaluated at {last_eval_time}")
                 return False
 
+    contenders = {}
+
+    for model_name, model_path in {'staging_model': staging_path, **find_candidate_models()}.items():
+        try:
+            checksum_verified = verify_artifact(model_path)
+        except ArtifactIntegrityError as e:
+            print(f"{model_name} failed verification: {str(e)}")
+            continue
+
+        contenders[model_name] = dict(
+            _directory_model(model_path),
+            modified_time=datetime.fromtimestamp(os.path.getmtime(model_path)).isoformat(),
+            size_mb=os.path.getsize(model_path) / (1024 * 1024),
+            checksum_verified=checksum_verified,
+        )
+
+    if 'staging_model' not in contenders:
+        return False
+
     print(f"New model found, modified at {staging_time}")
 
+    production_path = find_model_file(PRODUCTION_MODEL_DIR)
+    _push_evaluation_models(
+        context, 'directory', contenders,
+        _directory_model(production_path) if production_path else None
+    )
+
+    return True
+
+
+def _directory_model(model_path: str) -> Dict[str, Any]:
+    """Path and model version of a model found by a directory scan"""
+    from plugins.artifact_checksum import file_content_hash
+
+    return {'path': model_path, 'model_version': model_version_for(file_content_hash(model_path))}
+
+
+def _push_evaluation_models(
+    context: Dict[str, Any],
+    source: str,
+    contenders: Dict[str, Dict[str, Any]],
+    production: Optional[Dict[str, Any]]
+) -> None:
+    """
+    Push the models of this evaluation run: the contenders (staging model
+    first) and the production model, each with its path and model version.
+    """
     # Push model info to XCom
+    context['task_instance'].xcom_push(key='new_model_info', value=contenders['staging_model'])
     context['task_instance'].xcom_push(
-        key='new_model_info',
-        value={
-            'path': staging_path,
-            'modified_time': staging_time.isoformat(),
-            'size_mb': os.path.getsize(staging_path) / (1024 * 1024)
-        }
+        key='evaluation_models',
+        value={'source': source, 'contenders': contenders, 'production': production}
     )
 
-    return True
+
+def _evaluation_models(context: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Models of this evaluation run, as found by check_new_model.
+
+    Raises:
+        AirflowSkipException: If no new model was found
+    """
+    evaluation_models = context['task_instance'].xcom_pull(
+        task_ids='check_new_model',
+        key='evaluation_models'
+    )
+
+    if not evaluation_models:
+        raise AirflowSkipException("No new model to evaluate")
+
+    return evaluation_models
+
+
+def _production_model_path(context: Dict[str, Any]) -> Optional[str]:
+    """Path of the production model, None if there is none"""
+    production = _evaluation_models(context)['production']
+
+    return production['path'] if production else None
 
 
 def load_test_data(**context) -> Dict[str, Any]:
@@ -131,18 +305,16 @@ def load_test_data(**context) -> Dict[str, Any]:
     """
     print("Loading test data...")
 
-    import numpy as np
-    import pandas as pd
+    from plugins.evaluation import load_test_set
 
-    # Load test data
+    # Memory-map test data; only the shapes are needed here
     test_features_path = os.path.join(TEST_DATA_DIR, 'test_features.npy')
     test_labels_path = os.path.join(TEST_DATA_DIR, 'test_labels.npy')
 
-    if not os.path.exists(test_features_path) or not os.path.exists(test_labels_path):
-        raise AirflowException(f"Test data not found in {TEST_DATA_DIR}")
-
-    X_test = np.load(test_features_path)
-    y_test = np.load(test_labels_path)
+    try:
+        X_test, y_test = load_test_set(test_features_path, test_labels_path)
+    except (FileNotFoundError, ValueError) as e:
+        raise AirflowException(f"Invalid test data in {TEST_DATA_DIR}: {str(e)}")
 
     print(f"Test data loaded: X_test shape={X_test.shape}, y_test shape={y_test.shape}")
 
@@ -154,18 +326,109 @@ def load_test_data(**context) -> Dict[str, Any]:
         'test_labels_path': test_labels_path,
     }
 
+    # Optional bearing id per test row, used to stratify the screening sample
+    test_groups_path = os.path.join(TEST_DATA_DIR, 'test_groups.npy')
+    if os.path.exists(test_groups_path):
+        test_data_info['test_groups_path'] = test_groups_path
+
+    # Optional equipment type per test row, used to slice the metrics
+    test_equipment_types_path = os.path.join(TEST_DATA_DIR, 'test_equipment_types.npy')
+    if os.path.exists(test_equipment_types_path):
+        test_data_info['test_equipment_types_path'] = test_equipment_types_path
+
     context['task_instance'].xcom_push(key='test_data_info', value=test_data_info)
 
     return test_data_info
 
 
-def evaluate_staging_model(**context) -> Dict[str, Any]:
+def _get_evaluation_settings() -> Dict[str, Any]:
     """
-    Evaluate the staging model on test data.
+    Batch size, memory ceiling and prediction cache for model evaluation.
     """
-    print("Evaluating staging model...")
+    from plugins.evaluation import DEFAULT_EVAL_BATCH_SIZE, DEFAULT_MEMORY_LIMIT_MB
+
+    return {
+        'batch_size': int(Variable.get('evaluation_batch_size', default_var=DEFAULT_EVAL_BATCH_SIZE)),
+        'memory_limit_mb': float(Variable.get('evaluation_memory_limit_mb', default_var=DEFAULT_MEMORY_LIMIT_MB)),
+        'cache_dir': PREDICTION_CACHE_DIR,
+    }
+
+
+def _evaluate_model_file(
+    model_path: str,
+    model_name: str,
+    test_data_info: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Score a model file over the memory-mapped test set in batches.
+    """
+    from plugins.evaluation import score_model_file
+
+    # Make predictions batch by batch, streaming them into the metrics
+    print("Making predictions on test data...")
+    results = score_model_file(
+        model_path,
+        model_name,
+        test_data_info['test_features_path'],
+        test_data_info['test_labels_path'],
+        predictions_path=os.path.join(PREDICTIONS_DIR, f'{model_name}.npy'),
+        **_get_evaluation_settings()
+    )
+
+    print(f"Evaluation throughput: {results['rows_per_second']} rows/s")
+
+    return results
+
+
+def _baseline_results() -> Dict[str, Any]:
+    """
+    Results used in place of a missing production model.
+    """
+    return {
+        'model_path': None,
+        'model_name': 'baseline',
+        'metrics': {
+            'mae': float('inf'),
+            'rmse': float('inf'),
+            'r2': -1.0,
+            'mape': float('inf'),
+        },
+        'evaluation_timestamp': datetime.now().isoformat(),
+    }
+
+
+def find_candidate_models() -> Dict[str, str]:
+    """
+    Find additional candidate models (one per subdirectory of CANDIDATES_DIR),
+    for the directory fallback of check_new_model_available.
+    """
+    candidates = {}
+
+    if not os.path.isdir(CANDIDATES_DIR):
+        return candidates
+
+    for name in sorted(os.listdir(CANDIDATES_DIR)):
+        model_path = find_model_file(os.path.join(CANDIDATES_DIR, name))
+        if model_path is not None:
+            candidates[f'candidate_{name}'] = model_path
+
+    return candidates
+
+
+def screen_staging_model(**context) -> Dict[str, Any]:
+    """
+    Screen the contenders on a stratified test subsample (stage 1).
+
+    Every contender (only the staging model when models are evaluated one
+    task each) is screened against the production model. Contenders that
+    clearly miss the promotion thresholds are dropped before the full
+    evaluation, which is skipped if none remain.
+    """
+    print("Screening contenders on a stratified subsample...")
 
     import numpy as np
+    from plugins.evaluation import load_test_set
+    from plugins.screening import screen_models, DEFAULT_SAMPLE_FRACTION, DEFAULT_CONFIDENCE_LEVEL
 
     # Pull test data info
     test_data_info = context['task_instance'].xcom_pull(
@@ -173,32 +436,119 @@ def evaluate_staging_model(**context) -> Dict[str, Any]:
         key='test_data_info'
     )
 
-    # Load test data
-    X_test = np.load(test_data_info['test_features_path'])
-    y_test = np.load(test_data_info['test_labels_path'])
+    contenders = _evaluation_models(context)['contenders']
+    if not CO_SCHEDULED_EVALUATION:
+        contenders = {'staging_model': contenders['staging_model']}
 
-    # Load staging model
-    staging_model_path = os.path.join(STAGING_MODEL_DIR, 'model.h5')
-    staging_model = load_model(staging_model_path)
+    sample_fraction = float(Variable.get('evaluation_screening_fraction', default_var=DEFAULT_SAMPLE_FRACTION))
+    production_model_path = _production_model_path(context)
 
-    # Make predictions
-    print("Making predictions on test data...")
-    y_pred = staging_model.predict(X_test)
-
-    # Calculate metrics
-    print("Calculating performance metrics...")
-    metrics = calculate_metrics(y_test, y_pred)
-
-    # Add additional information
-    staging_results = {
-        'model_path': staging_model_path,
-        'model_name': 'staging_model',
-        'metrics': metrics,
-        'n_test_samples': len(X_test),
-        'evaluation_timestamp': datetime.now().isoformat(),
-    }
+    if production_model_path is None or not 0 < sample_fraction < 1:
+        screening_results = {
+            'stage': 'screening',
+            'decision': 'continue',
+            'contenders': {},
+            'screened_out': [],
+            'reasons': ["Screening skipped (no production model or screening disabled)"],
+        }
 
-    print(f"Staging model metrics: {json.dumps(metrics, indent=2)}")
+    else:
+        X_test, y_test = load_test_set(
+            test_data_info['test_features_path'],
+            test_data_info['test_labels_path']
+        )
+        groups = (
+            np.load(test_data_info['test_groups_path'], allow_pickle=True)
+            if 'test_groups_path' in test_data_info else None
+        )
+        confidence_level = float(Variable.get(
+            'evaluation_screening_confidence', default_var=DEFAULT_CONFIDENCE_LEVEL
+        ))
+        production_model = load_model(production_model_path)
+
+        contender_results = {
+            model_name: screen_models(
+                load_model(model['path']),
+                production_model,
+                X_test,
+                y_test,
+                PERFORMANCE_THRESHOLDS,
+                groups=groups,
+                sample_fraction=sample_fraction,
+                confidence_level=confidence_level,
+            )
+            for model_name, model in contenders.items()
+        }
+        screened_out = [
+            model_name for model_name, results in contender_results.items()
+            if results['decision'] == 'reject'
+        ]
+
+        screening_results = {
+            'stage': 'screening',
+            'decision': 'reject' if len(screened_out) == len(contender_results) else 'continue',
+            'contenders': contender_results,
+            'screened_out': screened_out,
+            'reasons': [
+                f"{model_name}: {reason}"
+                for model_name, results in contender_results.items()
+                for reason in results['reasons']
+            ],
+        }
+
+    screening_results['screening_timestamp'] = datetime.now().isoformat()
+
+    print(f"Screening results: {json.dumps(screening_results, indent=2)}")
+
+    # Push to XCom
+    context['task_instance'].xcom_push(
+        key='screening_results',
+        value=screening_results
+    )
+
+    return screening_results
+
+
+def _screened_out(context: Dict[str, Any]) -> List[str]:
+    """
+    Contenders rejected at screening.
+    """
+    screening_results = context['task_instance'].xcom_pull(
+        task_ids='screen_staging_model',
+        key='screening_results'
+    )
+
+    return (screening_results or {}).get('screened_out', [])
+
+
+def _skip_if_screened_out(context: Dict[str, Any]) -> None:
+    """
+    Skip the full evaluation of a staging model rejected at screening.
+    """
+    if 'staging_model' in _screened_out(context):
+        raise AirflowSkipException("Staging model rejected at screening stage")
+
+
+def evaluate_staging_model(**context) -> Dict[str, Any]:
+    """
+    Evaluate the staging model on test data.
+    """
+    print("Evaluating staging model...")
+
+    _skip_if_screened_out(context)
+
+    # Pull test data info
+    test_data_info = context['task_instance'].xcom_pull(
+        task_ids='load_test_data',
+        key='test_data_info'
+    )
+
+    staging_results = _evaluate_model_file(
+        _evaluation_models(context)['contenders']['staging_model']['path'],
+        'staging_model',
+        test_data_info
+    )
+    print(f"Staging model metrics: {json.dumps(staging_results['metrics'], indent=2)}")
 
     # Push to XCom
     context['task_instance'].xcom_push(
@@ -215,7 +565,7 @@ def evaluate_production_model(**context) -> Dict[str, Any]:
     """
     print("Evaluating production model...")
 
-    import numpy as np
+    _skip_if_screened_out(context)
 
     # Pull test data info
     test_data_info = context['task_instance'].xcom_pull(
@@ -223,47 +573,20 @@ def evaluate_production_model(**context) -> Dict[str, Any]:
         key='test_data_info'
     )
 
-    # Load test data
-    X_test = np.load(test_data_info['test_features_path'])
-    y_test = np.load(test_data_info['test_labels_path'])
-
-    # Load production model
-    production_model_path = os.path.join(PRODUCTION_MODEL_DIR, 'model.h5')
+    production_model_path = _production_model_path(context)
 
-    if not os.path.exists(production_model_path):
+    if production_model_path is None:
         print("No production model found, using baseline metrics")
-        return {
-            'model_path': None,
-            'model_name': 'baseline',
-            'metrics': {
-                'mae': float('inf'),
-                'rmse': float('inf'),
-                'r2': -1.0,
-                'mape': float('inf'),
-            },
-            'evaluation_timestamp': datetime.now().isoformat(),
-        }
-
-    production_model = load_model(production_model_path)
-
-    # Make predictions
-    print("Making predictions on test data...")
-    y_pred = production_model.predict(X_test)
-
-    # Calculate metrics
-    print("Calculating performance metrics...")
-    metrics = calculate_metrics(y_test, y_pred)
-
-    # Add additional information
-    production_results = {
-        'model_path': production_model_path,
-        'model_name': 'production_model',
-        'metrics': metrics,
-        'n_test_samples': len(X_test),
-        'evaluation_timestamp': datetime.now().isoformat(),
-    }
-
-    print(f"Production model metrics: {json.dumps(metrics, indent=2)}")
+        production_results = _baseline_results()
+        context['task_instance'].xcom_push(key='production_results', value=production_results)
+        return production_results
+
+    production_results = _evaluate_model_file(
+        production_model_path,
+        'production_model',
+        test_data_info
+    )
+    print(f"Production model metrics: {json.dumps(production_results['metrics'], indent=2)}")
 
     # Push to XCom
     context['task_instance'].xcom_push(
@@ -274,40 +597,312 @@ def evaluate_production_model(**context) -> Dict[str, Any]:
     return production_results
 
 
-def compare_model_performance(**context) -> Dict[str, Any]:
+def evaluate_all_models(**context) -> Dict[str, Any]:
     """
-    Compare staging and production model performance.
+    Evaluate staging, production and candidate models concurrently.
+
+    The models are the ones check_new_model found (registry candidates and
+    the registry's production model, or the directory fallback).
+
+    The test set is memory-mapped once and every model is scored in its own
+    worker process. Pushes the same staging_results and production_results
+    as the per-model tasks, plus candidate_results for the tournament.
+    Contenders rejected at screening are left out (staging_results is None
+    if the staging model was); the task is skipped if none remain.
     """
-    print("Comparing model performance...")
+    print("Evaluating all models over a shared test set...")
 
-    # Pull evaluation results
-    staging_results = context['task_instance'].xcom_pull(
-        task_ids='evaluation_group.evaluate_staging_model',
-        key='staging_results'
+    from plugins.evaluation import evaluate_models_concurrently
+
+    screened_out = _screened_out(context)
+    contenders = {
+        model_name: model
+        for model_name, model in _evaluation_models(context)['contenders'].items()
+        if model_name not in screened_out
+    }
+
+    if not contenders:
+        raise AirflowSkipException("All contenders rejected at screening stage")
+
+    # Pull test data info
+    test_data_info = context['task_instance'].xcom_pull(
+        task_ids='load_test_data',
+        key='test_data_info'
+    )
+
+    model_paths = {model_name: model['path'] for model_name, model in contenders.items()}
+
+    production_model_path = _production_model_path(context)
+    if production_model_path is not None:
+        model_paths['production_model'] = production_model_path
+
+    results = evaluate_models_concurrently(
+        model_paths,
+        test_data_info['test_features_path'],
+        test_data_info['test_labels_path'],
+        predictions_dir=PREDICTIONS_DIR,
+        **_get_evaluation_settings()
     )
 
-    production_results = context['task_instance'].xcom_pull(
-        task_ids='evaluation_group.evaluate_production_model',
-        key='production_results'
+    staging_results = results.pop('staging_model', None)
+    production_results = results.pop('production_model', None)
+
+    if production_results is None:
+        print("No production model found, using baseline metrics")
+        production_results = _baseline_results()
+
+    if staging_results is not None:
+        print(f"Staging model metrics: {json.dumps(staging_results['metrics'], indent=2)}")
+    print(f"Production model metrics: {json.dumps(production_results['metrics'], indent=2)}")
+
+    for model_name, model_results in results.items():
+        print(f"{model_name} metrics: {json.dumps(model_results['metrics'], indent=2)}")
+
+    # Push to XCom
+    context['task_instance'].xcom_push(key='staging_results', value=staging_results)
+    context['task_instance'].xcom_push(key='production_results', value=production_results)
+    context['task_instance'].xcom_push(key='candidate_results', value=results)
+
+    return {
+        'staging_results': staging_results,
+        'production_results': production_results,
+        'candidate_results': results,
+    }
+
+
+def _bootstrap_significance(
+    model_results: Dict[str, Any],
+    production_results: Dict[str, Any],
+    test_data_info: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """
+    Paired bootstrap of a contender's improvements over production.
+
+    Returns None when per-sample predictions of either model are missing
+    (e.g. no production model).
+    """
+    if 'predictions_path' not in model_results or 'predictions_path' not in production_results:
+        return None
+
+    import numpy as np
+    from plugins.evaluation import load_test_set
+    from plugins.bootstrap import paired_bootstrap, DEFAULT_N_BOOT
+
+    _, y_test = load_test_set(
+        test_data_info['test_features_path'],
+        test_data_info['test_labels_path']
     )
 
-    # Compare models
-    comparison = compare_models(
-        staging_results['metrics'],
-        production_results['metrics'],
-        PERFORMANCE_THRESHOLDS
+    return paired_bootstrap(
+        y_test,
+        np.load(model_results['predictions_path']),
+        np.load(production_results['predictions_path']),
+        n_boot=int(Variable.get('evaluation_bootstrap_resamples', default_var=DEFAULT_N_BOOT)),
     )
 
-    # Add context
-    comparison_results = {
-        'staging_metrics': staging_results['metrics'],
-        'production_metrics': production_results['metrics'],
-        'improvements': comparison['improvements'],
-        'should_promote': comparison['should_promote'],
-        'promotion_reasons': comparison['reasons'],
-        'comparison_timestamp': datetime.now().isoformat(),
+
+def _sliced_evaluation(
+    model_results: Dict[str, Dict[str, Any]],
+    test_data_info: Dict[str, Any]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Metrics by RUL band, bearing and equipment type for each model with
+    saved predictions.
+    """
+    import numpy as np
+    from plugins.evaluation import load_test_set
+    from plugins.sliced_metrics import compute_sliced_metrics
+
+    _, y_test = load_test_set(
+        test_data_info['test_features_path'],
+        test_data_info['test_labels_path']
+    )
+
+    dimensions = {
+        name: np.load(test_data_info[key], allow_pickle=True)
+        for name, key in (('bearing', 'test_groups_path'), ('equipment_type', 'test_equipment_types_path'))
+        if key in test_data_info
+    }
+
+    return {
+        model_name: compute_sliced_metrics(y_test, np.load(results['predictions_path']), dimensions)
+        for model_name, results in model_results.items()
+        if 'predictions_path' in results
     }
 
+
+def _benchmark_cards(
+    contenders: Dict[str, Dict[str, Any]],
+    production_results: Dict[str, Any],
+    test_data_info: Dict[str, Any]
+) -> Tuple[Dict[str, Optional[Dict[str, Any]]], Optional[Dict[str, Any]]]:
+    """
+    Benchmark cards of the contenders and the production model.
+
+    Cards recorded at registration are used when all were measured on the
+    same hardware; otherwise every model is benchmarked now, side by side.
+
+    Returns:
+        Card per contender name (None if benchmarking failed) and the
+        production model's card
+    """
+    from plugins.model_benchmark import benchmark_card, load_benchmark_card, cards_comparable
+
+    production_path = production_results.get('model_path')
+
+    cards = {name: load_benchmark_card(results['model_path']) for name, results in contenders.items()}
+    baseline = load_benchmark_card(production_path) if production_path else None
+
+    if all(card is not None for card in cards.values()) and (
+        production_path is None or all(cards_comparable(card, baseline) for card in cards.values())
+    ):
+        return cards, baseline
+
+    print("Benchmarking models for the latency comparison...")
+
+    try:
+        cards = {
+            name: benchmark_card(results['model_path'], test_data_info['test_features_path'])
+            for name, results in contenders.items()
+        }
+        if production_path:
+            baseline = benchmark_card(production_path, test_data_info['test_features_path'])
+    except Exception as e:
+        print(f"Error benchmarking models, latency not compared: {str(e)}")
+        return {name: None for name in contenders}, None
+
+    return cards, baseline
+
+
+def compare_model_performance(**context) -> Dict[str, Any]:
+    """
+    Rank the staging and candidate models and compare the winner with the
+    production model.
+    """
+    print("Comparing model performance...")
+
+    # Skips the comparison when no new model was found
+    evaluation_models = _evaluation_models(context)
+
+    screening_results = context['task_instance'].xcom_pull(
+        task_ids='screen_staging_model',
+        key='screening_results'
+    )
+    all_screened_out = bool(screening_results) and screening_results.get('decision') == 'reject'
+
+    # Subsample metrics of the contenders rejected at screening
+    screened_out = _screened_out(context)
+    screening_metrics = {
+        model_name: results['candidate_metrics']
+        for model_name, results in screening_results.get('contenders', {}).items()
+        if model_name in screened_out
+    } if screening_results else {}
+
+    # Candidates beyond staging are only scored by the co-scheduled evaluation
+    candidate_results = context['task_instance'].xcom_pull(
+        task_ids=STAGING_RESULTS_TASK,
+        key='candidate_results'
+    ) if CO_SCHEDULED_EVALUATION else None
+
+    if all_screened_out:
+        # Stage 1 decided (every contender rejected): compare the staging
+        # model on the screening subsample
+        staging_screening = screening_results['contenders']['staging_model']
+        comparison_results = {
+            'staging_metrics': staging_screening['candidate_metrics'],
+            'production_metrics': staging_screening['baseline_metrics'],
+            'improvements': {
+                'mae_improvement_pct': round(staging_screening['mae_improvement_pct']['estimate'], 2),
+                'rmse_improvement_pct': round(staging_screening['rmse_improvement_pct']['estimate'], 2),
+            },
+            'should_promote': False,
+            'promotion_reasons': screening_results['reasons'],
+            'contender_metrics': screening_metrics,
+            'decision_stage': 'screening',
+            'screening_results': screening_results,
+            'comparison_timestamp': datetime.now().isoformat(),
+        }
+
+    else:
+        # Pull evaluation results
+        production_results = context['task_instance'].xcom_pull(
+            task_ids=PRODUCTION_RESULTS_TASK,
+            key='production_results'
+        )
+
+        test_data_info = context['task_instance'].xcom_pull(
+            task_ids='load_test_data',
+            key='test_data_info'
+        )
+
+        # Contenders rejected at screening were not fully evaluated
+        contenders = dict(candidate_results or {})
+        staging_results = context['task_instance'].xcom_pull(
+            task_ids=STAGING_RESULTS_TASK,
+            key='staging_results'
+        )
+        if staging_results is not None:
+            contenders['staging_model'] = staging_results
+
+        if production_results is None or not contenders:
+            raise AirflowSkipException("No fully evaluated models to compare")
+
+        # Tournament: rank all contenders with the promotion thresholds,
+        # requiring significant MAE/RMSE improvements and p99 latency within
+        # the budget, so the winner is the best model that can be promoted
+        benchmarks, baseline_benchmark = _benchmark_cards(
+            contenders, production_results, test_data_info
+        )
+        ranking = rank_models(
+            {name: results['metrics'] for name, results in contenders.items()},
+            production_results['metrics'],
+            PERFORMANCE_THRESHOLDS,
+            bootstrap_results={
+                name: _bootstrap_significance(results, production_results, test_data_info)
+                for name, results in contenders.items()
+            },
+            benchmarks=benchmarks,
+            baseline_benchmark=baseline_benchmark
+        )
+        comparison = ranking[0]
+        winner_name = comparison['model_name']
+        winner_results = contenders[winner_name]
+
+        print(f"Tournament winner: {winner_name} (of {len(ranking)} models)")
+
+        # Add context
+        comparison_results = {
+            'staging_metrics': winner_results['metrics'],
+            'production_metrics': production_results['metrics'],
+            'improvements': comparison['improvements'],
+            'should_promote': comparison['should_promote'],
+            'promotion_reasons': comparison['reasons'],
+            'significance': comparison['significance'],
+            'latency': comparison['latency'],
+            'benchmark_cards': {
+                winner_name: benchmarks[winner_name],
+                'production_model': baseline_benchmark,
+            },
+            'sliced_metrics': _sliced_evaluation(
+                {winner_name: winner_results, 'production_model': production_results},
+                test_data_info
+            ),
+            'winner': {
+                'model_name': winner_name,
+                'model_version': evaluation_models['contenders'][winner_name]['model_version'],
+                'model_path': winner_results['model_path'],
+                'model_dir': os.path.dirname(winner_results['model_path']),
+            },
+            'tournament': ranking,
+            'contender_metrics': {
+                **screening_metrics,
+                **{name: results['metrics'] for name, results in contenders.items()},
+            },
+            'decision_stage': 'full_evaluation',
+            'screening_results': screening_results,
+            'comparison_timestamp': datetime.now().isoformat(),
+        }
+
     print(f"Comparison results: {json.dumps(comparison_results, indent=2)}")
 
     # Generate comparison report
@@ -327,6 +922,68 @@ def compare_model_performance(**context) -> Dict[str, Any]:
     return comparison_results
 
 
+def compute_feature_importance(**context) -> Dict[str, Any]:
+    """
+    Compute permutation feature importance of the tournament winner and
+    record it in the feature_importance table.
+    """
+    print("Computing permutation feature importance...")
+
+    from plugins.artifact_checksum import file_content_hash
+    from plugins.feature_importance import (
+        permutation_importance,
+        record_feature_importance,
+        DEFAULT_IMPORTANCE_SAMPLES,
+        DEFAULT_N_REPEATS,
+    )
+
+    comparison_results = context['task_instance'].xcom_pull(
+        task_ids='compare_models',
+        key='comparison_results'
+    )
+
+    winner = comparison_results.get('winner')
+    if not winner:
+        raise AirflowSkipException("No fully evaluated model (rejected at screening stage)")
+
+    test_data_info = context['task_instance'].xcom_pull(
+        task_ids='load_test_data',
+        key='test_data_info'
+    )
+
+    # Optional feature column names written next to the test set
+    feature_names = None
+    feature_names_path = os.path.join(TEST_DATA_DIR, 'feature_names.json')
+    if os.path.exists(feature_names_path):
+        with open(feature_names_path) as f:
+            feature_names = json.load(f)
+
+    importance_results = permutation_importance(
+        winner['model_path'],
+        test_data_info['test_features_path'],
+        test_data_info['test_labels_path'],
+        feature_names=feature_names,
+        n_samples=int(Variable.get('evaluation_importance_samples', default_var=DEFAULT_IMPORTANCE_SAMPLES)),
+        n_repeats=int(Variable.get('evaluation_importance_repeats', default_var=DEFAULT_N_REPEATS)),
+    )
+
+    # Models are identified by a prefix of their content hash
+    model_version = model_version_for(file_content_hash(winner['model_path']))
+    importance_results['model_version'] = model_version
+    importance_results['model_name'] = winner['model_name']
+
+    record_feature_importance(importance_results, model_version)
+
+    print(f"Top features: {json.dumps(importance_results['importances'][:10], indent=2)}")
+
+    context['task_instance'].xcom_push(
+        key='feature_importance',
+        value=importance_results
+    )
+
+    return importance_results
+
+
 def decide_promotion(**context) -> str:
     """
     Decide whether to promote the model automatically or require approval.
@@ -341,30 +998,47 @@ def decide_promotion(**context) -> str:
 
     should_promote = comparison_results['should_promote']
     improvements = comparison_results['improvements']
+    decision_stage = comparison_results.get('decision_stage', 'full_evaluation')
 
-    # Check if significant improvements
-    significant_improvement = (
-        improvements.get('mae_improvement_pct', 0) > 10 or
-        improvements.get('rmse_improvement_pct', 0) > 10
-    )
+    significance = comparison_results.get('significance')
+
+    # Check if significant improvements (lower confidence bounds when bootstrapped)
+    if significance:
+        significant_improvement = (
+            significance['mae_improvement_pct']['lower'] > 10 or
+            significance['rmse_improvement_pct']['lower'] > 10
+        )
+    else:
+        significant_improvement = (
+            improvements.get('mae_improvement_pct', 0) > 10 or
+            improvements.get('rmse_improvement_pct', 0) > 10
+        )
 
     print(f"Should promote: {should_promote}")
     print(f"Significant improvement: {significant_improvement}")
+    print(f"Decision stage: {decision_stage}")
 
     if should_promote and significant_improvement:
         print("Model meets criteria for automatic promotion")
-        return 'promote_model_automatically'
+        branch = 'promote_model_automatically'
     elif should_promote:
         print("Model improvements marginal, requiring manual approval")
-        return 'request_manual_approval'
+        branch = 'request_manual_approval'
     else:
         print("Model does not meet promotion criteria")
-        return 'reject_promotion'
+        branch = 'reject_promotion'
+
+    context['task_instance'].xcom_push(
+        key='promotion_decision',
+        value={'branch': branch, 'decision_stage': decision_stage}
+    )
+
+    return branch
 
 
 def promote_model_automatically(**context) -> Dict[str, Any]:
     """
-    Automatically promote staging model to production.
+    Automatically promote the tournament winner to production.
     """
     print("Promoting model to production...")
 
@@ -374,20 +1048,33 @@ def promote_model_automatically(**context) -> Dict[str, Any]:
         key='comparison_results'
     )
 
-    # Promote model
+    winner = comparison_results.get('winner', {})
+    print(f"Promoting {winner.get('model_name', 'staging_model')}")
+
+    # Promote only the evaluated model, not one trained into its directory since
+    if winner.get('model_version'):
+        current_version = model_version_for(artifact_checksum(winner['model_path'])['digest'])
+        if current_version != winner['model_version']:
+            raise AirflowException(
+                f"{winner['model_path']} changed since evaluation "
+                f"({winner['model_version']} evaluated, {current_version} found)"
+            )
+
+    # Promote model (the registry records it as the production model)
     promotion_result = promote_model(
-        source_dir=STAGING_MODEL_DIR,
+        source_dir=winner.get('model_dir', STAGING_MODEL_DIR),
         target_dir=PRODUCTION_MODEL_DIR,
         backup=True,
         update_metadata=True,
-        comparison_results=comparison_results
+        comparison_results=comparison_results,
+        registry=ModelRegistry()
     )
 
     print(f"Model promoted successfully: {promotion_result}")
 
     # Send notification
     send_slack_notification(
-        message=f"New model automatically promoted to production!\n"
+        message=f"New model ({winner.get('model_name', 'staging_model')}) automatically promoted to production!\n"
                 f"MAE improvement: {comparison_results['improvements'].get('mae_improvement_pct', 0):.2f}%\n"
                 f"RMSE improvement: {comparison_results['improvements'].get('rmse_improvement_pct', 0):.2f}%"
     )
@@ -446,6 +1133,7 @@ def reject_promotion(**context) -> Dict[str, Any]:
     rejection_info = {
         'status': 'rejected',
         'rejected_at': datetime.now().isoformat(),
+        'decision_stage': comparison_results.get('decision_stage', 'full_evaluation'),
         'reasons': [
             reason for reason in comparison_results.get('promotion_reasons', [])
             if 'does not meet' in reason.lower() or 'worse' in reason.lower()
@@ -489,6 +1177,19 @@ def log_evaluation_results(**context) -> None:
     with open(history_file, 'a') as f:
         f.write(json.dumps(evaluation_record) + '\n')
 
+    # Record the evaluation of every scored registry candidate
+    evaluation_models = context['task_instance'].xcom_pull(
+        task_ids='check_new_model',
+        key='evaluation_models'
+    )
+    decision = context['task_instance'].xcom_pull(
+        task_ids='decide_promotion',
+        key='promotion_decision'
+    ) or {}
+
+    if evaluation_models and evaluation_models['source'] == 'registry' and comparison_results:
+        _record_contender_evaluations(evaluation_models['contenders'], comparison_results, decision)
+
     # Update last evaluation timestamp
     last_eval_file = os.path.join(EVALUATION_DIR, 'last_evaluation.json')
     with open(last_eval_file, 'w') as f:
@@ -497,6 +1198,39 @@ def log_evaluation_results(**context) -> None:
     print(f"Evaluation results logged to: {history_file}")
 
 
+def _record_contender_evaluations(
+    contenders: Dict[str, Dict[str, Any]],
+    comparison_results: Dict[str, Any],
+    decision: Dict[str, Any]
+) -> None:
+    """
+    Mark each scored contender as evaluated or rejected in the model
+    registry, with its own metrics.
+
+    The tournament winner is rejected if promotion was rejected; the other
+    contenders are rejected if they were screened out or don't meet the
+    promotion thresholds.
+    """
+    registry = ModelRegistry()
+    winner_name = (comparison_results.get('winner') or {}).get('model_name')
+    ranking = {entry['model_name']: entry for entry in comparison_results.get('tournament') or []}
+
+    for model_name, metrics in (comparison_results.get('contender_metrics') or {}).items():
+        if model_name == winner_name:
+            rejected = decision.get('branch') == 'reject_promotion'
+        else:
+            rejected = model_name not in ranking or not ranking[model_name]['should_promote']
+
+        try:
+            registry.mark_evaluated(
+                contenders[model_name]['model_version'],
+                metrics=metrics,
+                status='rejected' if rejected else 'evaluated'
+            )
+        except Exception as e:
+            print(f"Error updating model registry for {model_name}: {str(e)}")
+
+
 # Create the DAG
 dag = DAG(
     'model_evaluation_dag',
@@ -524,59 +1258,83 @@ with dag:
         provide_context=True,
     )
 
-    # Task Group 3: Model Evaluation
-    with TaskGroup(group_id='evaluation_group') as evaluation_group:
-
-        evaluate_staging = PythonOperator(
-            task_id='evaluate_staging_model',
-            python_callable=evaluate_staging_model,
-            provide_context=True,
-        )
-
-        evaluate_production = PythonOperator(
-            task_id='evaluate_production_model',
-            python_callable=evaluate_production_model,
-            provide_context=True,
-        )
+    # Task 3: Screen staging model on a stratified subsample
+    task_screen_model = PythonOperator(
+        task_id='screen_staging_model',
+        python_callable=screen_staging_model,
+        provide_context=True,
+    )
 
-        [evaluate_staging, evaluate_production]
+    # Task Group 4: Model Evaluation
+    with TaskGroup(group_id='evaluation_group') as evaluation_group:
 
-    # Task 4: Compare models
+        if CO_SCHEDULED_EVALUATION:
+            evaluate_all = PythonOperator(
+                task_id='evaluate_all_models',
+                python_callable=evaluate_all_models,
+                provide_context=True,
+            )
+
+        else:
+            evaluate_staging = PythonOperator(
+                task_id='evaluate_staging_model',
+                python_callable=evaluate_staging_model,
+                provide_context=True,
+            )
+
+            evaluate_production = PythonOperator(
+                task_id='evaluate_production_model',
+                python_callable=evaluate_production_model,
+                provide_context=True,
+            )
+
+            [evaluate_staging, evaluate_production]
+
+    # Task 5: Compare models (also runs when full evaluation was skipped)
     task_compare_models = PythonOperator(
         task_id='compare_models',
         python_callable=compare_model_performance,
         provide_context=True,
+        trigger_rule=TriggerRule.NONE_FAILED,
+    )
+
+    # Task 5b: Feature importance of the tournament winner
+    task_feature_importance = PythonOperator(
+        task_id='compute_feature_importance',
+        python_callable=compute_feature_importance,
+        provide_context=True,
+        execution_timeout=timedelta(minutes=30),
     )
 
-    # Task 5: Decide on promotion
+    # Task 6: Decide on promotion
     task_decide_promotion = BranchPythonOperator(
         task_id='decide_promotion',
         python_callable=decide_promotion,
         provide_context=True,
     )
 
-    # Task 6a: Automatic promotion
+    # Task 7a: Automatic promotion
     task_promote_auto = PythonOperator(
         task_id='promote_model_automatically',
         python_callable=promote_model_automatically,
         provide_context=True,
     )
 
-    # Task 6b: Manual approval
+    # Task 7b: Manual approval
     task_request_approval = PythonOperator(
         task_id='request_manual_approval',
         python_callable=request_manual_approval,
         provide_context=True,
     )
 
-    # Task 6c: Reject promotion
+    # Task 7c: Reject promotion
     task_reject_promotion = PythonOperator(
         task_id='reject_promotion',
         python_callable=reject_promotion,
         provide_context=True,
     )
 
-    # Task 7: Log results
+    # Task 8: Log results
     task_log_results = PythonOperator(
         task_id='log_evaluation_results',
         python_callable=log_evaluation_results,
@@ -584,7 +1342,7 @@ with dag:
         trigger_rule=TriggerRule.ALL_DONE,
     )
 
-    # Task 8: Send notification
+    # Task 9: Send notification
     task_send_notification = EmailOperator(
         task_id='send_notification',
         to=[ALERT_EMAIL],
@@ -599,9 +1357,11 @@ with dag:
 
     # Define task dependencies
     task_check_model >> task_load_test_data
-    task_load_test_data >> evaluation_group
+    task_load_test_data >> task_screen_model
+    task_screen_model >> evaluation_group
     evaluation_group >> task_compare_models
     task_compare_models >> task_decide_promotion
+    task_compare_models >> task_feature_importance
     task_decide_promotion >> [task_promote_auto, task_request_approval, task_reject_promotion]
     [task_promote_auto, task_request_approval, task_reject_promotion] >> task_log_results
     task_log_results >> task_send_notification
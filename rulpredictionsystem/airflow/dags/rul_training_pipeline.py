@@ -35,6 +35,9 @@ from operators.custom_operators import (
     PreprocessingOperator,
     FeatureExtractionOperator,
     ModelTrainingOperator,
+    ModelQuantizationOperator,
+    ModelOnnxExportOperator,
+    ModelDistillationOperator,
     ModelEvaluationOperator,
     ModelDeploymentOperator
 )
@@ -44,6 +47,7 @@ from plugins.model_utils import (
     check_disk_space,
     backup_previous_model
 )
+from plugins.artifact_store import collect_artifact_garbage
 
 # Configuration
 PROJECT_ROOT = os.getenv(
@@ -200,7 +204,7 @@ def prepare_training_config(**context) -> Dict[str, Any]:
     # Training configuration
     config = {
         'batch_size': batch_size,
-        'epochs': Variable.get('training_epochs', default_var=100),
+        'epochs': int(Variable.get('training_epochs', default_var=100)),
         'learning_rate': float(Variable.get('learning_rate', default_var=0.001)),
         'early_stopping_patience': 10,
         'model_architecture': 'cnn_lstm',
@@ -212,6 +216,14 @@ def prepare_training_config(**context) -> Dict[str, Any]:
         'random_seed': 42,
         'validation_split': 0.2,
         'test_split': 0.1,
+        # Bearing-grouped cross-validation (0 disables it)
+        'cv_folds': int(Variable.get('training_cv_folds', default_var=0)),
+        'cv_workers': None,
+        # Data-parallel training (0 or 1 keeps the single-process path)
+        'ddp_processes': int(Variable.get('training_ddp_processes', default_var=0)),
+        'ddp_nnodes': int(Variable.get('training_ddp_nnodes', default_var=1)),
+        'ddp_master_addr': Variable.get('training_ddp_master_addr', default_var='127.0.0.1'),
+        'ddp_master_port': 29500,
     }
 
     print(f"Training configuration: {config}")
@@ -249,6 +261,21 @@ def generate_training_report(**context) -> Dict[str, Any]:
         key='return_value'
     )
 
+    quantization_results = context['task_instance'].xcom_pull(
+        task_ids='model_training_group.quantize_model',
+        key='return_value'
+    )
+
+    distillation_results = context['task_instance'].xcom_pull(
+        task_ids='model_training_group.distill_student',
+        key='return_value'
+    )
+
+    onnx_export_results = context['task_instance'].xcom_pull(
+        task_ids='model_training_group.export_onnx',
+        key='return_value'
+    )
+
     evaluation_results = context['task_instance'].xcom_pull(
         task_ids='model_evaluation_group.evaluate_model',
         key='return_value'
@@ -265,6 +292,9 @@ def generate_training_report(**context) -> Dict[str, Any]:
         'preprocessing': preprocessing_results,
         'features': feature_results,
         'training': training_results,
+        'quantization': quantization_results,
+        'distillation': distillation_results,
+        'onnx_export': onnx_export_results,
         'evaluation': evaluation_results,
         'timestamp': datetime.now().isoformat(),
     }
@@ -416,6 +446,38 @@ with dag:
             on_failure_callback=task_failure_callback,
         )
 
+        quantize_model = ModelQuantizationOperator(
+            task_id='quantize_model',
+            features_dir=FEATURES_DIR,
+            models_dir=MODELS_DIR,
+            quantization_config={
+                'calibration_samples': 2048,
+                'mae_tolerance': 0.02,
+                'rmse_tolerance': 0.02,
+            },
+            on_failure_callback=task_failure_callback,
+        )
+
+        export_onnx = ModelOnnxExportOperator(
+            task_id='export_onnx',
+            features_dir=FEATURES_DIR,
+            models_dir=MODELS_DIR,
+            onnx_config={
+                'opset_version': 17,
+                'optimization_level': 'extended',
+                'max_abs_diff': 0.01,
+            },
+            on_failure_callback=task_failure_callback,
+        )
+
+        distill_student = ModelDistillationOperator(
+            task_id='distill_student',
+            features_dir=FEATURES_DIR,
+            models_dir=MODELS_DIR,
+            training_config="{{ task_instance.xcom_pull(task_ids='prepare_training_config', key='training_config') }}",
+            on_failure_callback=task_failure_callback,
+        )
+
         validate_training = PythonOperator(
             task_id='validate_training',
             python_callable=lambda **kwargs: {
@@ -425,7 +487,7 @@ with dag:
             on_failure_callback=task_failure_callback,
         )
 
-        backup_model >> train_model >> validate_training
+        backup_model >> train_model >> [quantize_model, export_onnx, distill_student] >> validate_training
 
     # Task Group 7: Model Evaluation
     with TaskGroup(group_id='model_evaluation_group') as model_evaluation_group:
@@ -493,6 +555,15 @@ with dag:
         on_failure_callback=task_failure_callback,
     )
 
+    # Task 10b: Remove expired backups and unreferenced model artifacts
+    task_collect_garbage = PythonOperator(
+        task_id='collect_artifact_garbage',
+        python_callable=collect_artifact_garbage,
+        op_kwargs={'models_dir': MODELS_DIR, 'keep_last': 10, 'max_age_days': 30},
+        trigger_rule=TriggerRule.ALL_DONE,
+        on_failure_callback=task_failure_callback,
+    )
+
     # Task 11: Send success notification
     task_success_notification = EmailOperator(
         task_id='send_success_notification',
@@ -518,7 +589,8 @@ with dag:
     model_evaluation_group >> model_deployment_group
     model_deployment_group >> task_generate_report
     task_generate_report >> task_cleanup
-    task_cleanup >> task_success_notification
+    task_cleanup >> task_collect_garbage
+    task_collect_garbage >> task_success_notification
 
 
 if __name__ == '__main__':
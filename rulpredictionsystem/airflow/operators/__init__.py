@@ -9,6 +9,9 @@ from .custom_operators import (
     PreprocessingOperator,
     FeatureExtractionOperator,
     ModelTrainingOperator,
+    ModelQuantizationOperator,
+    ModelOnnxExportOperator,
+    ModelDistillationOperator,
     ModelEvaluationOperator,
     ModelDeploymentOperator,
 )
@@ -18,6 +21,9 @@ __all__ = [
     'PreprocessingOperator',
     'FeatureExtractionOperator',
     'ModelTrainingOperator',
+    'ModelQuantizationOperator',
+    'ModelOnnxExportOperator',
+    'ModelDistillationOperator',
     'ModelEvaluationOperator',
     'ModelDeploymentOperator',
 ]
@@ -6,6 +6,9 @@ This module contains custom operators for:
 - Data preprocessing
 - Feature extraction
 - Model training
+- Post-training quantization
+- ONNX export
+- Knowledge distillation
 - Model evaluation
 - Model deployment
 
@@ -16,15 +19,18 @@ Version: 1.0.0
 import os
 import json
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
 from datetime import datetime
 
 from airflow.models import BaseOperator
 from airflow.exceptions import AirflowException
 from airflow.utils.decorators import apply_defaults
 
-import numpy as np
-import pandas as pd
+# numpy and pandas are imported where they are used, so that parsing the
+# DAG files that import these operators does not load them
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
 
 
 logger = logging.getLogger(__name__)
@@ -59,6 +65,9 @@ class DataValidationOperator(BaseOperator):
         """
         Execute data validation.
         """
+        import numpy as np
+        import pandas as pd
+
         logger.info(f"Starting data validation in {self.raw_data_dir}")
 
         # Ensure data directory exists
@@ -136,7 +145,7 @@ class DataValidationOperator(BaseOperator):
 
     def _validate_data(
         self,
-        data: pd.DataFrame,
+        data: 'pd.DataFrame',
         file_name: str,
         validation_results: Dict[str, Any]
     ) -> bool:
@@ -207,6 +216,9 @@ class PreprocessingOperator(BaseOperator):
         """
         Execute data preprocessing.
         """
+        import numpy as np
+        import pandas as pd
+
         logger.info(f"Starting data preprocessing")
 
         # Ensure output directory exists
@@ -269,9 +281,9 @@ class PreprocessingOperator(BaseOperator):
 
     def _preprocess_data(
         self,
-        data: pd.DataFrame,
+        data: 'pd.DataFrame',
         results: Dict[str, Any]
-    ) -> pd.DataFrame:
+    ) -> 'pd.DataFrame':
         """
         Apply preprocessing steps to data.
         """
@@ -292,8 +304,8 @@ class PreprocessingOperator(BaseOperator):
 
     def _remove_outliers(
         self,
-        data: pd.DataFrame
-    ) -> tuple[pd.DataFrame, int]:
+        data: 'pd.DataFrame'
+    ) -> 'tuple[pd.DataFrame, int]':
         """
         Remove outliers using IQR method.
         """
@@ -315,7 +327,7 @@ class PreprocessingOperator(BaseOperator):
 
         return data, n_outliers
 
-    def _handle_missing_values(self, data: pd.DataFrame) -> pd.DataFrame:
+    def _handle_missing_values(self, data: 'pd.DataFrame') -> 'pd.DataFrame':
         """
         Handle missing values in data.
         """
@@ -333,10 +345,11 @@ class PreprocessingOperator(BaseOperator):
 
         return data
 
-    def _normalize_data(self, data: pd.DataFrame) -> pd.DataFrame:
+    def _normalize_data(self, data: 'pd.DataFrame') -> 'pd.DataFrame':
         """
         Normalize data using min-max scaling.
         """
+        import numpy as np
         from sklearn.preprocessing import MinMaxScaler
 
         scaler = MinMaxScaler()
@@ -377,6 +390,9 @@ class FeatureExtractionOperator(BaseOperator):
         """
         Execute feature extraction.
         """
+        import numpy as np
+        import pandas as pd
+
         logger.info(f"Starting feature extraction")
 
         # Ensure output directory exists
@@ -401,6 +417,7 @@ class FeatureExtractionOperator(BaseOperator):
 
         all_features = []
         all_labels = []
+        all_groups = []
 
         # Extract features from each file
         for file_name in data_files:
@@ -408,13 +425,19 @@ class FeatureExtractionOperator(BaseOperator):
                 file_path = os.path.join(self.processed_data_dir, file_name)
                 data = pd.read_parquet(file_path)
 
-                # Extract features
-                features = self._extract_features(data)
+                # Extract features (the label must not leak into them)
+                features = self._extract_features(data.drop(columns=['rul'], errors='ignore'))
                 all_features.append(features)
 
-                # Extract labels if available
+                # One label per feature row: the RUL at the end of the file
                 if 'rul' in data.columns:
-                    all_labels.extend(data['rul'].values)
+                    all_labels.append(float(data['rul'].iloc[-1]))
+
+                # Bearing assignment, used for grouped validation splits
+                if 'bearing_id' in data.columns:
+                    all_groups.append(str(data['bearing_id'].iloc[0]))
+                else:
+                    all_groups.append(os.path.splitext(file_name)[0])
 
                 extraction_results['processed_files'] += 1
 
@@ -433,20 +456,33 @@ class FeatureExtractionOperator(BaseOperator):
                 features_array
             )
 
-            if all_labels:
+            if len(all_labels) == len(all_features):
                 np.save(
                     os.path.join(self.features_dir, 'labels.npy'),
                     np.array(all_labels)
                 )
+            elif all_labels:
+                logger.warning(
+                    f"Only {len(all_labels)} of {len(all_features)} files have RUL labels, "
+                    f"skipping labels.npy"
+                )
+
+            np.save(
+                os.path.join(self.features_dir, 'groups.npy'),
+                np.array(all_groups)
+            )
+            extraction_results['n_groups'] = len(set(all_groups))
 
         logger.info(f"Feature extraction completed: {extraction_results}")
 
         return extraction_results
 
-    def _extract_features(self, data: pd.DataFrame) -> np.ndarray:
+    def _extract_features(self, data: 'pd.DataFrame') -> 'np.ndarray':
         """
         Extract features from data.
         """
+        import numpy as np
+
         features = []
 
         # Time-domain features
@@ -463,10 +499,12 @@ class FeatureExtractionOperator(BaseOperator):
 
         return np.array(features)
 
-    def _extract_time_domain_features(self, data: pd.DataFrame) -> List[float]:
+    def _extract_time_domain_features(self, data: 'pd.DataFrame') -> List[float]:
         """
         Extract time-domain features.
         """
+        import numpy as np
+
         numeric_data = data.select_dtypes(include=[np.number])
 
         features = [
@@ -479,10 +517,12 @@ class FeatureExtractionOperator(BaseOperator):
 
         return features
 
-    def _extract_frequency_domain_features(self, data: pd.DataFrame) -> List[float]:
+    def _extract_frequency_domain_features(self, data: 'pd.DataFrame') -> List[float]:
         """
         Extract frequency-domain features using FFT.
         """
+        import numpy as np
+
         numeric_data = data.select_dtypes(include=[np.number])
 
         features = []
@@ -501,10 +541,12 @@ class FeatureExtractionOperator(BaseOperator):
 
         return features
 
-    def _extract_statistical_features(self, data: pd.DataFrame) -> List[float]:
+    def _extract_statistical_features(self, data: 'pd.DataFrame') -> List[float]:
         """
         Extract statistical features.
         """
+        import numpy as np
+
         numeric_data = data.select_dtypes(include=[np.number])
 
         features = [
@@ -547,55 +589,326 @@ class ModelTrainingOperator(BaseOperator):
         if isinstance(self.training_config, str):
             self.training_config = json.loads(self.training_config)
 
-        # Load features and labels
+        from plugins.model_utils import save_model, record_training_run
+        from plugins.model_registry import ModelRegistry
+        from plugins.model_benchmark import benchmark_card, record_benchmark_card
+        from plugins.training_profiler import TrainingProfiler
+        from plugins.training_utils import (
+            load_feature_store,
+            grouped_train_val_split,
+            grouped_cross_validate,
+            train_rul_model,
+        )
+
+        # Memory-map features, labels and bearing groups
         features_path = os.path.join(self.features_dir, 'features.npy')
-        labels_path = os.path.join(self.features_dir, 'labels.npy')
 
         if not os.path.exists(features_path):
             raise AirflowException(f"Features not found: {features_path}")
 
-        X = np.load(features_path)
-        y = np.load(labels_path) if os.path.exists(labels_path) else None
+        try:
+            X, y, groups = load_feature_store(self.features_dir, mmap_mode='r')
+        except (FileNotFoundError, ValueError) as e:
+            raise AirflowException(str(e))
 
         logger.info(f"Loaded features: X shape={X.shape}")
 
-        # Split data
-        from sklearn.model_selection import train_test_split
+        training_results = {
+            'model_type': 'cnn_lstm',
+            'n_features': X.shape[-1] if len(X.shape) > 1 else 1,
+        }
+
+        # Grouped cross-validation mode
+        cv_folds = int(self.training_config.get('cv_folds', 0))
 
-        X_train, X_val, y_train, y_val = train_test_split(
-            X, y,
-            test_size=self.training_config.get('validation_split', 0.2),
-            random_state=self.training_config.get('random_seed', 42)
+        if cv_folds > 1:
+            logger.info(f"Running grouped cross-validation with {cv_folds} folds")
+            try:
+                training_results['cross_validation'] = grouped_cross_validate(
+                    self.features_dir,
+                    self.training_config,
+                    n_folds=cv_folds,
+                    n_workers=self.training_config.get('cv_workers'),
+                )
+            except ValueError as e:
+                raise AirflowException(f"Cross-validation failed: {str(e)}")
+
+        # Split data, keeping each bearing on one side of the split
+        train_idx, val_idx = grouped_train_val_split(
+            len(X),
+            groups,
+            validation_split=self.training_config.get('validation_split', 0.2),
+            random_seed=self.training_config.get('random_seed', 42)
         )
 
-        # Build and train model (simplified for demonstration)
         logger.info("Training model...")
 
-        # This is a placeholder - in production, you would use actual model training
-        training_results = {
-            'model_type': 'cnn_lstm',
-            'n_train_samples': len(X_train),
-            'n_val_samples': len(X_val),
-            'n_features': X.shape[1] if len(X.shape) > 1 else 1,
-            'epochs_completed': self.training_config.get('epochs', 100),
-            'final_train_loss': 0.15,
-            'final_val_loss': 0.18,
-            'training_time_seconds': 1200,
+        profiler = TrainingProfiler()
+        start_time = datetime.now()
+
+        if int(self.training_config.get('ddp_processes') or 0) > 1:
+            from plugins.distributed_training import train_distributed
+
+            model, history = train_distributed(
+                self.features_dir, train_idx, val_idx, self.training_config,
+                profiler=profiler
+            )
+        else:
+            model, history = train_rul_model(
+                X, y, train_idx, val_idx, self.training_config,
+                profiler=profiler
+            )
+
+        end_time = datetime.now()
+
+        training_results.update({
+            'n_train_samples': len(train_idx),
+            'n_val_samples': len(val_idx),
+            **history,
             'timestamp': datetime.now().isoformat(),
-        }
+        })
 
-        # Save model (placeholder)
-        model_path = os.path.join(self.models_dir, 'staging', 'model.h5')
-        os.makedirs(os.path.dirname(model_path), exist_ok=True)
+        # Save model
+        model_path = os.path.join(self.models_dir, 'staging', 'model.pt')
+        save_model(model, model_path, metadata=training_results)
+        training_results['model_path'] = model_path
 
-        # In production, save actual trained model
         logger.info(f"Model saved to: {model_path}")
 
+        # Save the step profile next to the model and record the run
+        profile = profiler.to_dict()
+        training_results['profile_path'] = profiler.save(
+            os.path.join(os.path.dirname(model_path), 'training_profile.json')
+        )
+        training_results['profile_summary'] = profile['summary']
+
+        record_training_run(
+            run_id=context['run_id'],
+            start_time=start_time,
+            end_time=end_time,
+            training_results=training_results,
+            profile=profile,
+        )
+
+        # Benchmark card: latency, load time, peak RSS and size of the artifact
+        card = None
+        try:
+            card = benchmark_card(model_path, features_path)
+            record_benchmark_card(model_path, card)
+            training_results['benchmark_p99_ms'] = {
+                key: latency['p99_ms'] for key, latency in card['latency'].items()
+            }
+        except Exception as e:
+            logger.error(f"Error benchmarking model: {str(e)}")
+
+        # Register the model as a candidate for the evaluation DAG
+        try:
+            registered = ModelRegistry().register_model(
+                model_path,
+                metrics={
+                    'final_train_loss': training_results.get('final_train_loss'),
+                    'final_val_loss': training_results.get('final_val_loss'),
+                    'n_features': training_results['n_features'],
+                },
+                algorithm=training_results['model_type'],
+                hyperparameters=self.training_config,
+                run_id=context['run_id'],
+                training_date=end_time,
+                benchmark=card,
+            )
+            training_results['model_version'] = registered['model_version']
+        except Exception as e:
+            logger.error(f"Error registering model: {str(e)}")
+
         logger.info(f"Training completed: {training_results}")
 
         return training_results
 
 
+class ModelQuantizationOperator(BaseOperator):
+    """
+    Operator to produce an int8 variant of the trained staging model.
+
+    The int8 model is saved next to the float model only when its MAE and
+    RMSE on a feature store sample stay within the configured tolerance.
+    """
+
+    template_fields = ['features_dir', 'models_dir']
+
+    @apply_defaults
+    def __init__(
+        self,
+        features_dir: str,
+        models_dir: str,
+        quantization_config: Optional[Dict[str, Any]] = None,
+        *args,
+        **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self.features_dir = features_dir
+        self.models_dir = models_dir
+        self.quantization_config = quantization_config or {}
+
+    def execute(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute post-training quantization.
+        """
+        logger.info(f"Starting post-training quantization")
+
+        from plugins.quantization import quantize_and_validate
+
+        staging_dir = os.path.join(self.models_dir, 'staging')
+        model_path = os.path.join(staging_dir, 'model.pt')
+
+        if not os.path.exists(model_path):
+            raise AirflowException(f"Trained model not found: {model_path}")
+
+        try:
+            quantization_results = quantize_and_validate(
+                model_path,
+                self.features_dir,
+                os.path.join(staging_dir, 'model_int8.pt'),
+                quantization_config=self.quantization_config,
+            )
+        except (FileNotFoundError, ValueError) as e:
+            raise AirflowException(f"Quantization failed: {str(e)}")
+
+        quantization_results['timestamp'] = datetime.now().isoformat()
+
+        # Keep the quantization report with the staging model
+        with open(os.path.join(staging_dir, 'quantization_results.json'), 'w') as f:
+            json.dump(quantization_results, f, indent=2)
+
+        logger.info(f"Quantization completed: {quantization_results}")
+
+        return quantization_results
+
+
+class ModelOnnxExportOperator(BaseOperator):
+    """
+    Operator to export the trained staging model to ONNX for CPU serving.
+
+    The optimized ONNX graph is saved next to the PyTorch model only when
+    its predictions on a feature store sample match the PyTorch model.
+    """
+
+    template_fields = ['features_dir', 'models_dir']
+
+    @apply_defaults
+    def __init__(
+        self,
+        features_dir: str,
+        models_dir: str,
+        onnx_config: Optional[Dict[str, Any]] = None,
+        *args,
+        **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self.features_dir = features_dir
+        self.models_dir = models_dir
+        self.onnx_config = onnx_config or {}
+
+    def execute(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute ONNX export.
+        """
+        logger.info(f"Starting ONNX export")
+
+        from plugins.onnx_export import export_and_validate
+
+        staging_dir = os.path.join(self.models_dir, 'staging')
+        model_path = os.path.join(staging_dir, 'model.pt')
+
+        if not os.path.exists(model_path):
+            raise AirflowException(f"Trained model not found: {model_path}")
+
+        try:
+            export_results = export_and_validate(
+                model_path,
+                self.features_dir,
+                os.path.join(staging_dir, 'model.onnx'),
+                onnx_config=self.onnx_config,
+            )
+        except (FileNotFoundError, ValueError) as e:
+            raise AirflowException(f"ONNX export failed: {str(e)}")
+
+        export_results['timestamp'] = datetime.now().isoformat()
+
+        # Keep the export report with the staging model
+        with open(os.path.join(staging_dir, 'onnx_export_results.json'), 'w') as f:
+            json.dump(export_results, f, indent=2)
+
+        logger.info(f"ONNX export completed: {export_results}")
+
+        return export_results
+
+
+class ModelDistillationOperator(BaseOperator):
+    """
+    Operator to distill a compact student model from the trained staging model.
+
+    The student is registered in the model registry with the version of
+    the teacher it was distilled from.
+    """
+
+    template_fields = ['features_dir', 'models_dir', 'training_config']
+
+    @apply_defaults
+    def __init__(
+        self,
+        features_dir: str,
+        models_dir: str,
+        training_config: Any,
+        *args,
+        **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self.features_dir = features_dir
+        self.models_dir = models_dir
+        self.training_config = training_config
+
+    def execute(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute knowledge distillation.
+        """
+        logger.info(f"Starting knowledge distillation")
+
+        # Parse training config if it's a string
+        if isinstance(self.training_config, str):
+            self.training_config = json.loads(self.training_config)
+
+        from plugins.distillation import distill_student, register_student
+
+        staging_dir = os.path.join(self.models_dir, 'staging')
+        teacher_path = os.path.join(staging_dir, 'model.pt')
+        student_path = os.path.join(staging_dir, 'student.pt')
+
+        if not os.path.exists(teacher_path):
+            raise AirflowException(f"Teacher model not found: {teacher_path}")
+
+        try:
+            distillation_results = distill_student(
+                teacher_path,
+                self.features_dir,
+                student_path,
+                self.training_config,
+            )
+        except (FileNotFoundError, ValueError) as e:
+            raise AirflowException(f"Distillation failed: {str(e)}")
+
+        distillation_results['timestamp'] = datetime.now().isoformat()
+
+        try:
+            registered = register_student(student_path, distillation_results)
+            distillation_results['student_model_version'] = registered['model_version']
+        except Exception as e:
+            logger.error(f"Error registering student model: {str(e)}")
+
+        logger.info(f"Distillation completed: {distillation_results}")
+
+        return distillation_results
+
+
 class ModelEvaluationOperator(BaseOperator):
     """
     Operator to evaluate trained model performance.
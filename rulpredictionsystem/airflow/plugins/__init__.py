@@ -2,34 +2,69 @@
 Airflow Plugins Package
 
 This package contains utility functions and plugins for the RUL prediction pipeline.
+
+Submodules are imported on first attribute access, so importing one module
+(e.g. from a DAG file) does not load the numerical and ML libraries used by
+the others.
 """
 
-from .model_utils import (
-    load_model,
-    save_model,
-    calculate_metrics,
-    compare_models,
-    promote_model,
-    backup_previous_model,
-    generate_evaluation_report,
-    cleanup_temp_files,
-    check_disk_space,
-    log_pipeline_metrics,
-    send_slack_notification,
-)
-
-__all__ = [
-    'load_model',
-    'save_model',
-    'calculate_metrics',
-    'compare_models',
-    'promote_model',
-    'backup_previous_model',
-    'generate_evaluation_report',
-    'cleanup_temp_files',
-    'check_disk_space',
-    'log_pipeline_metrics',
-    'send_slack_notification',
-]
+import importlib
+
+# Public name -> submodule defining it
+_EXPORTS = {
+    'load_model': 'model_utils',
+    'save_model': 'model_utils',
+    'find_model_file': 'model_utils',
+    'calculate_metrics': 'model_utils',
+    'compare_models': 'model_utils',
+    'rank_models': 'model_utils',
+    'promote_model': 'model_utils',
+    'rollback_model': 'model_utils',
+    'backup_previous_model': 'model_utils',
+    'generate_evaluation_report': 'model_utils',
+    'cleanup_temp_files': 'model_utils',
+    'check_disk_space': 'model_utils',
+    'log_pipeline_metrics': 'model_utils',
+    'record_training_run': 'model_utils',
+    'send_slack_notification': 'model_utils',
+    'MetricsAccumulator': 'metrics',
+    'ModelCache': 'model_cache',
+    'record_checksum': 'artifact_checksum',
+    'verify_artifact': 'artifact_checksum',
+    'ModelRegistry': 'model_registry',
+    'ArtifactStore': 'artifact_store',
+    'collect_artifact_garbage': 'artifact_store',
+    'list_releases': 'releases',
+    'load_feature_store': 'training_utils',
+    'grouped_train_val_split': 'training_utils',
+    'train_rul_model': 'training_utils',
+    'grouped_cross_validate': 'training_utils',
+    'train_distributed': 'distributed_training',
+    'TrainingProfiler': 'training_profiler',
+    'quantize_model': 'quantization',
+    'quantize_and_validate': 'quantization',
+    'OnnxModel': 'onnx_export',
+    'export_onnx': 'onnx_export',
+    'export_and_validate': 'onnx_export',
+    'distill_student': 'distillation',
+    'register_student': 'distillation',
+    'benchmark_latency': 'model_benchmark',
+}
+
+__all__ = list(_EXPORTS)
 
 __version__ = '1.0.0'
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
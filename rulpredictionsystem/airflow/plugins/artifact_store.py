@@ -0,0 +1,450 @@
+"""
+Content-Addressed Model Artifact Store
+
+This module stores model artifacts once by content and records versions
+(backups, promotions) as small manifests:
+- Blobs are files named by their SHA-256 under blobs/<2-char prefix>/
+- A manifest maps the file names of a model directory to blob digests
+- Checked-out directories hold hardlinks to blobs plus a record of the
+  checkout, so snapshots of unchanged checkouts need no hashing
+- Garbage collection applies a manifest retention policy, prunes release
+  directories of expired manifests and removes blobs no longer referenced
+  by a manifest or a checked-out directory
+
+Author: RUL Prediction System
+Version: 1.0.0
+"""
+
+import os
+import json
+import shutil
+import logging
+import argparse
+import tempfile
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# Store directory inside the models directory
+ARTIFACT_STORE_DIR_NAME = 'artifact_store'
+
+# Record of the manifest a directory was checked out from
+CHECKOUT_RECORD_NAME = '.artifact_manifest.json'
+
+# Default retention policy
+DEFAULT_KEEP_LAST = 10
+
+
+def write_json_atomic(path: str, data: Any) -> None:
+    """
+    Write JSON through a temporary file and rename it over path.
+
+    Readers see the old or the new file, never a partial one, and a
+    hardlinked blob at path is replaced rather than overwritten.
+    """
+    directory = os.path.dirname(path) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp_')
+
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _file_identity(stat: os.stat_result) -> List[int]:
+    """Inode, size and mtime of a file, to detect changes since a checkout"""
+    return [stat.st_ino, stat.st_size, stat.st_mtime_ns]
+
+
+class ArtifactStore:
+    """
+    Content-addressed store of model files with manifest-based versions.
+
+    Args:
+        root: Store directory (blobs/ and manifests/ are created inside)
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self.blobs_dir = os.path.join(root, 'blobs')
+        self.manifests_dir = os.path.join(root, 'manifests')
+
+        os.makedirs(self.blobs_dir, exist_ok=True)
+        os.makedirs(self.manifests_dir, exist_ok=True)
+
+    @classmethod
+    def for_models_dir(cls, models_dir: str) -> 'ArtifactStore':
+        """Store shared by the staging, production and candidate directories"""
+        return cls(os.path.join(models_dir, ARTIFACT_STORE_DIR_NAME))
+
+    # ------------------------------------------------------------------
+    # Blobs
+    # ------------------------------------------------------------------
+
+    def blob_path(self, digest: str) -> str:
+        """Path of the blob with the given digest"""
+        return os.path.join(self.blobs_dir, digest[:2], digest)
+
+    def put_file(self, file_path: str, digest: Optional[str] = None) -> str:
+        """
+        Add a file's content to the store.
+
+        The file is copied, not linked, so later writes to the source
+        cannot change the blob. Content already in the store is not copied.
+
+        Args:
+            file_path: File to add
+            digest: Known SHA-256 of the file (computed if omitted)
+
+        Returns:
+            Digest of the file's content
+        """
+        from .artifact_checksum import file_content_hash
+
+        digest = digest or file_content_hash(file_path)
+        blob_path = self.blob_path(digest)
+
+        if not os.path.exists(blob_path):
+            os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(blob_path), prefix='.tmp_')
+            os.close(fd)
+
+            try:
+                shutil.copyfile(file_path, tmp_path)
+                os.chmod(tmp_path, 0o444)
+                os.replace(tmp_path, blob_path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+
+        return digest
+
+    # ------------------------------------------------------------------
+    # Manifests
+    # ------------------------------------------------------------------
+
+    def manifest_path(self, manifest_id: str) -> str:
+        """Path of a manifest"""
+        return os.path.join(self.manifests_dir, f"{manifest_id}.json")
+
+    def load_manifest(self, manifest_id: str) -> Dict[str, Any]:
+        """
+        Load a manifest.
+
+        Raises:
+            FileNotFoundError: If the manifest doesn't exist
+        """
+        with open(self.manifest_path(manifest_id)) as f:
+            return json.load(f)
+
+    def list_manifests(self) -> List[Dict[str, Any]]:
+        """All manifests, oldest first"""
+        manifests = []
+
+        for file_name in os.listdir(self.manifests_dir):
+            if file_name.endswith('.json'):
+                with open(os.path.join(self.manifests_dir, file_name)) as f:
+                    manifests.append(json.load(f))
+
+        return sorted(manifests, key=lambda manifest: manifest['created_at'])
+
+    def snapshot(
+        self,
+        source_dir: str,
+        label: str,
+        file_names: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Record the files of a directory as a new manifest.
+
+        Files unchanged since the directory was checked out from the store
+        are referenced by their recorded digest without being read.
+
+        Args:
+            source_dir: Directory to snapshot
+            label: Kind of version (e.g. 'backup', 'promotion')
+            file_names: Files to include (all files, recursively, if omitted)
+            metadata: Optional metadata stored in the manifest
+
+        Returns:
+            The manifest (manifest_id, label, created_at, source_dir, files,
+            metadata), where files maps relative paths to digest and size
+        """
+        checkout = self._checkout_record(source_dir)
+
+        if file_names is None:
+            file_names = []
+            for dir_path, _, names in os.walk(source_dir):
+                for name in names:
+                    relative_path = os.path.relpath(os.path.join(dir_path, name), source_dir)
+                    if relative_path != CHECKOUT_RECORD_NAME:
+                        file_names.append(relative_path)
+
+        files = {}
+        for file_name in sorted(file_names):
+            file_path = os.path.join(source_dir, file_name)
+            if not os.path.isfile(file_path):
+                continue
+
+            stat = os.stat(file_path)
+            recorded = checkout.get(file_name, {})
+            known_digest = recorded.get('digest') if recorded.get('identity') == _file_identity(stat) else None
+
+            files[file_name] = {
+                'digest': self.put_file(file_path, digest=known_digest),
+                'size': stat.st_size,
+            }
+
+        created_at = datetime.now()
+        manifest = {
+            'manifest_id': f"{label}_{created_at.strftime('%Y%m%d_%H%M%S_%f')}",
+            'label': label,
+            'created_at': created_at.isoformat(),
+            'source_dir': source_dir,
+            'files': files,
+            'metadata': metadata or {},
+        }
+
+        write_json_atomic(self.manifest_path(manifest['manifest_id']), manifest)
+
+        logger.info(
+            f"Recorded manifest {manifest['manifest_id']} with {len(files)} files from {source_dir}"
+        )
+
+        return manifest
+
+    # ------------------------------------------------------------------
+    # Checkouts
+    # ------------------------------------------------------------------
+
+    def checkout(
+        self,
+        manifest_id: str,
+        target_dir: str,
+        remove_files: Optional[List[str]] = None
+    ) -> List[str]:
+        """
+        Materialize a manifest in a directory as hardlinks to its blobs.
+
+        Each file is linked under a temporary name and renamed into place,
+        so readers never see a partially written file.
+
+        Args:
+            manifest_id: Manifest to check out
+            target_dir: Directory to populate
+            remove_files: Files to remove from target_dir if the manifest
+                doesn't contain them (e.g. stale model variants)
+
+        Returns:
+            Checked-out file names
+        """
+        manifest = self.load_manifest(manifest_id)
+        os.makedirs(target_dir, exist_ok=True)
+
+        record = {}
+        for file_name, entry in manifest['files'].items():
+            target_path = os.path.join(target_dir, file_name)
+            os.makedirs(os.path.dirname(target_path), exist_ok=True)
+
+            tmp_path = os.path.join(os.path.dirname(target_path), f".tmp_{os.path.basename(file_name)}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+            try:
+                os.link(self.blob_path(entry['digest']), tmp_path)
+            except OSError:
+                # Store on another filesystem: fall back to a copy
+                shutil.copyfile(self.blob_path(entry['digest']), tmp_path)
+            os.replace(tmp_path, target_path)
+
+            record[file_name] = {
+                'digest': entry['digest'],
+                'identity': _file_identity(os.stat(target_path)),
+            }
+
+        for file_name in remove_files or []:
+            file_path = os.path.join(target_dir, file_name)
+            if file_name not in manifest['files'] and os.path.exists(file_path):
+                os.remove(file_path)
+                logger.info(f"Removed stale {file_name} from {target_dir}")
+
+        write_json_atomic(
+            os.path.join(target_dir, CHECKOUT_RECORD_NAME),
+            {'manifest_id': manifest_id, 'files': record},
+        )
+
+        logger.info(f"Checked out manifest {manifest_id} into {target_dir}")
+
+        return list(manifest['files'])
+
+    def _checkout_record(self, directory: str) -> Dict[str, Any]:
+        """Recorded digests of the files checked out into a directory"""
+        record_path = os.path.join(directory, CHECKOUT_RECORD_NAME)
+
+        if not os.path.exists(record_path):
+            return {}
+
+        with open(record_path) as f:
+            return json.load(f).get('files', {})
+
+    # ------------------------------------------------------------------
+    # Garbage collection
+    # ------------------------------------------------------------------
+
+    def collect_garbage(
+        self,
+        keep_last: int = DEFAULT_KEEP_LAST,
+        max_age_days: Optional[float] = None,
+        protected: Optional[List[str]] = None,
+        releases_dir: Optional[str] = None,
+        dry_run: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Apply the manifest retention policy and remove unreferenced blobs.
+
+        The newest keep_last manifests are kept, plus all manifests younger
+        than max_age_days when it is set. Blobs are kept while a remaining
+        manifest references them or a checked-out directory links them.
+
+        Args:
+            keep_last: Number of newest manifests always kept
+            max_age_days: Optional age below which manifests are kept
+            protected: Manifest ids always kept (e.g. active releases)
+            releases_dir: Optional release directories; releases of expired
+                manifests are removed before the blobs are swept
+            dry_run: Report what would be removed without removing it
+
+        Returns:
+            GC results: removed manifests, number and bytes of removed blobs
+        """
+        manifests = self.list_manifests()
+        cutoff = datetime.now() - timedelta(days=max_age_days) if max_age_days is not None else None
+
+        protected = set(protected or [])
+
+        retained, expired = [], []
+        for i, manifest in enumerate(reversed(manifests)):
+            young = cutoff is not None and datetime.fromisoformat(manifest['created_at']) >= cutoff
+            keep = i < keep_last or young or manifest['manifest_id'] in protected
+            (retained if keep else expired).append(manifest)
+
+        removed_releases = []
+        if releases_dir and not dry_run:
+            from .releases import prune_releases
+
+            removed_releases = prune_releases(
+                releases_dir, [manifest['manifest_id'] for manifest in retained]
+            )
+
+        referenced = {
+            entry['digest'] for manifest in retained for entry in manifest['files'].values()
+        }
+
+        removed_blobs = 0
+        removed_bytes = 0
+
+        for dir_path, _, names in os.walk(self.blobs_dir):
+            for name in names:
+                blob_path = os.path.join(dir_path, name)
+                stat = os.stat(blob_path)
+
+                # Extra links mean a checked-out directory still uses the blob
+                if name in referenced or stat.st_nlink > 1:
+                    continue
+
+                removed_blobs += 1
+                removed_bytes += stat.st_size
+                if not dry_run:
+                    os.remove(blob_path)
+
+        if not dry_run:
+            for manifest in expired:
+                os.remove(self.manifest_path(manifest['manifest_id']))
+
+        results = {
+            'dry_run': dry_run,
+            'manifests_kept': len(retained),
+            'manifests_removed': [manifest['manifest_id'] for manifest in expired],
+            'releases_removed': removed_releases,
+            'blobs_removed': removed_blobs,
+            'bytes_removed': removed_bytes,
+        }
+
+        logger.info(
+            f"Artifact store GC: removed {len(expired)} manifests and {removed_blobs} blobs "
+            f"({removed_bytes / 1024 / 1024:.1f} MB){' (dry run)' if dry_run else ''}"
+        )
+
+        return results
+
+
+def collect_artifact_garbage(
+    models_dir: str,
+    keep_last: int = DEFAULT_KEEP_LAST,
+    max_age_days: Optional[float] = None,
+    dry_run: bool = False,
+    **kwargs
+) -> Dict[str, Any]:
+    """
+    Run garbage collection on the artifact store of a models directory.
+
+    Releases that a link in the models directory (e.g. production) points
+    to are never removed.
+
+    Args:
+        models_dir: Models directory
+        keep_last: Number of newest manifests always kept
+        max_age_days: Optional age below which manifests are kept
+        dry_run: Report what would be removed without removing it
+
+    Returns:
+        GC results
+    """
+    from .releases import RELEASES_DIR_NAME, current_release
+
+    active_releases = [
+        current_release(os.path.join(models_dir, name))
+        for name in os.listdir(models_dir)
+        if os.path.islink(os.path.join(models_dir, name))
+    ]
+
+    return ArtifactStore.for_models_dir(models_dir).collect_garbage(
+        keep_last=keep_last,
+        max_age_days=max_age_days,
+        protected=active_releases,
+        releases_dir=os.path.join(models_dir, RELEASES_DIR_NAME),
+        dry_run=dry_run,
+    )
+
+
+def main():
+    """Command line entry point for artifact store garbage collection"""
+    parser = argparse.ArgumentParser(description='Model artifact store garbage collection')
+    parser.add_argument('--models-dir', required=True)
+    parser.add_argument('--keep-last', type=int, default=DEFAULT_KEEP_LAST)
+    parser.add_argument('--max-age-days', type=float)
+    parser.add_argument('--dry-run', action='store_true')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    results = collect_artifact_garbage(
+        args.models_dir,
+        keep_last=args.keep_last,
+        max_age_days=args.max_age_days,
+        dry_run=args.dry_run,
+    )
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
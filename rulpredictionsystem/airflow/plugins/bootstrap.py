@@ -0,0 +1,149 @@
+"""
+Paired Bootstrap Significance Testing for Model Comparison
+
+This module provides a vectorized paired bootstrap of the MAE and RMSE
+improvement of a candidate over a baseline model on the same test set:
+- Resample indices are drawn as an (n_boot, n) integer matrix, in chunks
+  of resamples to bound memory
+- Per-sample absolute and squared errors of both models are gathered in
+  one pass and summed for all resamples of a chunk by one matrix product
+- Percentile confidence intervals and one-sided p-values of the
+  improvements are returned for use as promotion thresholds
+
+Author: RUL Prediction System
+Version: 1.0.0
+"""
+
+import logging
+import time
+from typing import Dict, Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+# Default bootstrap settings
+DEFAULT_N_BOOT = 1000
+DEFAULT_CONFIDENCE_LEVEL = 0.95
+
+# Upper bound on resample indices held in memory at once
+MAX_CHUNK_ELEMENTS = 2 * 1024 * 1024
+
+
+def _improvement_pct(baseline: np.ndarray, candidate: np.ndarray) -> np.ndarray:
+    """Improvement in % (positive when the candidate's error is lower)"""
+    return (baseline - candidate) / np.maximum(baseline, np.finfo(np.float64).tiny) * 100
+
+
+def paired_bootstrap(
+    y_true: np.ndarray,
+    candidate_pred: np.ndarray,
+    baseline_pred: np.ndarray,
+    n_boot: int = DEFAULT_N_BOOT,
+    confidence_level: float = DEFAULT_CONFIDENCE_LEVEL,
+    random_seed: int = 42
+) -> Dict[str, Any]:
+    """
+    Paired bootstrap of the MAE and RMSE improvement of a candidate model.
+
+    Both models are evaluated on the same resampled rows, so the test set's
+    difficulty cancels out of the comparison.
+
+    Args:
+        y_true: Ground truth values
+        candidate_pred: Candidate (staging) model predictions
+        baseline_pred: Baseline (production) model predictions
+        n_boot: Number of bootstrap resamples
+        confidence_level: Confidence level of the intervals
+        random_seed: Random seed
+
+    Returns:
+        Dictionary with n_boot, n_samples, confidence_level and, for
+        'mae_improvement_pct' and 'rmse_improvement_pct', the point
+        'estimate', the interval bounds 'lower' and 'upper', and 'p_value',
+        the one-sided p-value of the candidate not being better
+
+    Raises:
+        ValueError: If the arrays are empty or not aligned
+    """
+    y_true = np.asarray(y_true, dtype=np.float64).ravel()
+    candidate_errors = y_true - np.asarray(candidate_pred, dtype=np.float64).ravel()
+    baseline_errors = y_true - np.asarray(baseline_pred, dtype=np.float64).ravel()
+
+    n = len(y_true)
+    if n == 0 or len(candidate_errors) != n or len(baseline_errors) != n:
+        raise ValueError(
+            f"Predictions must be non-empty and aligned with {n} targets"
+        )
+
+    start_time = time.perf_counter()
+
+    # One float32 row per sample: |e_c|, |e_b|, e_c², e_b²
+    errors = np.ascontiguousarray(np.column_stack([
+        np.abs(candidate_errors),
+        np.abs(baseline_errors),
+        candidate_errors ** 2,
+        baseline_errors ** 2,
+    ]), dtype=np.float32)
+
+    # Each row viewed as one 16-byte item, so a single gather moves all four errors
+    rows = errors.view(np.dtype((np.void, errors.strides[0]))).ravel()
+    ones = np.ones(n, dtype=np.float32)
+
+    rng = np.random.default_rng(random_seed)
+    index_dtype = np.int32 if n < np.iinfo(np.int32).max else np.int64
+    chunk_size = max(1, min(n_boot, MAX_CHUNK_ELEMENTS // n))
+
+    resampled = np.empty((n_boot, 4))
+    for start in range(0, n_boot, chunk_size):
+        end = min(start + chunk_size, n_boot)
+        indices = rng.integers(0, n, size=(end - start, n), dtype=index_dtype)
+
+        # Per-resample sums as a batched matrix product (BLAS), not a strided reduction
+        gathered = rows[indices].view(np.float32).reshape(end - start, n, 4)
+        resampled[start:end] = ones @ gathered / n
+
+    full = np.array([
+        np.abs(candidate_errors).mean(),
+        np.abs(baseline_errors).mean(),
+        np.mean(candidate_errors ** 2),
+        np.mean(baseline_errors ** 2),
+    ])
+
+    improvements = {
+        'mae_improvement_pct': (
+            _improvement_pct(full[1], full[0]),
+            _improvement_pct(resampled[:, 1], resampled[:, 0]),
+        ),
+        'rmse_improvement_pct': (
+            _improvement_pct(np.sqrt(full[3]), np.sqrt(full[2])),
+            _improvement_pct(np.sqrt(resampled[:, 3]), np.sqrt(resampled[:, 2])),
+        ),
+    }
+
+    alpha = 1 - confidence_level
+    results: Dict[str, Any] = {
+        'n_boot': n_boot,
+        'n_samples': n,
+        'confidence_level': confidence_level,
+    }
+
+    for name, (estimate, samples) in improvements.items():
+        lower, upper = np.quantile(samples, [alpha / 2, 1 - alpha / 2])
+        results[name] = {
+            'estimate': round(float(estimate), 4),
+            'lower': round(float(lower), 4),
+            'upper': round(float(upper), 4),
+            'p_value': float((np.count_nonzero(samples <= 0) + 1) / (n_boot + 1)),
+        }
+
+    results['bootstrap_seconds'] = round(time.perf_counter() - start_time, 4)
+
+    logger.info(
+        f"Paired bootstrap ({n_boot} resamples of {n} rows) in "
+        f"{results['bootstrap_seconds']}s: MAE {results['mae_improvement_pct']}, "
+        f"RMSE {results['rmse_improvement_pct']}"
+    )
+
+    return results
@@ -0,0 +1,218 @@
+"""
+Knowledge Distillation for the RUL Prediction Model
+
+This module provides utility functions for:
+- Scoring the full feature store with the trained CNN-LSTM teacher
+- Training a compact 1-D CNN student on the teacher's predictions
+- Evaluating and benchmarking the student against the teacher
+- Registering the student, with the version of its teacher
+
+The student is saved as a separate model variant next to the teacher. The
+serving side uses it for routine fleet scans and falls back to the teacher
+for bearings near the critical RUL band.
+
+Author: RUL Prediction System
+Version: 1.0.0
+"""
+
+import os
+import logging
+from typing import Dict, Any, Optional
+
+import numpy as np
+
+from .model_registry import DEFAULT_MODEL_NAME
+
+logger = logging.getLogger(__name__)
+
+
+# Registered model name of distilled students, kept apart from the teacher's
+# candidates so a student is never evaluated as the staging model
+STUDENT_MODEL_NAME = os.getenv('RUL_STUDENT_MODEL_NAME', f'{DEFAULT_MODEL_NAME}_student')
+
+
+# Default student training settings (override via training_config['distillation'])
+DEFAULT_DISTILLATION_CONFIG = {
+    'student_config': {'channels': 32, 'num_layers': 2},
+    'epochs': 30,
+    'learning_rate': 0.003,
+    'early_stopping_patience': 5,
+}
+
+
+def predict_in_batches(model: Any, X: np.ndarray, chunk_size: int = 65536) -> np.ndarray:
+    """
+    Predict over a (memory-mapped) feature array one chunk at a time.
+
+    Args:
+        model: Model with a predict(X) method
+        X: Feature array
+        chunk_size: Rows read from X per chunk
+
+    Returns:
+        Predictions for all rows
+    """
+    predictions = np.empty(len(X), dtype=np.float32)
+
+    for start in range(0, len(X), chunk_size):
+        predictions[start:start + chunk_size] = model.predict(X[start:start + chunk_size])
+
+    return predictions
+
+
+def distill_student(
+    teacher_path: str,
+    features_dir: str,
+    output_path: str,
+    training_config: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Train a compact student model on the teacher's predictions.
+
+    The teacher scores every row of the feature store and the student is
+    fitted to those predictions on the teacher's training split. Both models
+    are then evaluated against the true labels of the validation split
+    (unseen bearings) and benchmarked for latency.
+
+    Args:
+        teacher_path: Path to the trained teacher model
+        features_dir: Feature store directory
+        output_path: Path for the student model
+        training_config: Training configuration; its 'distillation' entry
+            overrides DEFAULT_DISTILLATION_CONFIG
+
+    Returns:
+        Distillation results with teacher and student metrics and latency,
+        and the teacher's model version
+    """
+    import torch
+    from .artifact_checksum import file_content_hash
+    from .model_registry import model_version_for
+    from .model_utils import load_model, save_model, calculate_metrics
+    from .model_benchmark import benchmark_latency
+    from .rul_model import build_student_model
+    from .training_utils import (
+        load_feature_store,
+        grouped_train_val_split,
+        compute_feature_stats,
+        fit_model,
+    )
+
+    distillation_config = {
+        **DEFAULT_DISTILLATION_CONFIG,
+        **(training_config.get('distillation') or {}),
+    }
+
+    X, y, groups = load_feature_store(features_dir, mmap_mode='r')
+
+    # Hashed before loading, so the version is that of the model distilled
+    teacher_model_version = model_version_for(file_content_hash(teacher_path))
+    teacher = load_model(teacher_path)
+
+    logger.info(f"Scoring {len(X)} rows with the teacher model")
+    teacher_predictions = predict_in_batches(teacher, X)
+
+    # Same split as the teacher, so validation bearings are unseen by both
+    train_idx, val_idx = grouped_train_val_split(
+        len(X),
+        groups,
+        validation_split=training_config.get('validation_split', 0.2),
+        random_seed=training_config.get('random_seed', 42)
+    )
+
+    torch.manual_seed(int(training_config.get('random_seed', 42)))
+    student = build_student_model(X.shape[-1], distillation_config['student_config'])
+
+    soft_train = teacher_predictions[np.sort(train_idx)].astype(np.float64)
+    student.set_normalization(
+        *compute_feature_stats(X, train_idx),
+        target_mean=float(soft_train.mean()),
+        target_std=float(soft_train.std())
+    )
+
+    student_training_config = {
+        **training_config,
+        'epochs': distillation_config['epochs'],
+        'learning_rate': distillation_config['learning_rate'],
+        'early_stopping_patience': distillation_config['early_stopping_patience'],
+    }
+
+    logger.info(f"Distilling student: {student.config}")
+    history = fit_model(student, X, teacher_predictions, train_idx, val_idx, student_training_config)
+
+    # Evaluate both models on the true labels of the validation split
+    val_rows = np.sort(val_idx)
+    X_val = np.asarray(X[val_rows], dtype=np.float32)
+    y_val = np.asarray(y[val_rows])
+
+    student_predictions = student.predict(X_val)
+    teacher_metrics = calculate_metrics(y_val, teacher_predictions[val_rows])
+    student_metrics = calculate_metrics(y_val, student_predictions)
+
+    # Fidelity: how closely the student tracks the teacher
+    fidelity_mae = float(np.mean(np.abs(student_predictions - teacher_predictions[val_rows])))
+
+    teacher_latency = benchmark_latency(teacher, X_val)
+    student_latency = benchmark_latency(student, X_val)
+
+    distillation_results = {
+        'variant': 'student',
+        'architecture': 'compact_cnn',
+        'student_config': student.config,
+        'teacher_model_version': teacher_model_version,
+        'student_parameters': sum(p.numel() for p in student.parameters()),
+        'teacher_parameters': sum(p.numel() for p in teacher.parameters()),
+        'n_distill_samples': len(X),
+        'n_val_samples': len(val_rows),
+        'teacher_metrics': teacher_metrics,
+        'student_metrics': student_metrics,
+        'fidelity_mae': round(fidelity_mae, 4),
+        'teacher_latency': teacher_latency,
+        'student_latency': student_latency,
+        **history,
+    }
+
+    save_model(student, output_path, metadata=distillation_results)
+    distillation_results['student_model_path'] = output_path
+
+    logger.info(f"Student model saved to: {output_path}")
+
+    return distillation_results
+
+
+def register_student(
+    student_path: str,
+    distillation_results: Dict[str, Any],
+    registry: Optional[Any] = None
+) -> Dict[str, Any]:
+    """
+    Register a distilled student in the model registry.
+
+    The student is versioned by its content hash like any model, under
+    STUDENT_MODEL_NAME. Its metrics record the teacher's model version and
+    the student's fidelity to it, so each student can be traced back to
+    the teacher it was distilled from.
+
+    Args:
+        student_path: Path to the student model
+        distillation_results: Results of distill_student
+        registry: Optional model registry (defaults to one for STUDENT_MODEL_NAME)
+
+    Returns:
+        Registered model (model_version, content_hash, status)
+    """
+    from .model_registry import ModelRegistry
+
+    if registry is None:
+        registry = ModelRegistry(model_name=STUDENT_MODEL_NAME)
+
+    return registry.register_model(
+        student_path,
+        metrics={
+            **distillation_results['student_metrics'],
+            'teacher_model_version': distillation_results['teacher_model_version'],
+            'fidelity_mae': distillation_results['fidelity_mae'],
+        },
+        algorithm=distillation_results['architecture'],
+        hyperparameters=distillation_results['student_config'],
+    )
@@ -0,0 +1,268 @@
+"""
+Data-Parallel CPU Training for the RUL Prediction Model
+
+This module provides utility functions for:
+- Spawning N local training processes over a shared memory-mapped feature store
+- Gradient synchronization with the gloo all-reduce backend on CPU
+- Optionally spanning several hosts when a master address is configured
+
+Every host runs ``train_distributed`` (or this module's command line entry
+point) with its own node rank and must see the feature store at the same
+path; node 0 hosts the rendezvous and writes the trained model.
+
+Usage (additional worker host):
+    python -m plugins.distributed_training --features-dir /data/features \
+        --nproc-per-node 8 --nnodes 2 --node-rank 1 --master-addr 10.0.0.5
+
+Author: RUL Prediction System
+Version: 1.0.0
+"""
+
+import os
+import json
+import shutil
+import logging
+import tempfile
+import argparse
+from typing import Dict, Any, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+# Default rendezvous settings (single host over localhost)
+DEFAULT_MASTER_ADDR = '127.0.0.1'
+DEFAULT_MASTER_PORT = 29500
+
+
+def get_distributed_config(training_config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Extract data-parallel settings from a training configuration.
+
+    Args:
+        training_config: Training configuration with optional ddp_* keys
+
+    Returns:
+        Distributed settings (nproc_per_node, nnodes, node_rank,
+        master_addr, master_port)
+    """
+    return {
+        'nproc_per_node': int(training_config.get('ddp_processes') or 0),
+        'nnodes': int(training_config.get('ddp_nnodes') or 1),
+        'node_rank': int(training_config.get('ddp_node_rank') or 0),
+        'master_addr': training_config.get('ddp_master_addr') or DEFAULT_MASTER_ADDR,
+        'master_port': int(training_config.get('ddp_master_port') or DEFAULT_MASTER_PORT),
+    }
+
+
+def _ddp_worker(
+    local_rank: int,
+    features_dir: str,
+    train_idx: np.ndarray,
+    val_idx: Optional[np.ndarray],
+    training_config: Dict[str, Any],
+    dist_config: Dict[str, Any],
+    result_path: Optional[str],
+    profile: bool
+) -> None:
+    """
+    Train one data-parallel replica.
+
+    Each replica memory-maps the feature store, trains on its shard of every
+    epoch and all-reduces gradients with the other replicas. Rank 0 saves
+    the trained weights, history and (optionally) its step profile to
+    result_path.
+    """
+    import torch
+    import torch.distributed as dist
+    from torch.nn.parallel import DistributedDataParallel
+
+    from .rul_model import build_model
+    from .training_utils import load_feature_store, compute_feature_stats, fit_model
+    from .training_profiler import TrainingProfiler
+
+    nproc_per_node = dist_config['nproc_per_node']
+    world_size = nproc_per_node * dist_config['nnodes']
+    rank = dist_config['node_rank'] * nproc_per_node + local_rank
+
+    # Split the host's cores between its replicas
+    torch.set_num_threads(max(1, (os.cpu_count() or 1) // nproc_per_node))
+
+    dist.init_process_group(
+        backend='gloo',
+        init_method=f"tcp://{dist_config['master_addr']}:{dist_config['master_port']}",
+        world_size=world_size,
+        rank=rank,
+    )
+
+    try:
+        X, y, _ = load_feature_store(features_dir, mmap_mode='r')
+
+        torch.manual_seed(int(training_config.get('random_seed', 42)))
+        model = build_model(X.shape[-1], training_config.get('model_config'))
+
+        # Every rank derives identical normalization buffers from the same rows,
+        # so they never need to be broadcast during training
+        y_train = np.asarray(y[np.sort(train_idx)], dtype=np.float64)
+        model.set_normalization(
+            *compute_feature_stats(X, train_idx),
+            target_mean=float(y_train.mean()),
+            target_std=float(y_train.std())
+        )
+
+        # Weights are broadcast from rank 0 when DDP wraps the model
+        ddp_model = DistributedDataParallel(model, broadcast_buffers=False)
+
+        profiler = TrainingProfiler() if profile and rank == 0 else None
+
+        history = fit_model(
+            ddp_model, X, y, train_idx, val_idx, training_config,
+            rank=rank, world_size=world_size, profiler=profiler
+        )
+
+        if rank == 0 and result_path:
+            torch.save({
+                'state_dict': model.state_dict(),
+                'history': history,
+                'profile_epochs': profiler.epochs if profiler else [],
+            }, result_path)
+
+    finally:
+        dist.destroy_process_group()
+
+
+def train_distributed(
+    features_dir: str,
+    train_idx: np.ndarray,
+    val_idx: Optional[np.ndarray],
+    training_config: Dict[str, Any],
+    profiler: Optional[Any] = None
+) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Train the CNN-LSTM model with data-parallel CPU processes.
+
+    Spawns ddp_processes replicas on this host. With ddp_nnodes > 1 the
+    replicas join a process group spanning all hosts at ddp_master_addr.
+
+    Args:
+        features_dir: Feature store directory
+        train_idx: Training row indices
+        val_idx: Validation row indices
+        training_config: Training configuration including ddp_* settings
+        profiler: Optional TrainingProfiler; receives the epoch reports of
+            rank 0
+
+    Returns:
+        Tuple of (trained model, training history). On hosts other than
+        node 0 the model is None.
+
+    Raises:
+        ValueError: If fewer than one process per node is configured
+    """
+    import torch
+    import torch.multiprocessing as mp
+
+    from .rul_model import build_model
+    from .training_utils import load_feature_store
+
+    dist_config = get_distributed_config(training_config)
+    nproc_per_node = dist_config['nproc_per_node']
+
+    if nproc_per_node < 1:
+        raise ValueError("Data-parallel training requires ddp_processes >= 1")
+
+    world_size = nproc_per_node * dist_config['nnodes']
+    is_master = dist_config['node_rank'] == 0
+
+    logger.info(
+        f"Starting data-parallel training: {nproc_per_node} processes x "
+        f"{dist_config['nnodes']} nodes via {dist_config['master_addr']}:"
+        f"{dist_config['master_port']} (world size {world_size})"
+    )
+
+    result_dir = tempfile.mkdtemp(prefix='rul_ddp_')
+    result_path = os.path.join(result_dir, 'result.pt') if is_master else None
+
+    try:
+        mp.spawn(
+            _ddp_worker,
+            args=(
+                features_dir, train_idx, val_idx, training_config,
+                dist_config, result_path, profiler is not None
+            ),
+            nprocs=nproc_per_node,
+            join=True,
+        )
+
+        if not is_master:
+            return None, {'node_rank': dist_config['node_rank'], 'world_size': world_size}
+
+        result = torch.load(result_path, weights_only=False)
+
+    finally:
+        shutil.rmtree(result_dir, ignore_errors=True)
+
+    X, _, _ = load_feature_store(features_dir, mmap_mode='r')
+    model = build_model(X.shape[-1], training_config.get('model_config'))
+    model.load_state_dict(result['state_dict'])
+
+    if profiler is not None:
+        profiler.epochs.extend(result['profile_epochs'])
+
+    history = result['history']
+    history.update({
+        'data_parallel': True,
+        'world_size': world_size,
+        'nnodes': dist_config['nnodes'],
+    })
+
+    return model, history
+
+
+def main():
+    """Command line entry point for joining a multi-host training run"""
+    from .training_utils import load_feature_store, grouped_train_val_split
+    from .model_utils import save_model
+
+    parser = argparse.ArgumentParser(description='Data-parallel RUL model training')
+    parser.add_argument('--features-dir', required=True)
+    parser.add_argument('--training-config', default='{}', help='Training configuration as JSON')
+    parser.add_argument('--nproc-per-node', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--nnodes', type=int, default=1)
+    parser.add_argument('--node-rank', type=int, default=0)
+    parser.add_argument('--master-addr', default=DEFAULT_MASTER_ADDR)
+    parser.add_argument('--master-port', type=int, default=DEFAULT_MASTER_PORT)
+    parser.add_argument('--output', help='Model output path (node 0 only)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    training_config = json.loads(args.training_config)
+    training_config.update({
+        'ddp_processes': args.nproc_per_node,
+        'ddp_nnodes': args.nnodes,
+        'ddp_node_rank': args.node_rank,
+        'ddp_master_addr': args.master_addr,
+        'ddp_master_port': args.master_port,
+    })
+
+    # Every host derives the same split from the shared seed
+    X, _, groups = load_feature_store(args.features_dir, mmap_mode='r')
+    train_idx, val_idx = grouped_train_val_split(
+        len(X),
+        groups,
+        validation_split=training_config.get('validation_split', 0.2),
+        random_seed=training_config.get('random_seed', 42)
+    )
+
+    model, history = train_distributed(args.features_dir, train_idx, val_idx, training_config)
+
+    if model is not None and args.output:
+        save_model(model, args.output, metadata=history)
+
+    logger.info(f"Training completed: {history}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,394 @@
+"""
+Batched Model Evaluation for the RUL Prediction System
+
+This module provides utility functions for:
+- Memory-mapping test sets instead of loading them into memory
+- Predicting in batches sized to stay under a memory ceiling
+- Streaming predictions into a MetricsAccumulator
+- Reporting evaluation throughput (rows/s)
+- Scoring several models concurrently over one shared test set
+- Reusing cached predictions of unchanged models on unchanged test sets
+- Saving per-sample predictions for paired significance testing
+
+Author: RUL Prediction System
+Version: 1.0.0
+"""
+
+import os
+import time
+import logging
+from datetime import datetime
+from typing import Dict, Any, Iterator, Optional, Tuple
+
+import numpy as np
+
+from .metrics import MetricsAccumulator
+from .prediction_cache import PredictionCache
+from .training_profiler import get_peak_rss_mb
+from .worker_pool import spawn_pool, threads_per_worker
+
+logger = logging.getLogger(__name__)
+
+
+# Default evaluation settings
+DEFAULT_EVAL_BATCH_SIZE = 4096
+DEFAULT_MEMORY_LIMIT_MB = 1024
+
+# Working memory per input byte of a batch (float32 copy plus intermediate
+# activations of the CNN-LSTM); used to derive the initial batch size
+ACTIVATION_OVERHEAD = 64
+
+
+def load_test_set(
+    features_path: str,
+    labels_path: str,
+    mmap_mode: Optional[str] = 'r'
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Memory-map a test set.
+
+    Args:
+        features_path: Path to test_features.npy
+        labels_path: Path to test_labels.npy
+        mmap_mode: numpy memory-map mode (None loads into memory)
+
+    Returns:
+        Tuple of (X_test, y_test)
+
+    Raises:
+        FileNotFoundError: If a test file doesn't exist
+        ValueError: If features and labels are not aligned
+    """
+    for path in (features_path, labels_path):
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Test data not found: {path}")
+
+    X_test = np.load(features_path, mmap_mode=mmap_mode)
+    y_test = np.load(labels_path, mmap_mode=mmap_mode)
+
+    if len(X_test) != len(y_test):
+        raise ValueError(
+            f"Test features ({len(X_test)}) and labels ({len(y_test)}) are not aligned"
+        )
+
+    return X_test, y_test
+
+
+def memory_capped_batch_size(
+    X: np.ndarray,
+    batch_size: int,
+    memory_limit_mb: float
+) -> int:
+    """
+    Cap a batch size so one batch's working memory fits the memory ceiling.
+
+    Args:
+        X: Feature array
+        batch_size: Requested batch size
+        memory_limit_mb: Memory ceiling for evaluation in MB
+
+    Returns:
+        Batch size of at least 1
+    """
+    row_bytes = int(np.prod(X.shape[1:], dtype=np.int64)) * 4 * ACTIVATION_OVERHEAD
+    max_rows = int(memory_limit_mb * 1024 * 1024 // max(row_bytes, 1))
+
+    return max(1, min(batch_size, max_rows))
+
+
+def _predict_batches(
+    model: Any,
+    X: np.ndarray,
+    batch_size: int,
+    memory_limit_mb: float,
+    stats: Dict[str, Any]
+) -> Iterator[Tuple[int, int, np.ndarray]]:
+    """
+    Yield (start, end, predictions) for consecutive batches of X.
+
+    The batch size is capped by the memory ceiling and halved whenever the
+    process' peak RSS grows by more than memory_limit_mb. Batch statistics
+    are written into stats once all batches have been yielded.
+    """
+    batch_size = memory_capped_batch_size(X, batch_size, memory_limit_mb)
+
+    baseline_rss_mb = get_peak_rss_mb()
+    n_batches = 0
+    start = 0
+    start_time = time.perf_counter()
+
+    while start < len(X):
+        end = min(start + batch_size, len(X))
+
+        yield start, end, model.predict(np.asarray(X[start:end], dtype=np.float32))
+
+        n_batches += 1
+        start = end
+
+        peak_rss_mb = get_peak_rss_mb()
+        if peak_rss_mb - baseline_rss_mb > memory_limit_mb and batch_size > 1:
+            batch_size = max(1, batch_size // 2)
+            baseline_rss_mb = peak_rss_mb
+            logger.warning(
+                f"Evaluation memory above {memory_limit_mb} MB, "
+                f"reducing batch size to {batch_size}"
+            )
+
+    elapsed = time.perf_counter() - start_time
+
+    stats.update({
+        'n_rows': len(X),
+        'n_batches': n_batches,
+        'batch_size': batch_size,
+        'memory_limit_mb': memory_limit_mb,
+        'peak_rss_mb': round(get_peak_rss_mb(), 2),
+        'evaluation_seconds': round(elapsed, 4),
+        'rows_per_second': round(len(X) / elapsed, 2) if elapsed > 0 else 0.0,
+    })
+
+    logger.info(f"Scored {len(X)} rows in {n_batches} batches: {stats['rows_per_second']} rows/s")
+
+
+def predict_batched(
+    model: Any,
+    X: np.ndarray,
+    batch_size: int = DEFAULT_EVAL_BATCH_SIZE,
+    memory_limit_mb: float = DEFAULT_MEMORY_LIMIT_MB
+) -> Tuple[np.ndarray, Dict[str, Any]]:
+    """
+    Predict over a (memory-mapped) feature array in memory-capped batches.
+
+    Args:
+        model: Model with a predict(X) method
+        X: Feature array
+        batch_size: Requested batch size
+        memory_limit_mb: Memory ceiling for evaluation in MB
+
+    Returns:
+        Tuple of (predictions, batch statistics)
+    """
+    predictions = np.empty(len(X), dtype=np.float32)
+    stats: Dict[str, Any] = {}
+
+    for start, end, y_pred in _predict_batches(model, X, batch_size, memory_limit_mb, stats):
+        predictions[start:end] = np.asarray(y_pred).ravel()
+
+    return predictions, stats
+
+
+def evaluate_model_batched(
+    model: Any,
+    X: np.ndarray,
+    y: np.ndarray,
+    batch_size: int = DEFAULT_EVAL_BATCH_SIZE,
+    memory_limit_mb: float = DEFAULT_MEMORY_LIMIT_MB,
+    accumulator: Optional[MetricsAccumulator] = None
+) -> Tuple[MetricsAccumulator, Dict[str, Any]]:
+    """
+    Score a model over a (memory-mapped) test set in batches.
+
+    Only the current batch and its predictions are held in memory. If the
+    process' peak RSS grows by more than memory_limit_mb during evaluation,
+    the batch size is halved for the remaining batches.
+
+    Args:
+        model: Model with a predict(X) method
+        X: Feature array
+        y: Label array
+        batch_size: Requested batch size
+        memory_limit_mb: Memory ceiling for evaluation in MB
+        accumulator: Optional accumulator to update (a new one by default)
+
+    Returns:
+        Tuple of (metrics accumulator, evaluation statistics)
+    """
+    accumulator = accumulator if accumulator is not None else MetricsAccumulator()
+    stats: Dict[str, Any] = {}
+
+    for start, end, y_pred in _predict_batches(model, X, batch_size, memory_limit_mb, stats):
+        accumulator.update(y[start:end], y_pred)
+
+    return accumulator, stats
+
+
+def score_model_file(
+    model_path: str,
+    model_name: str,
+    features_path: str,
+    labels_path: str,
+    batch_size: int = DEFAULT_EVAL_BATCH_SIZE,
+    memory_limit_mb: float = DEFAULT_MEMORY_LIMIT_MB,
+    cache_dir: Optional[str] = None,
+    predictions_path: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Load a model file and score it over a memory-mapped test set.
+
+    With a cache_dir, predictions are cached per (model, test features)
+    content hash; the model is only loaded and run for rows not yet cached.
+    With a predictions_path, per-sample predictions are saved there (.npy).
+
+    Args:
+        model_path: Path to the model file
+        model_name: Name reported in the results (e.g. 'staging_model')
+        features_path: Path to test_features.npy
+        labels_path: Path to test_labels.npy
+        batch_size: Requested batch size
+        memory_limit_mb: Memory ceiling for evaluation in MB
+        cache_dir: Optional prediction cache directory
+        predictions_path: Optional path to save the predictions to
+
+    Returns:
+        Evaluation results (model_path, model_name, metrics, n_test_samples,
+        rows_per_second, evaluation_stats, evaluation_timestamp and, if
+        saved, predictions_path)
+    """
+    from .model_utils import load_model
+
+    X_test, y_test = load_test_set(features_path, labels_path)
+
+    if cache_dir is None and predictions_path is None:
+        accumulator, eval_stats = evaluate_model_batched(
+            load_model(model_path),
+            X_test,
+            y_test,
+            batch_size=batch_size,
+            memory_limit_mb=memory_limit_mb,
+        )
+
+    else:
+        eval_stats: Dict[str, Any] = {}
+
+        def predict_fn(X_new: np.ndarray) -> np.ndarray:
+            predictions, stats = predict_batched(
+                load_model(model_path), X_new,
+                batch_size=batch_size, memory_limit_mb=memory_limit_mb
+            )
+            eval_stats.update(stats)
+            return predictions
+
+        start_time = time.perf_counter()
+
+        if cache_dir is not None:
+            y_pred, cache_info = PredictionCache(cache_dir).get_or_predict(model_path, X_test, predict_fn)
+            eval_stats['prediction_cache'] = cache_info
+        else:
+            y_pred = predict_fn(X_test)
+
+        accumulator = MetricsAccumulator().update(y_test, y_pred)
+        elapsed = time.perf_counter() - start_time
+
+        eval_stats.update({
+            'n_rows': len(X_test),
+            'evaluation_seconds': round(elapsed, 4),
+            'rows_per_second': round(len(X_test) / elapsed, 2) if elapsed > 0 else 0.0,
+        })
+
+        if predictions_path is not None:
+            os.makedirs(os.path.dirname(predictions_path) or '.', exist_ok=True)
+            np.save(predictions_path, np.asarray(y_pred, dtype=np.float32))
+
+    results = {
+        'model_path': model_path,
+        'model_name': model_name,
+        'metrics': accumulator.compute(),
+        'n_test_samples': len(X_test),
+        'rows_per_second': eval_stats['rows_per_second'],
+        'evaluation_stats': eval_stats,
+        'evaluation_timestamp': datetime.now().isoformat(),
+    }
+
+    if predictions_path is not None:
+        results['predictions_path'] = predictions_path
+
+    return results
+
+
+def _score_model_worker(
+    model_path: str,
+    model_name: str,
+    features_path: str,
+    labels_path: str,
+    batch_size: int,
+    memory_limit_mb: float,
+    cache_dir: Optional[str],
+    predictions_path: Optional[str]
+) -> Dict[str, Any]:
+    """
+    Score one model in a worker process.
+
+    The worker memory-maps the test files itself; all workers share the
+    same page cache, so the test set is read from disk only once.
+    """
+    return score_model_file(
+        model_path, model_name, features_path, labels_path,
+        batch_size=batch_size, memory_limit_mb=memory_limit_mb,
+        cache_dir=cache_dir, predictions_path=predictions_path
+    )
+
+
+def evaluate_models_concurrently(
+    model_paths: Dict[str, str],
+    features_path: str,
+    labels_path: str,
+    batch_size: int = DEFAULT_EVAL_BATCH_SIZE,
+    memory_limit_mb: float = DEFAULT_MEMORY_LIMIT_MB,
+    n_workers: Optional[int] = None,
+    cache_dir: Optional[str] = None,
+    predictions_dir: Optional[str] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Score several models concurrently over one shared test set.
+
+    The test set is validated and memory-mapped once; each model is then
+    loaded and scored in its own worker process, so the wall time is that
+    of the slowest model rather than the sum over models.
+
+    Args:
+        model_paths: Model file paths keyed by model name
+        features_path: Path to test_features.npy
+        labels_path: Path to test_labels.npy
+        batch_size: Requested batch size per model
+        memory_limit_mb: Memory ceiling per model in MB
+        n_workers: Number of worker processes (defaults to one per model,
+            capped by the CPU count)
+        cache_dir: Optional prediction cache directory
+        predictions_dir: Optional directory to save each model's
+            predictions to, as <model name>.npy
+
+    Returns:
+        Evaluation results keyed by model name, as from score_model_file
+
+    Raises:
+        FileNotFoundError: If a test file doesn't exist
+        ValueError: If features and labels are not aligned
+    """
+    X_test, _ = load_test_set(features_path, labels_path)
+
+    if not model_paths:
+        return {}
+
+    n_workers = max(1, min(n_workers or len(model_paths), len(model_paths), os.cpu_count() or 1))
+    n_threads = threads_per_worker(n_workers)
+
+    logger.info(
+        f"Scoring {len(model_paths)} models on {len(X_test)} test rows "
+        f"with {n_workers} workers ({n_threads} threads each)"
+    )
+
+    start_time = time.time()
+
+    with spawn_pool(n_workers, n_threads) as executor:
+        futures = {
+            model_name: executor.submit(
+                _score_model_worker, model_path, model_name, features_path,
+                labels_path, batch_size, memory_limit_mb, cache_dir,
+                os.path.join(predictions_dir, f'{model_name}.npy') if predictions_dir else None
+            )
+            for model_name, model_path in model_paths.items()
+        }
+        results = {model_name: future.result() for model_name, future in futures.items()}
+
+    logger.info(f"Scored {len(results)} models in {time.time() - start_time:.2f}s")
+
+    return results
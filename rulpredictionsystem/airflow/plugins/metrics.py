@@ -0,0 +1,288 @@
+"""
+Streaming Regression Metrics for RUL Evaluation
+
+This module provides a mergeable, single-pass metrics accumulator. It keeps
+sufficient statistics of prediction batches, so evaluation can stream over
+memory-mapped test sets of any size and combine partial results computed
+by parallel workers:
+- Exact MAE, MSE/RMSE, R², MAPE, max error, residual mean/std
+- Approximate median absolute error through a relative-error quantile sketch
+
+Author: RUL Prediction System
+Version: 1.0.0
+"""
+
+import math
+from typing import Dict, Any
+
+import numpy as np
+
+
+# Denominator floor for MAPE, as in sklearn's mean_absolute_percentage_error
+MAPE_EPSILON = np.finfo(np.float64).eps
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with bounded relative error.
+
+    Non-negative values are counted in logarithmically sized buckets, so any
+    quantile estimate is within ``relative_accuracy`` of the true value.
+    Memory grows with the logarithm of the value range, not with the number
+    of values.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, min_value: float = 1e-9):
+        self.relative_accuracy = relative_accuracy
+        self.min_value = min_value
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def update(self, values: np.ndarray) -> None:
+        """Add a batch of non-negative values"""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        positive = values[values > self.min_value]
+
+        self.zero_count += len(values) - len(positive)
+        self.count += len(values)
+
+        if len(positive):
+            keys = np.ceil(np.log(positive) / self._log_gamma).astype(np.int64)
+            unique_keys, counts = np.unique(keys, return_counts=True)
+            for key, count in zip(unique_keys.tolist(), counts.tolist()):
+                self.buckets[key] = self.buckets.get(key, 0) + count
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """Merge another sketch with the same relative accuracy into this one"""
+        if other.gamma != self.gamma:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+
+        self.zero_count += other.zero_count
+        self.count += other.count
+
+        return self
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the q-quantile (0 <= q <= 1) of the values seen so far.
+        """
+        if self.count == 0:
+            return float('nan')
+
+        rank = q * (self.count - 1)
+
+        if rank < self.zero_count:
+            return 0.0
+
+        seen = self.zero_count
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen > rank:
+                # Bucket midpoint in relative terms
+                return float(2 * self.gamma ** key / (self.gamma + 1))
+
+        return float(2 * self.gamma ** max(self.buckets) / (self.gamma + 1))
+
+
+class MetricsAccumulator:
+    """
+    Single-pass, mergeable accumulator of regression metrics.
+
+    Feed prediction batches with ``update`` and read the metrics with
+    ``compute``. Accumulators built on disjoint batches (e.g. by worker
+    processes) combine with ``merge``. Means and sums of squares are kept in
+    Welford/Chan form, so long streams stay numerically stable.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.count = 0
+        self.abs_error_sum = 0.0
+        self.pct_error_sum = 0.0
+        self.max_error = 0.0
+        self.within_10pct = 0
+        self.within_20pct = 0
+
+        # Running mean and sum of squared deviations of targets and residuals
+        self.y_mean = 0.0
+        self.y_m2 = 0.0
+        self.residual_mean = 0.0
+        self.residual_m2 = 0.0
+
+        self.abs_error_sketch = QuantileSketch(relative_accuracy)
+
+    @staticmethod
+    def _combine(n_a: int, mean_a: float, m2_a: float, n_b: int, mean_b: float, m2_b: float):
+        """Combine two (count, mean, M2) summaries"""
+        n = n_a + n_b
+        delta = mean_b - mean_a
+
+        mean = mean_a + delta * n_b / n
+        m2 = m2_a + m2_b + delta * delta * n_a * n_b / n
+
+        return mean, m2
+
+    def update(self, y_true: np.ndarray, y_pred: np.ndarray) -> 'MetricsAccumulator':
+        """
+        Add a batch of targets and predictions.
+
+        Args:
+            y_true: Ground truth values
+            y_pred: Predicted values
+
+        Returns:
+            The accumulator, for chaining
+        """
+        y_true = np.asarray(y_true, dtype=np.float64).ravel()
+        y_pred = np.asarray(y_pred, dtype=np.float64).ravel()
+
+        if y_true.shape != y_pred.shape:
+            raise ValueError(
+                f"Shape mismatch: {y_true.shape[0]} targets vs {y_pred.shape[0]} predictions"
+            )
+
+        n_batch = len(y_true)
+        if n_batch == 0:
+            return self
+
+        # Residuals and their absolute values are computed once per batch
+        residuals = y_true - y_pred
+        abs_errors = np.abs(residuals)
+        abs_true = np.abs(y_true)
+
+        self.abs_error_sum += float(abs_errors.sum())
+        self.pct_error_sum += float((abs_errors / np.maximum(abs_true, MAPE_EPSILON)).sum())
+        self.max_error = max(self.max_error, float(abs_errors.max()))
+        self.within_10pct += int(np.count_nonzero(abs_errors < 0.1 * abs_true))
+        self.within_20pct += int(np.count_nonzero(abs_errors < 0.2 * abs_true))
+
+        y_batch_mean = float(y_true.mean())
+        r_batch_mean = float(residuals.mean())
+
+        self.y_mean, self.y_m2 = self._combine(
+            self.count, self.y_mean, self.y_m2,
+            n_batch, y_batch_mean, float(np.square(y_true - y_batch_mean).sum())
+        )
+        self.residual_mean, self.residual_m2 = self._combine(
+            self.count, self.residual_mean, self.residual_m2,
+            n_batch, r_batch_mean, float(np.square(residuals - r_batch_mean).sum())
+        )
+
+        self.abs_error_sketch.update(abs_errors)
+        self.count += n_batch
+
+        return self
+
+    def merge(self, other: 'MetricsAccumulator') -> 'MetricsAccumulator':
+        """
+        Merge the statistics of another accumulator into this one.
+
+        Args:
+            other: Accumulator built on a disjoint set of samples
+
+        Returns:
+            The accumulator, for chaining
+        """
+        if other.count == 0:
+            return self
+
+        if self.count > 0:
+            self.y_mean, self.y_m2 = self._combine(
+                self.count, self.y_mean, self.y_m2,
+                other.count, other.y_mean, other.y_m2
+            )
+            self.residual_mean, self.residual_m2 = self._combine(
+                self.count, self.residual_mean, self.residual_m2,
+                other.count, other.residual_mean, other.residual_m2
+            )
+        else:
+            self.y_mean, self.y_m2 = other.y_mean, other.y_m2
+            self.residual_mean, self.residual_m2 = other.residual_mean, other.residual_m2
+
+        self.abs_error_sum += other.abs_error_sum
+        self.pct_error_sum += other.pct_error_sum
+        self.max_error = max(self.max_error, other.max_error)
+        self.within_10pct += other.within_10pct
+        self.within_20pct += other.within_20pct
+        self.abs_error_sketch.merge(other.abs_error_sketch)
+        self.count += other.count
+
+        return self
+
+    def compute(self) -> Dict[str, float]:
+        """
+        Compute metrics from the accumulated statistics.
+
+        Returns:
+            Dictionary of metrics (mae, rmse, mse, r2, mape, max_error,
+            median_error, std_error)
+
+        Raises:
+            ValueError: If no samples have been accumulated
+        """
+        if self.count == 0:
+            raise ValueError("No predictions accumulated")
+
+        n = self.count
+        sse = self.residual_m2 + n * self.residual_mean ** 2
+        mse = sse / n
+
+        # R² follows sklearn for constant targets
+        if self.y_m2 > 0:
+            r2 = 1.0 - sse / self.y_m2
+        else:
+            r2 = 1.0 if sse == 0 else 0.0
+
+        return {
+            'mae': float(self.abs_error_sum / n),
+            'rmse': float(math.sqrt(mse)),
+            'mse': float(mse),
+            'r2': float(r2),
+            'mape': float(self.pct_error_sum / n * 100),
+            'max_error': float(self.max_error),
+            'median_error': self.abs_error_sketch.quantile(0.5),
+            'std_error': float(math.sqrt(self.residual_m2 / n)),
+        }
+
+    def compute_detailed(self, confidence_level: float = 0.95) -> Dict[str, Any]:
+        """
+        Compute metrics plus residual statistics and a confidence interval.
+
+        Args:
+            confidence_level: Confidence level of the residual mean interval
+
+        Returns:
+            Dictionary of detailed metrics
+        """
+        from scipy import stats
+
+        metrics = self.compute()
+        n = self.count
+
+        residual_std = math.sqrt(self.residual_m2 / n)
+
+        # Standard error of the residual mean (ddof=1, as scipy.stats.sem)
+        if n > 1:
+            se = math.sqrt(self.residual_m2 / (n - 1)) / math.sqrt(n)
+            ci = float(stats.t.ppf((1 + confidence_level) / 2, n - 1) * se)
+        else:
+            ci = float('nan')
+
+        metrics.update({
+            'residual_mean': float(self.residual_mean),
+            'residual_std': float(residual_std),
+            'confidence_interval': ci,
+            'within_10pct': float(self.within_10pct / n * 100),
+            'within_20pct': float(self.within_20pct / n * 100),
+        })
+
+        return metrics
+
+    def __len__(self) -> int:
+        return self.count
+
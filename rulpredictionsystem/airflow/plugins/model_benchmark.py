@@ -0,0 +1,294 @@
+"""
+Inference Latency Benchmarks for RUL Models
+
+This module provides utility functions for:
+- Measuring per-batch prediction latency at several batch sizes
+- Summarizing latency distributions as percentiles
+- Benchmark cards: a standardized harness run in a fresh process that
+  records p50/p95/p99 latency at batch sizes 1, 8, 64 and 512, load time,
+  peak RSS and file size of a model artifact
+- Checking a candidate's card against a baseline's latency budget
+
+Author: RUL Prediction System
+Version: 1.0.0
+"""
+
+import os
+import json
+import time
+import platform
+import logging
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Sequence
+
+import numpy as np
+
+from .worker_pool import spawn_pool, set_worker_threads
+
+logger = logging.getLogger(__name__)
+
+
+# Default benchmark settings
+DEFAULT_BATCH_SIZES = (1, 64)
+DEFAULT_REPEATS = 20
+DEFAULT_WARMUP = 3
+
+# Benchmark card settings
+CARD_BATCH_SIZES = (1, 8, 64, 512)
+CARD_REPEATS = 100  # Enough timings for a meaningful p99
+CARD_SAMPLES = 512  # Feature rows the batches are drawn from
+
+
+def benchmark_latency(
+    model: Any,
+    X: np.ndarray,
+    batch_sizes: Sequence[int] = DEFAULT_BATCH_SIZES,
+    n_repeats: int = DEFAULT_REPEATS,
+    n_warmup: int = DEFAULT_WARMUP
+) -> Dict[str, Dict[str, float]]:
+    """
+    Benchmark model.predict latency at several batch sizes.
+
+    Batches are drawn cyclically from X so any sample size works.
+
+    Args:
+        model: Model with a predict(X) method
+        X: Sample feature array
+        batch_sizes: Batch sizes to benchmark
+        n_repeats: Timed predictions per batch size
+        n_warmup: Untimed predictions before timing
+
+    Returns:
+        Latency percentiles (p50, p95, p99) and mean in milliseconds and
+        throughput, keyed by 'batch_<size>'
+    """
+    results = {}
+
+    for batch_size in batch_sizes:
+        rows = np.arange(batch_size) % len(X)
+        batch = np.asarray(X[rows], dtype=np.float32)
+
+        for _ in range(n_warmup):
+            model.predict(batch)
+
+        timings = []
+        for _ in range(n_repeats):
+            start = time.perf_counter()
+            model.predict(batch)
+            timings.append((time.perf_counter() - start) * 1000)
+
+        timings = np.asarray(timings)
+        results[f'batch_{batch_size}'] = {
+            'p50_ms': round(float(np.percentile(timings, 50)), 4),
+            'p95_ms': round(float(np.percentile(timings, 95)), 4),
+            'p99_ms': round(float(np.percentile(timings, 99)), 4),
+            'mean_ms': round(float(timings.mean()), 4),
+            'samples_per_second': round(batch_size * 1000 / float(timings.mean()), 2),
+        }
+
+    logger.info(f"Latency benchmark: {results}")
+
+    return results
+
+
+# ============================================================================
+# Benchmark Cards
+# ============================================================================
+
+def hardware_fingerprint(n_threads: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Machine a benchmark ran on; cards are only comparable on equal hardware.
+    """
+    return {
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'n_threads': n_threads or os.cpu_count(),
+        'python': platform.python_version(),
+    }
+
+
+def _benchmark_card_worker(
+    model_path: str,
+    features_path: str,
+    batch_sizes: Sequence[int],
+    n_repeats: int,
+    n_warmup: int
+) -> Dict[str, Any]:
+    """
+    Load and benchmark one model (in a fresh worker process).
+    """
+    from .model_utils import load_model
+    from .training_profiler import get_peak_rss_mb
+
+    X = np.load(features_path, mmap_mode='r')
+    X_sample = np.asarray(X[:CARD_SAMPLES], dtype=np.float32)
+
+    baseline_rss_mb = get_peak_rss_mb()
+
+    start_time = time.perf_counter()
+    model = load_model(model_path, use_cache=False)
+    load_seconds = time.perf_counter() - start_time
+
+    latency = benchmark_latency(model, X_sample, batch_sizes, n_repeats, n_warmup)
+    peak_rss_mb = get_peak_rss_mb()
+
+    return {
+        'load_seconds': round(load_seconds, 4),
+        'peak_rss_mb': round(peak_rss_mb, 2),
+        'model_rss_mb': round(peak_rss_mb - baseline_rss_mb, 2),
+        'latency': latency,
+    }
+
+
+def benchmark_card(
+    model_path: str,
+    features_path: str,
+    batch_sizes: Sequence[int] = CARD_BATCH_SIZES,
+    n_repeats: int = CARD_REPEATS,
+    n_warmup: int = DEFAULT_WARMUP,
+    n_threads: Optional[int] = None,
+    isolated: bool = True
+) -> Dict[str, Any]:
+    """
+    Produce the benchmark card of a model artifact.
+
+    The model is loaded and benchmarked in a fresh spawned process, so load
+    time and peak RSS are not affected by what the caller has already
+    loaded, and every model is measured under the same conditions.
+
+    Args:
+        model_path: Path to the model artifact
+        features_path: Feature array (.npy) the benchmark batches are drawn from
+        batch_sizes: Batch sizes to benchmark
+        n_repeats: Timed predictions per batch size
+        n_warmup: Untimed predictions before timing
+        n_threads: Framework threads in the worker (defaults to all CPUs)
+        isolated: Run in a fresh process (in-process runs are only for
+            quick checks; their RSS includes the caller's memory)
+
+    Returns:
+        Benchmark card: file_size_mb, load_seconds, peak_rss_mb,
+        model_rss_mb, latency per batch size, hardware and settings
+    """
+    n_threads = n_threads or os.cpu_count() or 1
+    args = (model_path, features_path, tuple(batch_sizes), n_repeats, n_warmup)
+
+    if isolated:
+        with spawn_pool(1, n_threads) as executor:
+            card = executor.submit(_benchmark_card_worker, *args).result()
+    else:
+        set_worker_threads(n_threads)
+        card = _benchmark_card_worker(*args)
+
+    card.update({
+        'model_path': model_path,
+        'file_size_mb': round(os.path.getsize(model_path) / (1024 * 1024), 4),
+        'batch_sizes': list(batch_sizes),
+        'n_repeats': n_repeats,
+        'isolated': isolated,
+        'hardware': hardware_fingerprint(n_threads),
+        'created_at': datetime.now().isoformat(),
+    })
+
+    logger.info(
+        f"Benchmark card for {model_path}: load {card['load_seconds']}s, "
+        f"peak RSS {card['peak_rss_mb']} MB, "
+        f"p99 {[card['latency'][key]['p99_ms'] for key in card['latency']]} ms"
+    )
+
+    return card
+
+
+def record_benchmark_card(model_path: str, card: Dict[str, Any]) -> None:
+    """
+    Store a benchmark card in the model's metadata file.
+    """
+    from .artifact_checksum import metadata_path_for
+    from .artifact_store import write_json_atomic
+
+    metadata_path = metadata_path_for(model_path)
+    metadata = {}
+    if os.path.exists(metadata_path):
+        with open(metadata_path) as f:
+            metadata = json.load(f)
+
+    metadata['benchmark'] = card
+    write_json_atomic(metadata_path, metadata)
+
+
+def load_benchmark_card(model_path: str) -> Optional[Dict[str, Any]]:
+    """Benchmark card stored in a model's metadata, if any"""
+    from .artifact_checksum import metadata_path_for
+
+    metadata_path = metadata_path_for(model_path)
+    if not os.path.exists(metadata_path):
+        return None
+
+    with open(metadata_path) as f:
+        return json.load(f).get('benchmark')
+
+
+def cards_comparable(card: Optional[Dict[str, Any]], baseline: Optional[Dict[str, Any]]) -> bool:
+    """Whether two benchmark cards were measured on the same hardware and settings"""
+    return (
+        card is not None and baseline is not None
+        and card.get('hardware') == baseline.get('hardware')
+        and card.get('isolated') == baseline.get('isolated')
+    )
+
+
+def check_latency_budget(
+    card: Dict[str, Any],
+    baseline: Optional[Dict[str, Any]],
+    thresholds: Dict[str, float]
+) -> Dict[str, Any]:
+    """
+    Check a candidate's benchmark card against latency thresholds.
+
+    Thresholds:
+        max_p99_regression: Maximum ratio of the candidate's p99 latency to
+            the baseline's, at every batch size both cards measured
+        max_p99_ms: Maximum absolute p99 latency at batch size 1
+
+    Args:
+        card: Candidate benchmark card
+        baseline: Baseline (production) benchmark card, if any
+        thresholds: Latency thresholds (missing thresholds are not checked)
+
+    Returns:
+        within_budget, reasons and the p99 ratio per batch size
+    """
+    reasons: List[str] = []
+    p99_ratios = {}
+
+    max_regression = thresholds.get('max_p99_regression')
+    if baseline is not None and max_regression is not None:
+        for key, latency in card['latency'].items():
+            baseline_latency = baseline['latency'].get(key)
+            if not baseline_latency or baseline_latency['p99_ms'] <= 0:
+                continue
+
+            ratio = latency['p99_ms'] / baseline_latency['p99_ms']
+            p99_ratios[key] = round(ratio, 3)
+
+            if ratio > max_regression:
+                reasons.append(
+                    f"p99 latency at {key.replace('_', ' size ')} ({latency['p99_ms']:.3f} ms) is "
+                    f"{ratio:.2f}x production ({baseline_latency['p99_ms']:.3f} ms) "
+                    f"and does not meet the latency budget (max {max_regression:.2f}x)"
+                )
+
+    max_p99_ms = thresholds.get('max_p99_ms')
+    single = card['latency'].get('batch_1')
+    if max_p99_ms is not None and single is not None and single['p99_ms'] > max_p99_ms:
+        reasons.append(
+            f"p99 latency at batch size 1 ({single['p99_ms']:.3f} ms) "
+            f"does not meet the latency budget ({max_p99_ms:.3f} ms)"
+        )
+
+    return {
+        'within_budget': not reasons,
+        'reasons': reasons,
+        'p99_ratios': p99_ratios,
+    }
@@ -0,0 +1,236 @@
+"""
+In-Process Model Cache
+
+This module provides a thread-safe LRU cache of loaded models, so long-lived
+processes (evaluation workers, serving) deserialize each model artifact
+only once:
+- Entries are keyed by artifact identity: (path, size, mtime) and,
+  optionally, the content hash
+- Eviction is least-recently-used, bounded by estimated model memory
+- Models are warmed with a dummy prediction when first loaded
+- Hit, miss and eviction counts are exposed through stats()
+
+Author: RUL Prediction System
+Version: 1.0.0
+"""
+
+import os
+import time
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Callable, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+# Default memory budget of the cache
+DEFAULT_CACHE_MEMORY_MB = 2048
+
+CacheKey = Tuple[str, int, int, Optional[str]]
+
+
+def estimate_model_memory_bytes(model: Any, model_path: str) -> int:
+    """
+    Estimate the memory held by a loaded model.
+
+    Uses parameter and buffer sizes for PyTorch modules; the artifact size
+    is the lower bound for every model type.
+
+    Args:
+        model: Loaded model
+        model_path: Path the model was loaded from
+
+    Returns:
+        Estimated size in bytes
+    """
+    estimate = os.path.getsize(model_path)
+
+    if hasattr(model, 'parameters') and hasattr(model, 'buffers'):
+        tensor_bytes = sum(
+            tensor.numel() * tensor.element_size()
+            for tensors in (model.parameters(), model.buffers())
+            for tensor in tensors
+        )
+        estimate = max(estimate, tensor_bytes)
+
+    return int(estimate)
+
+
+def _warmup_input(model: Any) -> Optional['np.ndarray']:
+    """Single-row dummy input for a model, if its input width is known"""
+    import numpy as np
+
+    if hasattr(model, 'feature_mean'):
+        n_features = int(model.feature_mean.shape[-1])
+    elif hasattr(model, 'n_features_in_'):
+        n_features = int(model.n_features_in_)
+    elif getattr(model, 'input_shape', None) is not None:
+        shape = [dim or 1 for dim in model.input_shape[1:]]
+        return np.zeros([1] + shape, dtype=np.float32)
+    else:
+        return None
+
+    return np.zeros((1, n_features), dtype=np.float32)
+
+
+def warm_up_model(model: Any) -> bool:
+    """
+    Run a dummy prediction so lazy initialization happens before first use.
+
+    Returns:
+        True if the model was warmed up
+    """
+    dummy = _warmup_input(model)
+    if dummy is None or not hasattr(model, 'predict'):
+        return False
+
+    try:
+        model.predict(dummy)
+        return True
+    except Exception as e:
+        logger.warning(f"Model warm-up failed: {str(e)}")
+        return False
+
+
+class ModelCache:
+    """
+    Thread-safe LRU cache of loaded models bounded by estimated memory.
+
+    Concurrent requests for the same artifact load it once; other callers
+    wait for that load instead of deserializing the model again. A model
+    larger than the budget is still cached, as the only entry.
+    """
+
+    def __init__(self, max_memory_mb: float = DEFAULT_CACHE_MEMORY_MB):
+        self.max_memory_bytes = int(max_memory_mb * 1024 * 1024)
+        self._entries: 'OrderedDict[CacheKey, Dict[str, Any]]' = OrderedDict()
+        self._load_locks: Dict[CacheKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.memory_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def artifact_key(model_path: str, verify_content: bool = False) -> CacheKey:
+        """
+        Identity of a model artifact: (path, size, mtime, content hash or None).
+        """
+        from .artifact_checksum import file_content_hash
+
+        stat = os.stat(model_path)
+        content_hash = file_content_hash(model_path) if verify_content else None
+
+        return (os.path.abspath(model_path), stat.st_size, stat.st_mtime_ns, content_hash)
+
+    def get(
+        self,
+        model_path: str,
+        loader: Callable[[str], Any],
+        verify_content: bool = False,
+        warm_up: bool = True
+    ) -> Any:
+        """
+        Get a loaded model, loading it with loader on a miss.
+
+        Args:
+            model_path: Path to the model artifact
+            loader: Loads a model from a path
+            verify_content: Include the artifact's content hash in the key
+            warm_up: Run a dummy prediction after loading
+
+        Returns:
+            Loaded model (shared between callers)
+        """
+        key = self.artifact_key(model_path, verify_content)
+
+        with self._lock:
+            model = self._lookup(key)
+            if model is not None:
+                return model
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        with load_lock:
+            # Another thread may have loaded the artifact meanwhile
+            with self._lock:
+                model = self._lookup(key)
+                if model is not None:
+                    return model
+
+            start_time = time.perf_counter()
+            model = loader(model_path)
+            warmed_up = warm_up and warm_up_model(model)
+            load_seconds = time.perf_counter() - start_time
+
+            size = estimate_model_memory_bytes(model, model_path)
+
+            with self._lock:
+                self.misses += 1
+                self._insert(key, model, size)
+                self._load_locks.pop(key, None)
+
+        logger.info(
+            f"Model cache miss for {model_path}: loaded in {load_seconds:.3f}s "
+            f"({size / 1024 / 1024:.1f} MB, warmed up: {warmed_up})"
+        )
+
+        return model
+
+    def _lookup(self, key: CacheKey) -> Optional[Any]:
+        """Cached model for key, marked as most recently used (lock held)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+
+        return entry['model']
+
+    def _insert(self, key: CacheKey, model: Any, size: int) -> None:
+        """Insert an entry and evict to the memory budget (lock held)"""
+        # Older versions of the same artifact path are never used again
+        for stale_key in [k for k in self._entries if k[0] == key[0]]:
+            self._remove(stale_key)
+
+        self._entries[key] = {'model': model, 'size': size}
+        self.memory_bytes += size
+
+        while self.memory_bytes > self.max_memory_bytes and len(self._entries) > 1:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _remove(self, key: CacheKey) -> None:
+        """Remove an entry (lock held)"""
+        entry = self._entries.pop(key)
+        self.memory_bytes -= entry['size']
+
+    def clear(self) -> None:
+        """Remove all cached models"""
+        with self._lock:
+            self._entries.clear()
+            self.memory_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Cache statistics: hits, misses, evictions, hit_rate, entries,
+        memory_mb and max_memory_mb.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'entries': len(self._entries),
+                'memory_mb': round(self.memory_bytes / 1024 / 1024, 2),
+                'max_memory_mb': round(self.max_memory_bytes / 1024 / 1024, 2),
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
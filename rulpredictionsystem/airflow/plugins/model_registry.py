@@ -0,0 +1,382 @@
+"""
+Model Registry over the RUL Database
+
+This module records every trained model artifact in the models table, so
+pipelines look models up by status instead of probing directories:
+- Models are identified by the SHA-256 of their artifact; the version is
+  its first 12 hex digits (as used for feature importance records)
+- A model moves from candidate to evaluated or rejected when it is
+  evaluated, and to production (archiving the previous one) when promoted
+- "Newest unevaluated candidate" and "current production model" are
+  answered by partial indexes on (model_name, status)
+- The training run that produced a model is linked through
+  training_runs.model_id
+
+Author: RUL Prediction System
+Version: 1.0.0
+"""
+
+import os
+import json
+import logging
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# Registered model name of the RUL model
+DEFAULT_MODEL_NAME = os.getenv('RUL_MODEL_NAME', 'rul_cnn_lstm')
+
+# Number of content hash digits used as the model version
+VERSION_LENGTH = 12
+
+# Lifecycle of a registered model
+MODEL_STATUSES = ('candidate', 'evaluated', 'rejected', 'production', 'archived')
+
+# Metrics stored in their own columns (all metrics are kept in the metrics JSONB)
+METRIC_COLUMNS = ('accuracy', 'mae', 'rmse', 'r2_score')
+
+MODEL_COLUMNS = (
+    'model_name', 'model_version', 'algorithm', 'hyperparameters', 'training_date',
+    'accuracy', 'mae', 'rmse', 'r2_score', 'metrics', 'model_path', 'content_hash',
+    'benchmark', 'status', 'created_at', 'evaluated_at', 'promoted_at', 'release_id',
+)
+
+
+def model_version_for(content_hash: str) -> str:
+    """Model version of an artifact content hash"""
+    return content_hash[:VERSION_LENGTH]
+
+
+def _metric_values(metrics: Dict[str, Any]) -> List[Optional[float]]:
+    """Values of the metric columns (r2 is accepted for r2_score)"""
+    values = []
+    for column in METRIC_COLUMNS:
+        value = metrics.get(column)
+        if value is None and column == 'r2_score':
+            value = metrics.get('r2')
+        values.append(float(value) if isinstance(value, (int, float)) else None)
+
+    return values
+
+
+def _json_metrics(metrics: Dict[str, Any]) -> str:
+    """Scalar metrics as a JSON document"""
+    return json.dumps({
+        key: value for key, value in metrics.items()
+        if isinstance(value, (int, float, str, bool))
+    })
+
+
+class ModelRegistry:
+    """
+    Registry of trained models in the models table.
+
+    Args:
+        postgres_conn_id: Airflow connection ID of the RUL database
+        model_name: Registered model name
+        hook: Optional database hook (a PostgresHook is created on first use)
+    """
+
+    def __init__(
+        self,
+        postgres_conn_id: str = 'postgres_default',
+        model_name: str = DEFAULT_MODEL_NAME,
+        hook: Optional[Any] = None
+    ):
+        self.postgres_conn_id = postgres_conn_id
+        self.model_name = model_name
+        self._hook = hook
+
+    @property
+    def hook(self) -> Any:
+        if self._hook is None:
+            from airflow.providers.postgres.hooks.postgres import PostgresHook
+
+            self._hook = PostgresHook(postgres_conn_id=self.postgres_conn_id)
+
+        return self._hook
+
+    def _execute(self, statements: List[Tuple[str, tuple]]) -> List[List[Dict[str, Any]]]:
+        """
+        Run statements in one transaction.
+
+        Returns:
+            Rows returned by each statement, as dicts
+        """
+        conn = self.hook.get_conn()
+        results = []
+
+        try:
+            with conn.cursor() as cursor:
+                for sql, parameters in statements:
+                    cursor.execute(sql, parameters)
+
+                    if cursor.description:
+                        columns = [column[0] for column in cursor.description]
+                        results.append([dict(zip(columns, row)) for row in cursor.fetchall()])
+                    else:
+                        results.append([])
+
+            conn.commit()
+
+        except Exception:
+            conn.rollback()
+            raise
+
+        finally:
+            conn.close()
+
+        return results
+
+    def _query(self, where: str, parameters: tuple, limit: int) -> List[Dict[str, Any]]:
+        """Model rows matching a condition on this model name, newest first"""
+        return self._execute([(
+            f"""
+            SELECT {', '.join(MODEL_COLUMNS)}
+            FROM models
+            WHERE model_name = %s AND {where}
+            ORDER BY created_at DESC
+            LIMIT %s
+            """,
+            (self.model_name,) + parameters + (limit,),
+        )])[0]
+
+    def _query_one(self, where: str, parameters: tuple) -> Optional[Dict[str, Any]]:
+        """First model row matching a condition on this model name"""
+        rows = self._query(where, parameters, 1)
+
+        return rows[0] if rows else None
+
+    def register_model(
+        self,
+        model_path: str,
+        metrics: Optional[Dict[str, Any]] = None,
+        algorithm: Optional[str] = None,
+        hyperparameters: Optional[Dict[str, Any]] = None,
+        run_id: Optional[str] = None,
+        content_hash: Optional[str] = None,
+        status: str = 'candidate',
+        training_date: Optional[datetime] = None,
+        benchmark: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Register a model artifact.
+
+        Registering the same content again (task retries, promotion of a
+        registered model) updates its path and merges its metrics; the
+        status of an existing model is not changed.
+
+        Args:
+            model_path: Path to the model artifact
+            metrics: Model metrics
+            algorithm: Model type
+            hyperparameters: Training hyperparameters
+            run_id: Training run to link the model to
+            content_hash: SHA-256 of the artifact, if already known
+            status: Status of a newly registered model
+            training_date: Training time (defaults to the artifact's mtime)
+            benchmark: Benchmark card (see plugins.model_benchmark.benchmark_card)
+
+        Returns:
+            Registered model (model_version, content_hash, status)
+        """
+        from .artifact_checksum import file_content_hash
+
+        if status not in MODEL_STATUSES:
+            raise ValueError(f"Unknown model status: {status}")
+
+        metrics = metrics or {}
+        content_hash = content_hash or file_content_hash(model_path)
+        model_version = model_version_for(content_hash)
+
+        if training_date is None:
+            training_date = datetime.fromtimestamp(os.path.getmtime(model_path))
+
+        statements = [(
+            """
+            INSERT INTO models (
+                model_name, model_version, algorithm, hyperparameters, training_date,
+                accuracy, mae, rmse, r2_score, metrics, model_path, content_hash,
+                benchmark, status
+            )
+            VALUES (%s, %s, %s, %s::jsonb, %s, %s, %s, %s, %s, %s::jsonb, %s, %s, %s::jsonb, %s)
+            ON CONFLICT (model_name, model_version) DO UPDATE SET
+                algorithm = COALESCE(EXCLUDED.algorithm, models.algorithm),
+                hyperparameters = COALESCE(EXCLUDED.hyperparameters, models.hyperparameters),
+                accuracy = COALESCE(EXCLUDED.accuracy, models.accuracy),
+                mae = COALESCE(EXCLUDED.mae, models.mae),
+                rmse = COALESCE(EXCLUDED.rmse, models.rmse),
+                r2_score = COALESCE(EXCLUDED.r2_score, models.r2_score),
+                metrics = COALESCE(models.metrics, '{}'::jsonb) || EXCLUDED.metrics,
+                model_path = EXCLUDED.model_path,
+                content_hash = EXCLUDED.content_hash,
+                benchmark = COALESCE(EXCLUDED.benchmark, models.benchmark)
+            RETURNING id, status
+            """,
+            (
+                self.model_name,
+                model_version,
+                algorithm,
+                json.dumps(hyperparameters) if hyperparameters is not None else None,
+                training_date,
+                *_metric_values(metrics),
+                _json_metrics(metrics),
+                model_path,
+                content_hash,
+                json.dumps(benchmark) if benchmark is not None else None,
+                status,
+            ),
+        )]
+
+        if run_id:
+            statements.append((
+                """
+                UPDATE training_runs SET model_id = models.id
+                FROM models
+                WHERE training_runs.run_id = %s
+                  AND models.model_name = %s AND models.model_version = %s
+                """,
+                (run_id, self.model_name, model_version),
+            ))
+
+        row = self._execute(statements)[0][0]
+
+        logger.info(
+            f"Registered model {self.model_name} {model_version} "
+            f"({row['status']}) from {model_path}"
+        )
+
+        return {
+            'model_name': self.model_name,
+            'model_version': model_version,
+            'content_hash': content_hash,
+            'model_path': model_path,
+            'status': row['status'],
+        }
+
+    def get_model(self, model_version: str) -> Optional[Dict[str, Any]]:
+        """Registered model by version"""
+        return self._query_one('model_version = %s', (model_version,))
+
+    def newest_candidate(self) -> Optional[Dict[str, Any]]:
+        """
+        Most recently registered model that has not been evaluated.
+
+        Served by the partial index idx_models_candidates.
+        """
+        return self._query_one("status = 'candidate'", ())
+
+    def candidates(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Registered models that have not been evaluated, newest first.
+
+        Served by the partial index idx_models_candidates.
+        """
+        return self._query("status = 'candidate'", (), limit)
+
+    def production_model(self) -> Optional[Dict[str, Any]]:
+        """
+        Current production model.
+
+        Served by the unique partial index idx_models_production.
+        """
+        return self._query_one("status = 'production'", ())
+
+    def mark_evaluated(
+        self,
+        model_version: str,
+        metrics: Optional[Dict[str, Any]] = None,
+        status: str = 'evaluated'
+    ) -> bool:
+        """
+        Record the evaluation of a candidate.
+
+        Production and archived models keep their status; their metrics
+        are still updated.
+
+        Args:
+            model_version: Evaluated model
+            metrics: Evaluation metrics
+            status: 'evaluated' or 'rejected'
+
+        Returns:
+            True if the model is registered
+        """
+        if status not in ('evaluated', 'rejected'):
+            raise ValueError(f"Invalid evaluation status: {status}")
+
+        metrics = metrics or {}
+
+        rows = self._execute([(
+            """
+            UPDATE models SET
+                status = CASE WHEN status IN ('production', 'archived')
+                    THEN status ELSE %s END,
+                accuracy = COALESCE(%s, accuracy),
+                mae = COALESCE(%s, mae),
+                rmse = COALESCE(%s, rmse),
+                r2_score = COALESCE(%s, r2_score),
+                metrics = COALESCE(metrics, '{}'::jsonb) || %s::jsonb,
+                evaluated_at = NOW()
+            WHERE model_name = %s AND model_version = %s
+            RETURNING status
+            """,
+            (status, *_metric_values(metrics), _json_metrics(metrics),
+             self.model_name, model_version),
+        )])[0]
+
+        if rows:
+            logger.info(f"Model {model_version} evaluated: {rows[0]['status']}")
+        else:
+            logger.warning(f"Evaluated model {model_version} is not registered")
+
+        return bool(rows)
+
+    def set_production(self, model_version: str, release_id: Optional[str] = None) -> None:
+        """
+        Make a registered model the production model.
+
+        The previous production model is archived in the same transaction,
+        so there is exactly one production model at any time.
+
+        Args:
+            model_version: Model to promote
+            release_id: Release the model is served from
+
+        Raises:
+            ValueError: If the model is not registered
+        """
+        conn = self.hook.get_conn()
+
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    """
+                    UPDATE models SET status = 'archived'
+                    WHERE model_name = %s AND status = 'production' AND model_version <> %s
+                    """,
+                    (self.model_name, model_version),
+                )
+                cursor.execute(
+                    """
+                    UPDATE models SET status = 'production', promoted_at = NOW(), release_id = %s
+                    WHERE model_name = %s AND model_version = %s
+                    """,
+                    (release_id, self.model_name, model_version),
+                )
+
+                if cursor.rowcount == 0:
+                    raise ValueError(f"Model {model_version} is not registered")
+
+            conn.commit()
+
+        except Exception:
+            conn.rollback()
+            raise
+
+        finally:
+            conn.close()
+
+        logger.info(f"Model {model_version} is now in production (release {release_id})")
@@ -15,38 +15,106 @@ Version: 1.0.0
 
 import os
 import json
+import math
 import shutil
 import logging
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, TYPE_CHECKING
 from datetime import datetime
-import numpy as np
-import pandas as pd
+
+# Numerical and ML libraries are imported on first use: DAG files import
+# this module and are parsed by the scheduler far more often than tasks run
+if TYPE_CHECKING:
+    import numpy as np
+
+from .model_cache import ModelCache, DEFAULT_CACHE_MEMORY_MB
+from .artifact_checksum import (
+    VERIFY_ON_LOAD,
+    ArtifactIntegrityError,
+    artifact_checksum,
+    metadata_path_for,
+    verify_artifact,
+)
+from .artifact_store import ArtifactStore, write_json_atomic
+from .releases import (
+    current_release,
+    publish_release,
+    activate_release,
+    rollback_release,
+    releases_dir_for,
+)
 
 logger = logging.getLogger(__name__)
 
+# Model artifact file names, in lookup order
+MODEL_FILE_NAMES = ['model.h5', 'model.keras', 'model.pt', 'model.pkl']
+
+# Optional serving variants derived from the main model artifact
+MODEL_VARIANT_FILE_NAMES = ['model_int8.pt', 'student.pt', 'model.onnx']
+
+# Process-wide cache of loaded models (see load_model)
+MODEL_CACHE = ModelCache(
+    max_memory_mb=float(os.getenv('RUL_MODEL_CACHE_MB', DEFAULT_CACHE_MEMORY_MB))
+)
+
 
 # ============================================================================
 # Model Loading and Saving
 # ============================================================================
 
-def load_model(model_path: str) -> Any:
+def load_model(
+    model_path: str,
+    use_cache: bool = True,
+    verify_content: bool = False,
+    verify_checksum: bool = VERIFY_ON_LOAD
+) -> Any:
     """
     Load a trained model from disk.
 
+    Loaded models are kept in the process-wide MODEL_CACHE, keyed by the
+    artifact's path, size and mtime, so repeated loads in long-lived
+    processes are served from memory. The cached model is shared between
+    callers and must not be modified in place.
+
     Args:
         model_path: Path to the model file
+        use_cache: Serve the model from MODEL_CACHE
+        verify_content: Also key the cache on the artifact's content hash
+        verify_checksum: Verify the artifact against the checksum in its
+            metadata before deserializing it
 
     Returns:
         Loaded model object
 
     Raises:
         FileNotFoundError: If model file doesn't exist
+        ArtifactIntegrityError: If the model doesn't match its checksum
     """
-    logger.info(f"Loading model from: {model_path}")
-
     if not os.path.exists(model_path):
         raise FileNotFoundError(f"Model file not found: {model_path}")
 
+    loader = _load_verified_model_file if verify_checksum else _load_model_file
+
+    if use_cache:
+        return MODEL_CACHE.get(model_path, loader, verify_content=verify_content)
+
+    return loader(model_path)
+
+
+def _load_verified_model_file(model_path: str) -> Any:
+    """
+    Verify a model file against its recorded checksum and deserialize it.
+    """
+    verify_artifact(model_path)
+
+    return _load_model_file(model_path)
+
+
+def _load_model_file(model_path: str) -> Any:
+    """
+    Deserialize a model file with its framework.
+    """
+    logger.info(f"Loading model from: {model_path}")
+
     try:
         # For TensorFlow/Keras models
         if model_path.endswith('.h5') or model_path.endswith('.keras'):
@@ -56,13 +124,18 @@ def load_model(model_path: str) -> Any:
         # For PyTorch models
         elif model_path.endswith('.pt') or model_path.endswith('.pth'):
             import torch
-            model = torch.load(model_path)
+            model = torch.load(model_path, weights_only=False)
 
         # For scikit-learn models
         elif model_path.endswith('.pkl'):
             import joblib
             model = joblib.load(model_path)
 
+        # For ONNX models (ONNX Runtime session with the same predict interface)
+        elif model_path.endswith('.onnx'):
+            from .onnx_export import OnnxModel
+            model = OnnxModel(model_path)
+
         else:
             raise ValueError(f"Unsupported model format: {model_path}")
 
@@ -78,6 +151,9 @@ def save_model(model: Any, model_path: str, metadata: Optional[Dict] = None) ->
     """
     Save a trained model to disk.
 
+    The model's checksum is stored in its metadata file
+    (model.pt -> model_metadata.json), so loads and promotions can verify it.
+
     Args:
         model: Model object to save
         model_path: Path to save the model
@@ -93,24 +169,21 @@ def save_model(model: Any, model_path: str, metadata: Optional[Dict] = None) ->
         if hasattr(model, 'save'):
             model.save(model_path)
 
-        # For PyTorch models
+        # For PyTorch models (full module, so load_model can restore it)
         elif hasattr(model, 'state_dict'):
             import torch
-            torch.save(model.state_dict(), model_path)
+            torch.save(model, model_path)
 
         # For scikit-learn models
         else:
             import joblib
             joblib.dump(model, model_path)
 
-        # Save metadata
-        if metadata:
-            metadata_path = model_path.replace('.h5', '_metadata.json')
-            metadata_path = metadata_path.replace('.pt', '_metadata.json')
-            metadata_path = metadata_path.replace('.pkl', '_metadata.json')
-
-            with open(metadata_path, 'w') as f:
-                json.dump(metadata, f, indent=2)
+        # Save metadata with the artifact's checksum
+        write_json_atomic(
+            metadata_path_for(model_path),
+            {**(metadata or {}), 'checksum': artifact_checksum(model_path)}
+        )
 
         logger.info(f"Model saved successfully")
 
@@ -119,11 +192,29 @@ def save_model(model: Any, model_path: str, metadata: Optional[Dict] = None) ->
         raise
 
 
+def find_model_file(model_dir: str) -> Optional[str]:
+    """
+    Find the model artifact in a model directory.
+
+    Args:
+        model_dir: Model directory (e.g. staging or production)
+
+    Returns:
+        Path to the first model file found, or None
+    """
+    for file_name in MODEL_FILE_NAMES:
+        model_path = os.path.join(model_dir, file_name)
+        if os.path.exists(model_path):
+            return model_path
+
+    return None
+
+
 # ============================================================================
 # Metric Calculation
 # ============================================================================
 
-def calculate_metrics(y_true: np.ndarray, y_pred: np.ndarray) -> Dict[str, float]:
+def calculate_metrics(y_true: 'np.ndarray', y_pred: 'np.ndarray') -> Dict[str, float]:
     """
     Calculate comprehensive performance metrics.
 
@@ -134,32 +225,9 @@ def calculate_metrics(y_true: np.ndarray, y_pred: np.ndarray) -> Dict[str, float
     Returns:
         Dictionary of metrics
     """
-    from sklearn.metrics import (
-        mean_absolute_error,
-        mean_squared_error,
-        r2_score,
-        mean_absolute_percentage_error
-    )
+    from .metrics import MetricsAccumulator
 
-    # Flatten arrays if needed
-    y_true = y_true.flatten()
-    y_pred = y_pred.flatten()
-
-    # Calculate metrics
-    metrics = {
-        'mae': float(mean_absolute_error(y_true, y_pred)),
-        'rmse': float(np.sqrt(mean_squared_error(y_true, y_pred))),
-        'mse': float(mean_squared_error(y_true, y_pred)),
-        'r2': float(r2_score(y_true, y_pred)),
-        'mape': float(mean_absolute_percentage_error(y_true, y_pred) * 100),
-    }
-
-    # Additional custom metrics
-    metrics.update({
-        'max_error': float(np.max(np.abs(y_true - y_pred))),
-        'median_error': float(np.median(np.abs(y_true - y_pred))),
-        'std_error': float(np.std(y_true - y_pred)),
-    })
+    metrics = MetricsAccumulator().update(y_true, y_pred).compute()
 
     logger.info(f"Calculated metrics: {metrics}")
 
@@ -167,8 +235,8 @@ def calculate_metrics(y_true: np.ndarray, y_pred: np.ndarray) -> Dict[str, float
 
 
 def calculate_regression_metrics(
-    y_true: np.ndarray,
-    y_pred: np.ndarray,
+    y_true: 'np.ndarray',
+    y_pred: 'np.ndarray',
     confidence_level: float = 0.95
 ) -> Dict[str, Any]:
     """
@@ -182,28 +250,11 @@ def calculate_regression_metrics(
     Returns:
         Dictionary of detailed metrics
     """
-    from scipy import stats
+    from .metrics import MetricsAccumulator
 
-    # Basic metrics
-    metrics = calculate_metrics(y_true, y_pred)
+    metrics = MetricsAccumulator().update(y_true, y_pred).compute_detailed(confidence_level)
 
-    # Calculate residuals
-    residuals = y_true.flatten() - y_pred.flatten()
-
-    # Confidence intervals
-    n = len(residuals)
-    t_value = stats.t.ppf((1 + confidence_level) / 2, n - 1)
-    se = stats.sem(residuals)
-    ci = t_value * se
-
-    # Add detailed metrics
-    metrics.update({
-        'residual_mean': float(np.mean(residuals)),
-        'residual_std': float(np.std(residuals)),
-        'confidence_interval': float(ci),
-        'within_10pct': float(np.mean(np.abs(residuals / y_true) < 0.1) * 100),
-        'within_20pct': float(np.mean(np.abs(residuals / y_true) < 0.2) * 100),
-    })
+    logger.info(f"Calculated regression metrics: {metrics}")
 
     return metrics
 
@@ -215,7 +266,10 @@ def calculate_regression_metrics(
 def compare_models(
     model1_metrics: Dict[str, float],
     model2_metrics: Dict[str, float],
-    thresholds: Dict[str, float]
+    thresholds: Dict[str, float],
+    bootstrap_results: Optional[Dict[str, Any]] = None,
+    model1_benchmark: Optional[Dict[str, Any]] = None,
+    model2_benchmark: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
     """
     Compare two models based on their metrics.
@@ -224,6 +278,13 @@ def compare_models(
         model1_metrics: Metrics for first model (new/staging)
         model2_metrics: Metrics for second model (production)
         thresholds: Performance thresholds for promotion
+        bootstrap_results: Optional paired bootstrap of the improvements
+            (see plugins.bootstrap.paired_bootstrap); the MAE and RMSE
+            improvements must then also be significant at max_p_value
+        model1_benchmark: Optional benchmark card of the first model; it
+            must then stay within the latency thresholds (max_p99_regression
+            relative to model2_benchmark, max_p99_ms), however accurate it is
+        model2_benchmark: Optional benchmark card of the second model
 
     Returns:
         Comparison results with promotion recommendation
@@ -264,6 +325,22 @@ def compare_models(
             f"does not meet threshold ({thresholds.get('rmse_improvement', 0) * 100:.2f}%)"
         )
 
+    # Check significance of the MAE and RMSE improvements
+    if bootstrap_results is not None:
+        max_p_value = thresholds.get('max_p_value', 0.05)
+
+        for metric in ['mae', 'rmse']:
+            significance = bootstrap_results[f'{metric}_improvement_pct']
+            if significance['p_value'] > max_p_value:
+                should_promote = False
+                reasons.append(
+                    f"{metric.upper()} improvement is not significant "
+                    f"(p={significance['p_value']:.4f}, "
+                    f"{bootstrap_results['confidence_level'] * 100:.0f}% CI "
+                    f"[{significance['lower']:.2f}%, {significance['upper']:.2f}%]) "
+                    f"and does not meet threshold (p <= {max_p_value:.4f})"
+                )
+
     # Check minimum R2 score
     if model1_metrics.get('r2', 0) < thresholds.get('min_r2_score', 0.85):
         should_promote = False
@@ -280,6 +357,20 @@ def compare_models(
             f"exceeds maximum threshold ({thresholds.get('max_mae', 10.0):.4f})"
         )
 
+    # Check latency budget (see plugins.model_benchmark.check_latency_budget)
+    latency = None
+    if model1_benchmark is not None:
+        from .model_benchmark import cards_comparable, check_latency_budget
+
+        if model2_benchmark is not None and not cards_comparable(model1_benchmark, model2_benchmark):
+            logger.warning("Benchmark cards were measured on different hardware, skipping regression check")
+            model2_benchmark = None
+
+        latency = check_latency_budget(model1_benchmark, model2_benchmark, thresholds)
+        if not latency['within_budget']:
+            should_promote = False
+            reasons.extend(latency['reasons'])
+
     # If model passes all checks, add positive reasons
     if should_promote:
         reasons.append(f"All performance thresholds met")
@@ -290,6 +381,8 @@ def compare_models(
         'should_promote': should_promote,
         'improvements': improvements,
         'reasons': reasons,
+        'significance': bootstrap_results,
+        'latency': latency,
         'timestamp': datetime.now().isoformat(),
     }
 
@@ -298,6 +391,79 @@ def compare_models(
     return comparison_results
 
 
+def rank_models(
+    candidate_metrics: Dict[str, Dict[str, float]],
+    baseline_metrics: Dict[str, float],
+    thresholds: Dict[str, float],
+    bootstrap_results: Optional[Dict[str, Optional[Dict[str, Any]]]] = None,
+    benchmarks: Optional[Dict[str, Optional[Dict[str, Any]]]] = None,
+    baseline_benchmark: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Rank candidate models against the baseline with compare_models.
+
+    Candidates that meet all promotion thresholds rank first; within each
+    group, candidates are ordered by MAE improvement, then RMSE improvement,
+    then their own MAE (for a baseline without finite metrics). Given
+    bootstrap results and benchmark cards, each candidate is compared as in
+    the promotion decision, so a candidate whose improvements are not
+    significant or that misses the latency budget ranks below one that
+    meets every threshold.
+
+    Args:
+        candidate_metrics: Metrics per candidate model name
+        baseline_metrics: Metrics for the baseline (production) model
+        thresholds: Performance thresholds for promotion
+        bootstrap_results: Optional paired bootstrap per candidate model name
+        benchmarks: Optional benchmark card per candidate model name
+        baseline_benchmark: Optional benchmark card of the baseline model
+
+    Returns:
+        Ranking, best first, with rank, model_name, should_promote,
+        improvements, reasons, significance and latency per candidate
+    """
+    bootstrap_results = bootstrap_results or {}
+    benchmarks = benchmarks or {}
+    ranking = []
+
+    for model_name, metrics in candidate_metrics.items():
+        comparison = compare_models(
+            metrics,
+            baseline_metrics,
+            thresholds,
+            bootstrap_results=bootstrap_results.get(model_name),
+            model1_benchmark=benchmarks.get(model_name),
+            model2_benchmark=baseline_benchmark
+        )
+        ranking.append({
+            'model_name': model_name,
+            'should_promote': comparison['should_promote'],
+            'improvements': comparison['improvements'],
+            'reasons': comparison['reasons'],
+            'significance': comparison['significance'],
+            'latency': comparison['latency'],
+            'mae': metrics.get('mae', float('inf')),
+        })
+
+    def improvement(entry: Dict[str, Any], key: str) -> float:
+        value = entry['improvements'].get(key, float('-inf'))
+        return float('-inf') if math.isnan(value) else value
+
+    ranking.sort(key=lambda entry: (
+        not entry['should_promote'],
+        -improvement(entry, 'mae_improvement_pct'),
+        -improvement(entry, 'rmse_improvement_pct'),
+        entry['mae'],
+    ))
+
+    for rank, entry in enumerate(ranking, start=1):
+        entry['rank'] = rank
+
+    logger.info(f"Model ranking: {[(e['model_name'], e['should_promote']) for e in ranking]}")
+
+    return ranking
+
+
 # ============================================================================
 # Model Deployment
 # ============================================================================
@@ -307,72 +473,102 @@ def promote_model(
     target_dir: str,
     backup: bool = True,
     update_metadata: bool = True,
-    comparison_results: Optional[Dict] = None
+    comparison_results: Optional[Dict] = None,
+    registry: Optional[Any] = None
 ) -> Dict[str, Any]:
     """
     Promote a model from staging to production.
 
+    The model files are recorded in the models directory's artifact store
+    and published as an immutable release directory (releases/<manifest_id>,
+    hardlinks to the stored files). The production path is a symlink that
+    is switched to the new release with one atomic rename, so serving never
+    sees a partially promoted model and the previous release stays
+    available for rollback.
+
     Args:
         source_dir: Source directory (staging)
-        target_dir: Target directory (production)
-        backup: Whether to backup existing production model
+        target_dir: Target directory (production link)
+        backup: Whether to backup an existing production directory that is
+            not yet a release link (releases are kept as backups anyway)
         update_metadata: Whether to update model metadata
         comparison_results: Optional comparison results to include in metadata
+        registry: Optional ModelRegistry in which the promoted model becomes
+            the production model
 
     Returns:
         Promotion results
+
+    Raises:
+        ArtifactIntegrityError: If a model file doesn't match its checksum
+            (production is left unchanged)
     """
     logger.info(f"Promoting model from {source_dir} to {target_dir}")
 
-    # Ensure directories exist
-    os.makedirs(target_dir, exist_ok=True)
-
-    # Backup existing production model
-    if backup:
-        backup_dir = os.path.join(
-            os.path.dirname(target_dir),
-            f"backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        )
-
-        if os.path.exists(target_dir) and os.listdir(target_dir):
-            logger.info(f"Creating backup in {backup_dir}")
-            shutil.copytree(target_dir, backup_dir)
-
-    # Copy model files from staging to production
-    model_files = ['model.h5', 'model.keras', 'model.pt', 'model.pkl']
-
-    promoted_files = []
-
-    for file_name in model_files:
-        source_path = os.path.join(source_dir, file_name)
-        target_path = os.path.join(target_dir, file_name)
+    # Staging, production and backups share the models directory's artifact store
+    store = ArtifactStore.for_models_dir(os.path.dirname(os.path.abspath(target_dir)))
+
+    # The active release is the backup; a legacy directory is recorded as one
+    previous_release = current_release(target_dir)
+    if previous_release is None and backup and os.path.isdir(target_dir) and os.listdir(target_dir):
+        previous_release = store.snapshot(target_dir, label='backup')['manifest_id']
+        logger.info(f"Created backup manifest {previous_release}")
+
+    # Record the staging model files (with their metadata and checksums)
+    # and publish them as a new release
+    model_file_names = MODEL_FILE_NAMES + MODEL_VARIANT_FILE_NAMES
+    manifest = store.snapshot(
+        source_dir,
+        label='promotion',
+        file_names=model_file_names + [metadata_path_for(name) for name in model_file_names],
+        metadata={'target_dir': target_dir},
+    )
+    release_dir = publish_release(store, manifest['manifest_id'], releases_dir_for(target_dir))
+    promoted_files = list(manifest['files'])
 
-        if os.path.exists(source_path):
-            shutil.copy2(source_path, target_path)
-            promoted_files.append(file_name)
-            logger.info(f"Copied {file_name} to production")
+    # A corrupt or partial model must not go live
+    try:
+        verified_files = [
+            name for name in model_file_names
+            if name in manifest['files'] and verify_artifact(os.path.join(release_dir, name))
+        ]
+    except ArtifactIntegrityError:
+        shutil.rmtree(release_dir)
+        raise
 
-    # Update metadata
+    # Update metadata (written into the release before it goes live)
     if update_metadata:
         metadata = {
             'promoted_at': datetime.now().isoformat(),
             'source_dir': source_dir,
             'promoted_files': promoted_files,
-            'backup_created': backup,
+            'manifest_id': manifest['manifest_id'],
+            'previous_release': previous_release,
+            'backup_created': previous_release is not None,
         }
 
         if comparison_results:
             metadata['comparison_results'] = comparison_results
 
-        metadata_path = os.path.join(target_dir, 'promotion_metadata.json')
+        write_json_atomic(os.path.join(release_dir, 'promotion_metadata.json'), metadata)
+
+    activate_release(target_dir, release_dir)
+    logger.info(f"Promoted {promoted_files} to production")
 
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+    model_version = None
+    if registry is not None:
+        model_version = _register_release(registry, manifest, release_dir)
 
     promotion_results = {
         'success': True,
         'promoted_files': promoted_files,
+        'verified_files': verified_files,
         'target_dir': target_dir,
+        'release_dir': release_dir,
+        'manifest_id': manifest['manifest_id'],
+        'previous_release': previous_release,
+        'backup_manifest': previous_release,
+        'model_version': model_version,
         'timestamp': datetime.now().isoformat(),
     }
 
@@ -381,6 +577,69 @@ def promote_model(
     return promotion_results
 
 
+def _register_release(registry: Any, manifest: Dict[str, Any], release_dir: str) -> Optional[str]:
+    """
+    Make the main model of a release the registry's production model.
+
+    The manifest digests are the models' content hashes, so the model file
+    is not hashed again.
+
+    Returns:
+        Production model version, or None if the registry was not updated
+    """
+    model_file = next((name for name in MODEL_FILE_NAMES if name in manifest['files']), None)
+    if model_file is None:
+        logger.warning(f"Release {manifest['manifest_id']} has no model file to register")
+        return None
+
+    try:
+        registered = registry.register_model(
+            os.path.join(release_dir, model_file),
+            content_hash=manifest['files'][model_file]['digest'],
+            status='evaluated',
+        )
+        registry.set_production(registered['model_version'], release_id=manifest['manifest_id'])
+        return registered['model_version']
+
+    except Exception as e:
+        logger.error(f"Error updating model registry: {str(e)}")
+        return None
+
+
+def rollback_model(
+    target_dir: str,
+    release_id: Optional[str] = None,
+    registry: Optional[Any] = None,
+    **kwargs
+) -> Dict[str, Any]:
+    """
+    Roll production back to a previous release.
+
+    Args:
+        target_dir: Production link
+        release_id: Release or backup manifest to restore (defaults to the
+            release the active one replaced)
+        registry: Optional ModelRegistry in which the restored model becomes
+            the production model
+
+    Returns:
+        Rollback results
+    """
+    store = ArtifactStore.for_models_dir(os.path.dirname(os.path.abspath(target_dir)))
+    results = rollback_release(target_dir, store, release_id)
+
+    if registry is not None:
+        results['model_version'] = _register_release(
+            registry,
+            store.load_manifest(results['release_id']),
+            os.path.join(releases_dir_for(target_dir), results['release_id']),
+        )
+
+    logger.info(f"Rolled back {target_dir} to release {results['release_id']}")
+
+    return results
+
+
 def backup_previous_model(models_dir: str, **kwargs) -> Dict[str, Any]:
     """
     Create backup of previous model before training new one.
@@ -399,25 +658,17 @@ def backup_previous_model(models_dir: str, **kwargs) -> Dict[str, Any]:
         logger.info("No previous model to backup")
         return {'backup_created': False, 'reason': 'No previous model found'}
 
-    # Create backup directory
-    backup_dir = os.path.join(
-        models_dir,
-        'backups',
-        f"backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-    )
-
-    os.makedirs(backup_dir, exist_ok=True)
-
-    # Copy files
-    shutil.copytree(staging_dir, backup_dir, dirs_exist_ok=True)
+    # Record the staging files in the artifact store; unchanged content is not copied again
+    manifest = ArtifactStore.for_models_dir(models_dir).snapshot(staging_dir, label='backup')
 
     backup_info = {
         'backup_created': True,
-        'backup_dir': backup_dir,
+        'backup_manifest': manifest['manifest_id'],
+        'n_files': len(manifest['files']),
         'timestamp': datetime.now().isoformat(),
     }
 
-    logger.info(f"Backup created at: {backup_dir}")
+    logger.info(f"Backup manifest created: {manifest['manifest_id']}")
 
     return backup_info
 
@@ -535,6 +786,13 @@ def _generate_html_report(report: Dict[str, Any]) -> str:
             </tr>
         </table>
 
+        {_tournament_html(comparison.get('tournament') or [])}
+
+        {_sliced_metrics_html(
+            comparison.get('sliced_metrics') or {},
+            (comparison.get('winner') or {}).get('model_name', 'staging_model')
+        )}
+
         <h2>Promotion Decision</h2>
         <p><strong>Should Promote:</strong> {comparison.get('should_promote', False)}</p>
         <h3>Reasons:</h3>
@@ -548,6 +806,90 @@ def _generate_html_report(report: Dict[str, Any]) -> str:
     return html
 
 
+def _tournament_html(ranking: List[Dict[str, Any]]) -> str:
+    """
+    Generate an HTML table of the candidate model ranking.
+    """
+    if len(ranking) < 2:
+        return ''
+
+    rows = ''.join(
+        f"""
+            <tr>
+                <td>{entry['rank']}</td>
+                <td>{entry['model_name']}</td>
+                <td>{entry['mae']}</td>
+                <td>{entry['improvements'].get('mae_improvement_pct', 0):.2f}%</td>
+                <td>{entry['improvements'].get('rmse_improvement_pct', 0):.2f}%</td>
+                <td>{entry['should_promote']}</td>
+            </tr>"""
+        for entry in ranking
+    )
+
+    return f"""
+        <h2>Candidate Ranking</h2>
+        <table>
+            <tr>
+                <th>Rank</th>
+                <th>Model</th>
+                <th>MAE</th>
+                <th>MAE Improvement</th>
+                <th>RMSE Improvement</th>
+                <th>Meets Thresholds</th>
+            </tr>{rows}
+        </table>"""
+
+
+def _sliced_metrics_html(sliced_metrics: Dict[str, Dict[str, Any]], model_name: str) -> str:
+    """
+    Generate HTML tables of the compared model's sliced metrics, with the
+    production model's MAE on the same slice.
+    """
+    candidate = sliced_metrics.get(model_name)
+    if not candidate:
+        return ''
+
+    production = sliced_metrics.get('production_model', {})
+    sections = [f'<h2>Sliced Metrics ({model_name})</h2>']
+
+    for dimension, result in candidate.items():
+        production_mae = {
+            s['slice']: s['mae'] for s in production.get(dimension, {}).get('slices', [])
+        }
+        shown = len(result['slices'])
+        title = dimension.replace('_', ' ').title()
+        if shown < result['n_slices']:
+            title += f" (worst {shown} of {result['n_slices']} by MAE)"
+
+        rows = ''.join(
+            f"""
+            <tr>
+                <td>{s['slice']}</td>
+                <td>{s['count']}</td>
+                <td>{s['mae']}</td>
+                <td>{s['rmse']}</td>
+                <td>{s['bias']}</td>
+                <td>{production_mae.get(s['slice'], 'N/A')}</td>
+            </tr>"""
+            for s in result['slices']
+        )
+
+        sections.append(f"""
+        <h3>{title}</h3>
+        <table>
+            <tr>
+                <th>Slice</th>
+                <th>Samples</th>
+                <th>Candidate MAE</th>
+                <th>Candidate RMSE</th>
+                <th>Candidate Bias</th>
+                <th>Production MAE</th>
+            </tr>{rows}
+        </table>""")
+
+    return ''.join(sections)
+
+
 # ============================================================================
 # Utility Functions
 # ============================================================================
@@ -637,6 +979,89 @@ def log_pipeline_metrics(
     # In production, send to monitoring system (Prometheus, CloudWatch, etc.)
 
 
+def _finite_or_none(value: Any) -> Any:
+    """Replace NaN and infinite floats with None, recursing into dicts and lists"""
+    if isinstance(value, dict):
+        return {key: _finite_or_none(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite_or_none(item) for item in value]
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def record_training_run(
+    run_id: str,
+    start_time: datetime,
+    end_time: datetime,
+    training_results: Dict[str, Any],
+    profile: Optional[Dict[str, Any]] = None,
+    status: str = 'success',
+    postgres_conn_id: str = 'postgres_default',
+) -> None:
+    """
+    Record a training run and its performance profile in Postgres.
+
+    The row is keyed by run_id, so task retries update the same record.
+    NaN and infinite values (a diverged epoch) are stored as null, since
+    Postgres rejects them in jsonb.
+
+    Args:
+        run_id: Airflow DAG run ID
+        start_time: Training start time
+        end_time: Training end time
+        training_results: Training results (losses, sample counts)
+        profile: Optional training profile (see TrainingProfiler.to_dict)
+        status: Run status
+        postgres_conn_id: Airflow connection ID of the RUL database
+    """
+    metrics = _finite_or_none({
+        'training': {
+            key: value for key, value in training_results.items()
+            if isinstance(value, (int, float, str, bool))
+        },
+        'profile': profile or {},
+    })
+
+    try:
+        from airflow.providers.postgres.hooks.postgres import PostgresHook
+
+        hook = PostgresHook(postgres_conn_id=postgres_conn_id)
+        hook.run(
+            """
+            INSERT INTO training_runs (
+                run_id, start_time, end_time, duration_seconds, dataset_size,
+                training_loss, validation_loss, metrics, status
+            )
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s::jsonb, %s)
+            ON CONFLICT (run_id) DO UPDATE SET
+                end_time = EXCLUDED.end_time,
+                duration_seconds = EXCLUDED.duration_seconds,
+                dataset_size = EXCLUDED.dataset_size,
+                training_loss = EXCLUDED.training_loss,
+                validation_loss = EXCLUDED.validation_loss,
+                metrics = EXCLUDED.metrics,
+                status = EXCLUDED.status
+            """,
+            parameters=(
+                run_id,
+                start_time,
+                end_time,
+                int((end_time - start_time).total_seconds()),
+                training_results.get('n_train_samples', 0) + training_results.get('n_val_samples', 0),
+                _finite_or_none(training_results.get('final_train_loss')),
+                _finite_or_none(training_results.get('final_val_loss')),
+                json.dumps(metrics, allow_nan=False),
+                status,
+            ),
+        )
+
+        logger.info(f"Training run {run_id} recorded in training_runs")
+
+    except Exception as e:
+        logger.error(f"Error recording training run: {str(e)}")
+
+
 def send_slack_notification(message: str, webhook_url: Optional[str] = None) -> None:
     """
     Send notification to Slack.
@@ -0,0 +1,266 @@
+"""
+ONNX Export and ONNX Runtime Inference for the RUL Prediction Model
+
+This module provides utility functions for:
+- Exporting the trained PyTorch model to an ONNX graph with a dynamic
+  batch axis
+- Applying ONNX Runtime graph optimizations offline and saving the
+  optimized graph
+- Validating the ONNX model against the PyTorch model on a sample of the
+  feature store
+- An ONNX Runtime session wrapper with the models' predict(X) interface,
+  so CPU serving does not need the training frameworks
+
+Author: RUL Prediction System
+Version: 1.0.0
+"""
+
+import os
+import time
+import inspect
+import logging
+from typing import Dict, Any, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+# Default ONNX export settings
+DEFAULT_ONNX_CONFIG = {
+    'opset_version': 17,
+    # Offline optimizations; 'all' adds hardware-specific fusions
+    'optimization_level': 'extended',
+    'validation_samples': 2048,
+    'max_abs_diff': 0.01,  # Maximum RUL difference from the PyTorch model
+    'random_seed': 42,
+}
+
+# Session thread counts (0 lets ONNX Runtime choose)
+DEFAULT_INTRA_OP_THREADS = int(os.getenv('RUL_ONNX_INTRA_OP_THREADS', 0))
+DEFAULT_INTER_OP_THREADS = int(os.getenv('RUL_ONNX_INTER_OP_THREADS', 0))
+
+INPUT_NAME = 'features'
+OUTPUT_NAME = 'rul'
+
+
+def _graph_optimization_level(name: str) -> Any:
+    """ONNX Runtime graph optimization level by name"""
+    import onnxruntime as ort
+
+    levels = {
+        'disabled': ort.GraphOptimizationLevel.ORT_DISABLE_ALL,
+        'basic': ort.GraphOptimizationLevel.ORT_ENABLE_BASIC,
+        'extended': ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+        'all': ort.GraphOptimizationLevel.ORT_ENABLE_ALL,
+    }
+
+    if name not in levels:
+        raise ValueError(f"Unknown graph optimization level: {name}")
+
+    return levels[name]
+
+
+class OnnxModel:
+    """
+    ONNX Runtime CPU session with the predict(X) interface of the PyTorch models.
+
+    Args:
+        model_path: Path to the .onnx model
+        intra_op_threads: Threads used within an operator (0 = ONNX Runtime default)
+        inter_op_threads: Threads used across independent operators
+            (0 = ONNX Runtime default; > 1 enables parallel execution)
+        optimization_level: Graph optimization level applied when the
+            session is created
+    """
+
+    def __init__(
+        self,
+        model_path: str,
+        intra_op_threads: Optional[int] = None,
+        inter_op_threads: Optional[int] = None,
+        optimization_level: str = 'all'
+    ):
+        import onnxruntime as ort
+
+        if intra_op_threads is None:
+            intra_op_threads = DEFAULT_INTRA_OP_THREADS
+        if inter_op_threads is None:
+            inter_op_threads = DEFAULT_INTER_OP_THREADS
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = _graph_optimization_level(optimization_level)
+        options.intra_op_num_threads = intra_op_threads
+        options.inter_op_num_threads = inter_op_threads
+        if inter_op_threads > 1:
+            options.execution_mode = ort.ExecutionMode.ORT_PARALLEL
+
+        self.model_path = model_path
+        self.session = ort.InferenceSession(
+            model_path, options, providers=['CPUExecutionProvider']
+        )
+
+        model_input = self.session.get_inputs()[0]
+        self.input_name = model_input.name
+        n_features = model_input.shape[-1]
+        self.n_features_in_ = n_features if isinstance(n_features, int) else None
+
+    def predict(self, X: Any, batch_size: int = 1024) -> np.ndarray:
+        """
+        Predict RUL values for a feature array.
+
+        Args:
+            X: Feature array of shape (n_samples, features) (may be memory-mapped)
+            batch_size: Number of samples per session run
+
+        Returns:
+            Predicted RUL values of shape (n_samples,)
+        """
+        outputs = []
+
+        for start in range(0, len(X), batch_size):
+            batch = np.ascontiguousarray(X[start:start + batch_size], dtype=np.float32)
+            outputs.append(self.session.run(None, {self.input_name: batch})[0])
+
+        if not outputs:
+            return np.empty(0, dtype=np.float32)
+
+        return np.concatenate(outputs)
+
+
+def export_onnx(
+    model: Any,
+    output_path: str,
+    opset_version: int = DEFAULT_ONNX_CONFIG['opset_version'],
+    optimization_level: str = DEFAULT_ONNX_CONFIG['optimization_level']
+) -> str:
+    """
+    Export a PyTorch model to an optimized ONNX graph.
+
+    The graph takes (batch, features) rows, as fed by the pipeline, with a
+    dynamic batch axis. It is optimized by ONNX Runtime and the optimized
+    graph is saved to output_path.
+
+    Args:
+        model: Trained PyTorch model
+        output_path: Path for the .onnx model
+        opset_version: ONNX opset version
+        optimization_level: Offline graph optimization level
+
+    Returns:
+        Path to the saved model
+    """
+    import torch
+    import onnxruntime as ort
+
+    model.eval()
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+
+    raw_path = f"{output_path}.raw"
+    dummy = torch.zeros(2, int(model.feature_mean.shape[-1]))
+
+    # Newer PyTorch defaults to the torch.export-based exporter
+    export_kwargs = {}
+    if 'dynamo' in inspect.signature(torch.onnx.export).parameters:
+        export_kwargs['dynamo'] = False
+
+    try:
+        torch.onnx.export(
+            model,
+            dummy,
+            raw_path,
+            input_names=[INPUT_NAME],
+            output_names=[OUTPUT_NAME],
+            dynamic_axes={INPUT_NAME: {0: 'batch'}, OUTPUT_NAME: {0: 'batch'}},
+            opset_version=opset_version,
+            **export_kwargs,
+        )
+
+        # Creating a session with optimized_model_filepath saves the optimized graph
+        options = ort.SessionOptions()
+        options.graph_optimization_level = _graph_optimization_level(optimization_level)
+        options.optimized_model_filepath = output_path
+        ort.InferenceSession(raw_path, options, providers=['CPUExecutionProvider'])
+
+    finally:
+        if os.path.exists(raw_path):
+            os.remove(raw_path)
+
+    logger.info(f"ONNX model exported to: {output_path}")
+
+    return output_path
+
+
+def export_and_validate(
+    model_path: str,
+    features_dir: str,
+    output_path: str,
+    onnx_config: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Export a saved model to ONNX and keep it only if it matches the PyTorch model.
+
+    Args:
+        model_path: Path to the trained PyTorch model
+        features_dir: Feature store directory used for the validation sample
+        output_path: Path for the .onnx model
+        onnx_config: Optional overrides of DEFAULT_ONNX_CONFIG
+
+    Returns:
+        Export results including prediction differences, sizes and
+        per-sample latency of both models
+    """
+    from .artifact_checksum import record_checksum
+    from .model_utils import load_model
+    from .quantization import sample_calibration_rows, _timed_predict
+    from .training_utils import load_feature_store
+
+    config = {**DEFAULT_ONNX_CONFIG, **(onnx_config or {})}
+
+    model = load_model(model_path)
+    X, _, _ = load_feature_store(features_dir, mmap_mode='r')
+
+    rows = sample_calibration_rows(len(X), config['validation_samples'], config['random_seed'])
+    X_sample = np.asarray(X[rows], dtype=np.float32)
+
+    logger.info(f"Exporting {model_path} to ONNX, validating on {len(rows)} samples")
+
+    start_time = time.perf_counter()
+    export_onnx(model, output_path, config['opset_version'], config['optimization_level'])
+    export_seconds = time.perf_counter() - start_time
+
+    onnx_model = OnnxModel(output_path)
+
+    y_torch, torch_latency_ms = _timed_predict(model, X_sample)
+    y_onnx, onnx_latency_ms = _timed_predict(onnx_model, X_sample)
+
+    diff = np.abs(np.asarray(y_onnx, dtype=np.float64) - np.asarray(y_torch, dtype=np.float64))
+    max_abs_diff = float(diff.max()) if len(diff) else 0.0
+    accepted = max_abs_diff <= config['max_abs_diff']
+
+    if accepted:
+        record_checksum(output_path)
+        logger.info(f"ONNX model accepted (max abs diff {max_abs_diff:.6f})")
+    else:
+        os.remove(output_path)
+        logger.warning(
+            f"ONNX model rejected: max abs diff {max_abs_diff:.6f} exceeds "
+            f"{config['max_abs_diff']}"
+        )
+
+    onnx_size_mb = os.path.getsize(output_path) / (1024 * 1024) if accepted else None
+
+    return {
+        'accepted': accepted,
+        'onnx_model_path': output_path if accepted else None,
+        'opset_version': config['opset_version'],
+        'optimization_level': config['optimization_level'],
+        'validation_samples': len(rows),
+        'max_abs_diff': round(max_abs_diff, 6),
+        'mean_abs_diff': round(float(diff.mean()) if len(diff) else 0.0, 6),
+        'export_seconds': round(export_seconds, 3),
+        'torch_size_mb': round(os.path.getsize(model_path) / (1024 * 1024), 3),
+        'onnx_size_mb': round(onnx_size_mb, 3) if onnx_size_mb is not None else None,
+        'torch_latency_ms_per_sample': round(torch_latency_ms, 4),
+        'onnx_latency_ms_per_sample': round(onnx_latency_ms, 4),
+    }
@@ -0,0 +1,210 @@
+"""
+Prediction Cache for Model Evaluation
+
+This module provides a disk cache of per-sample model predictions keyed by
+(model artifact content hash, test features content hash):
+- Identical model and test set: predictions are read back, nothing is scored
+- Test set grown by appended rows: only the new rows are scored
+- Anything else: the full test set is scored and cached
+
+Predictions depend only on the model and the test features, so labels are
+not part of the key.
+
+Layout:
+    <cache_dir>/<model_hash>/<features_hash>.npy   predictions (float32)
+    <cache_dir>/<model_hash>/<features_hash>.json  entry info (n_rows, ...)
+
+Author: RUL Prediction System
+Version: 1.0.0
+"""
+
+import os
+import json
+import hashlib
+import logging
+from datetime import datetime
+from typing import Dict, Any, Callable, Optional, Tuple
+
+import numpy as np
+
+from .artifact_checksum import file_content_hash
+
+logger = logging.getLogger(__name__)
+
+
+# Bytes read per hashing step
+HASH_CHUNK_BYTES = 16 * 1024 * 1024
+
+
+def array_content_hash(X: np.ndarray, n_rows: Optional[int] = None) -> str:
+    """
+    SHA-256 of the first n_rows rows of an array (all rows by default).
+
+    The dtype and row shape are part of the hash, so a hash over a prefix of
+    a grown array equals the hash of the original array.
+
+    Args:
+        X: Array (may be memory-mapped)
+        n_rows: Number of leading rows to hash
+
+    Returns:
+        Hex digest
+    """
+    n_rows = len(X) if n_rows is None else n_rows
+
+    digest = hashlib.sha256()
+    digest.update(f"{X.dtype.str}{X.shape[1:]}".encode())
+
+    row_bytes = max(1, X.itemsize * int(np.prod(X.shape[1:], dtype=np.int64)))
+    rows_per_chunk = max(1, HASH_CHUNK_BYTES // row_bytes)
+
+    for start in range(0, n_rows, rows_per_chunk):
+        chunk = np.ascontiguousarray(X[start:min(start + rows_per_chunk, n_rows)])
+        digest.update(memoryview(chunk).cast('B'))
+
+    return digest.hexdigest()
+
+
+class PredictionCache:
+    """
+    Disk cache of model predictions on test sets.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+
+    def _entry_paths(self, model_hash: str, features_hash: str) -> Tuple[str, str]:
+        entry_dir = os.path.join(self.cache_dir, model_hash)
+        return (
+            os.path.join(entry_dir, f'{features_hash}.npy'),
+            os.path.join(entry_dir, f'{features_hash}.json'),
+        )
+
+    def _entries(self, model_hash: str) -> Dict[str, Dict[str, Any]]:
+        """Entry info of a model, keyed by features hash"""
+        entry_dir = os.path.join(self.cache_dir, model_hash)
+        entries = {}
+
+        if not os.path.isdir(entry_dir):
+            return entries
+
+        for file_name in os.listdir(entry_dir):
+            if not file_name.endswith('.json'):
+                continue
+
+            features_hash = file_name[:-len('.json')]
+            if not os.path.exists(os.path.join(entry_dir, f'{features_hash}.npy')):
+                continue
+
+            try:
+                with open(os.path.join(entry_dir, file_name)) as f:
+                    entries[features_hash] = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable cache entry {file_name}: {str(e)}")
+
+        return entries
+
+    def load(self, model_hash: str, features_hash: str) -> Optional[np.ndarray]:
+        """Cached predictions, or None"""
+        predictions_path, info_path = self._entry_paths(model_hash, features_hash)
+
+        if not os.path.exists(predictions_path) or not os.path.exists(info_path):
+            return None
+
+        return np.load(predictions_path)
+
+    def store(
+        self,
+        model_hash: str,
+        features_hash: str,
+        predictions: np.ndarray,
+        model_path: Optional[str] = None
+    ) -> None:
+        """
+        Store predictions atomically.
+        """
+        predictions_path, info_path = self._entry_paths(model_hash, features_hash)
+        os.makedirs(os.path.dirname(predictions_path), exist_ok=True)
+
+        # Per-process temporary names: concurrent workers may store the same entry
+        tmp_path = f'{predictions_path}.{os.getpid()}.tmp.npy'
+        np.save(tmp_path, np.asarray(predictions, dtype=np.float32))
+        os.replace(tmp_path, predictions_path)
+
+        info = {
+            'n_rows': len(predictions),
+            'model_path': model_path,
+            'created_at': datetime.now().isoformat(),
+        }
+
+        tmp_path = f'{info_path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(info, f, indent=2)
+        os.replace(tmp_path, info_path)
+
+    def remove(self, model_hash: str, features_hash: str) -> None:
+        """Remove a cache entry"""
+        for path in self._entry_paths(model_hash, features_hash):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def get_or_predict(
+        self,
+        model_path: str,
+        X: np.ndarray,
+        predict_fn: Callable[[np.ndarray], np.ndarray]
+    ) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Get predictions for X, scoring only rows that are not cached.
+
+        Args:
+            model_path: Path to the model artifact
+            X: Test features (may be memory-mapped)
+            predict_fn: Scores a feature array; only called on a miss or on
+                rows appended since the cached entry
+
+        Returns:
+            Tuple of (predictions for all rows, cache info with 'status'
+            ('hit', 'partial' or 'miss') and 'rows_predicted')
+        """
+        model_hash = file_content_hash(model_path)
+        features_hash = array_content_hash(X)
+
+        predictions = self.load(model_hash, features_hash)
+
+        if predictions is not None and len(predictions) == len(X):
+            logger.info(f"Prediction cache hit for {model_path}")
+            return predictions, {'status': 'hit', 'rows_predicted': 0}
+
+        # Look for the largest cached prefix of the current test set
+        entries = self._entries(model_hash)
+
+        for prefix_hash, info in sorted(entries.items(), key=lambda item: -item[1]['n_rows']):
+            n_cached = int(info['n_rows'])
+
+            if n_cached >= len(X) or array_content_hash(X, n_cached) != prefix_hash:
+                continue
+
+            cached = self.load(model_hash, prefix_hash)
+            if cached is None or len(cached) != n_cached:
+                continue
+
+            logger.info(
+                f"Prediction cache partial hit for {model_path}: "
+                f"{n_cached} cached rows, scoring {len(X) - n_cached} appended rows"
+            )
+
+            predictions = np.concatenate([cached, predict_fn(X[n_cached:])])
+            self.store(model_hash, features_hash, predictions, model_path)
+
+            # The grown test set supersedes the cached prefix
+            self.remove(model_hash, prefix_hash)
+
+            return predictions, {'status': 'partial', 'rows_predicted': len(X) - n_cached}
+
+        logger.info(f"Prediction cache miss for {model_path}")
+
+        predictions = np.asarray(predict_fn(X), dtype=np.float32)
+        self.store(model_hash, features_hash, predictions, model_path)
+
+        return predictions, {'status': 'miss', 'rows_predicted': len(X)}
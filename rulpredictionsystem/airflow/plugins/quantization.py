@@ -0,0 +1,212 @@
+"""
+Post-Training Quantization for the RUL Prediction Model
+
+This module provides utility functions for:
+- Dynamic int8 quantization of the CNN-LSTM model for CPU serving
+- Scoring the float and int8 variants on a sample of the feature store
+- An accuracy gate that rejects the int8 model when MAE or RMSE degrade
+  beyond a configured tolerance
+
+Author: RUL Prediction System
+Version: 1.0.0
+"""
+
+import os
+import time
+import logging
+from typing import Dict, Any, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+# Default quantization settings
+DEFAULT_QUANTIZATION_CONFIG = {
+    'calibration_samples': 2048,
+    'mae_tolerance': 0.02,   # 2% MAE degradation allowed
+    'rmse_tolerance': 0.02,  # 2% RMSE degradation allowed
+    'random_seed': 42,
+}
+
+
+def quantize_model(model: Any) -> Any:
+    """
+    Quantize a float model to int8.
+
+    LSTM and Linear layers, which hold nearly all of the model's weights,
+    get int8 weights with dynamically quantized activations. The
+    convolution front-end stays in float32.
+
+    Args:
+        model: Trained float32 PyTorch model
+
+    Returns:
+        Quantized copy of the model (the input model is left unchanged)
+
+    Raises:
+        RuntimeError: If the installed torch no longer provides eager-mode
+            dynamic quantization
+    """
+    import torch
+    import torch.nn as nn
+
+    # Eager-mode quantization (torch.ao.quantization) is deprecated in newer
+    # torch releases and scheduled for removal in 2.10. Its replacement is
+    # torchao: quantize_(model, Int8DynamicActivationInt8WeightConfig()).
+    # requirements.txt pins torch 2.1.1, which predates the deprecation. A
+    # newer torch warns (left visible, it flags the pending migration), and
+    # a torch without the API fails with an explicit error.
+    quantize_dynamic = getattr(getattr(torch.ao, 'quantization', None), 'quantize_dynamic', None)
+    if quantize_dynamic is None:
+        raise RuntimeError(
+            f"torch {torch.__version__} has no torch.ao.quantization.quantize_dynamic; "
+            f"migrate quantize_model to torchao.quantization.quantize_"
+        )
+
+    model.eval()
+
+    quantized = quantize_dynamic(
+        model,
+        {nn.LSTM, nn.Linear},
+        dtype=torch.qint8,
+    )
+
+    return quantized
+
+
+def sample_calibration_rows(
+    n_samples: int,
+    calibration_samples: int,
+    random_seed: int = 42
+) -> np.ndarray:
+    """
+    Draw a sorted random sample of row indices from the feature store.
+    """
+    rng = np.random.default_rng(random_seed)
+    size = min(n_samples, calibration_samples)
+
+    return np.sort(rng.choice(n_samples, size=size, replace=False))
+
+
+def _timed_predict(model: Any, X: np.ndarray) -> tuple:
+    """Predict and return (predictions, milliseconds per sample)"""
+    start = time.perf_counter()
+    y_pred = model.predict(X)
+    elapsed = time.perf_counter() - start
+
+    return y_pred, elapsed * 1000 / max(len(X), 1)
+
+
+def quantization_gate(
+    float_metrics: Dict[str, float],
+    int8_metrics: Dict[str, float],
+    mae_tolerance: float,
+    rmse_tolerance: float
+) -> Dict[str, Any]:
+    """
+    Decide whether the int8 model is accurate enough to ship.
+
+    The int8 model is compared against its float parent with compare_models,
+    using negative improvement thresholds as degradation tolerances.
+
+    Args:
+        float_metrics: Metrics of the float model
+        int8_metrics: Metrics of the int8 model
+        mae_tolerance: Maximum relative MAE degradation (0.02 = 2%)
+        rmse_tolerance: Maximum relative RMSE degradation
+
+    Returns:
+        compare_models results; should_promote tells whether to accept
+    """
+    from .model_utils import compare_models
+
+    thresholds = {
+        'mae_improvement': -mae_tolerance,
+        'rmse_improvement': -rmse_tolerance,
+        'min_r2_score': float('-inf'),
+        'max_mae': float('inf'),
+    }
+
+    return compare_models(int8_metrics, float_metrics, thresholds)
+
+
+def quantize_and_validate(
+    model_path: str,
+    features_dir: str,
+    output_path: str,
+    quantization_config: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Quantize a saved model and keep the int8 variant only if it passes the gate.
+
+    Args:
+        model_path: Path to the trained float model
+        features_dir: Feature store directory used for the calibration sample
+        output_path: Path for the int8 model
+        quantization_config: Optional overrides of DEFAULT_QUANTIZATION_CONFIG
+
+    Returns:
+        Quantization results including metrics of both variants, sizes,
+        per-sample latency and the gate decision
+    """
+    import torch
+    from .artifact_checksum import record_checksum
+    from .model_utils import load_model, calculate_metrics
+    from .training_utils import load_feature_store
+
+    config = {**DEFAULT_QUANTIZATION_CONFIG, **(quantization_config or {})}
+
+    model = load_model(model_path)
+    X, y, _ = load_feature_store(features_dir, mmap_mode='r')
+
+    rows = sample_calibration_rows(len(X), config['calibration_samples'], config['random_seed'])
+    X_sample = np.asarray(X[rows], dtype=np.float32)
+    y_sample = np.asarray(y[rows])
+
+    logger.info(f"Quantizing {model_path} with {len(rows)} calibration samples")
+
+    quantized = quantize_model(model)
+
+    y_float, float_latency_ms = _timed_predict(model, X_sample)
+    y_int8, int8_latency_ms = _timed_predict(quantized, X_sample)
+
+    float_metrics = calculate_metrics(y_sample, y_float)
+    int8_metrics = calculate_metrics(y_sample, y_int8)
+
+    gate = quantization_gate(
+        float_metrics,
+        int8_metrics,
+        mae_tolerance=config['mae_tolerance'],
+        rmse_tolerance=config['rmse_tolerance'],
+    )
+
+    accepted = gate['should_promote']
+
+    if accepted:
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        torch.save(quantized, output_path)
+        record_checksum(output_path)
+        logger.info(f"Quantized model accepted and saved to: {output_path}")
+    else:
+        if os.path.exists(output_path):
+            os.remove(output_path)
+        logger.warning(f"Quantized model rejected: {gate['reasons']}")
+
+    float_size_mb = os.path.getsize(model_path) / (1024 * 1024)
+    int8_size_mb = os.path.getsize(output_path) / (1024 * 1024) if accepted else None
+
+    return {
+        'accepted': accepted,
+        'quantized_model_path': output_path if accepted else None,
+        'method': 'dynamic_int8',
+        'calibration_samples': len(rows),
+        'float_metrics': float_metrics,
+        'int8_metrics': int8_metrics,
+        'degradation': gate['improvements'],
+        'reasons': gate['reasons'],
+        'float_size_mb': round(float_size_mb, 3),
+        'int8_size_mb': round(int8_size_mb, 3) if int8_size_mb is not None else None,
+        'float_latency_ms_per_sample': round(float_latency_ms, 4),
+        'int8_latency_ms_per_sample': round(int8_latency_ms, 4),
+    }
@@ -0,0 +1,211 @@
+"""
+Versioned Model Releases with Atomic Activation
+
+This module manages immutable release directories of the production model:
+- A release is the checkout of an artifact store manifest into
+  releases/<manifest_id>/, named by the manifest it was built from
+- The production directory is a symlink to the active release; it is
+  replaced with one atomic rename, so readers see the old or the new
+  release, never a mix of both
+- Rollback re-points the symlink to a previous release (re-materialized
+  from its manifest if its directory was pruned)
+- Release directories of expired manifests are pruned before the artifact
+  store removes their blobs
+
+Author: RUL Prediction System
+Version: 1.0.0
+"""
+
+import os
+import json
+import shutil
+import logging
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+from .artifact_store import ArtifactStore
+
+logger = logging.getLogger(__name__)
+
+
+# Release directories inside the models directory
+RELEASES_DIR_NAME = 'releases'
+
+
+def releases_dir_for(link_path: str) -> str:
+    """Releases directory next to a production link"""
+    return os.path.join(os.path.dirname(os.path.abspath(link_path)), RELEASES_DIR_NAME)
+
+
+def current_release(link_path: str) -> Optional[str]:
+    """
+    Active release of a production link.
+
+    Returns:
+        Release (manifest) id, or None if link_path is not a release link
+    """
+    if not os.path.islink(link_path):
+        return None
+
+    return os.path.basename(os.path.normpath(os.readlink(link_path)))
+
+
+def publish_release(store: ArtifactStore, manifest_id: str, releases_dir: str) -> str:
+    """
+    Materialize a manifest as a release directory (hardlinks to its blobs).
+
+    Args:
+        store: Artifact store holding the manifest
+        manifest_id: Manifest to release
+        releases_dir: Directory holding the release directories
+
+    Returns:
+        Path to the release directory
+    """
+    release_dir = os.path.join(releases_dir, manifest_id)
+
+    if not os.path.isdir(release_dir):
+        # Build under a temporary name so a partial release is never visible
+        tmp_dir = os.path.join(releases_dir, f".tmp_{manifest_id}")
+        if os.path.exists(tmp_dir):
+            shutil.rmtree(tmp_dir)
+
+        store.checkout(manifest_id, tmp_dir)
+        os.replace(tmp_dir, release_dir)
+
+    return release_dir
+
+
+def activate_release(link_path: str, release_dir: str) -> Optional[str]:
+    """
+    Atomically point the production link at a release directory.
+
+    A legacy production directory (not a link) is moved aside and removed;
+    it should be recorded as a backup manifest first.
+
+    Args:
+        link_path: Production link (e.g. models/production)
+        release_dir: Release directory to activate
+
+    Returns:
+        Previously active release id, if any
+    """
+    previous = current_release(link_path)
+    parent_dir = os.path.dirname(os.path.abspath(link_path))
+
+    # Relative target, so the models directory can be mounted anywhere
+    target = os.path.relpath(os.path.abspath(release_dir), parent_dir)
+    tmp_link = os.path.join(parent_dir, f".tmp_{os.path.basename(link_path)}_{os.getpid()}")
+
+    if os.path.lexists(tmp_link):
+        os.remove(tmp_link)
+    os.symlink(target, tmp_link)
+
+    legacy_dir = None
+    if os.path.isdir(link_path) and not os.path.islink(link_path):
+        legacy_dir = f"{link_path}.legacy_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        os.rename(link_path, legacy_dir)
+
+    os.replace(tmp_link, link_path)
+
+    if legacy_dir:
+        shutil.rmtree(legacy_dir)
+        logger.info(f"Replaced legacy directory {link_path} with a release link")
+
+    logger.info(f"Activated release {os.path.basename(release_dir)} (previous: {previous})")
+
+    return previous
+
+
+def list_releases(link_path: str) -> List[Dict[str, Any]]:
+    """
+    Release directories next to a production link, newest first.
+
+    Returns:
+        List of releases with release_id, release_dir and active flag
+    """
+    releases_dir = releases_dir_for(link_path)
+    if not os.path.isdir(releases_dir):
+        return []
+
+    active = current_release(link_path)
+
+    return [
+        {
+            'release_id': release_id,
+            'release_dir': os.path.join(releases_dir, release_id),
+            'active': release_id == active,
+        }
+        # Release ids end with their manifest's timestamp
+        for release_id in sorted(
+            os.listdir(releases_dir), key=lambda name: name.split('_', 1)[-1], reverse=True
+        )
+        if not release_id.startswith('.')
+    ]
+
+
+def rollback_release(
+    link_path: str,
+    store: ArtifactStore,
+    release_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Re-activate a previous release.
+
+    Args:
+        link_path: Production link
+        store: Artifact store holding the release manifests
+        release_id: Release to activate (defaults to the release the
+            active one replaced, from its promotion metadata)
+
+    Returns:
+        Rollback results with the activated and replaced releases
+
+    Raises:
+        ValueError: If no previous release is known
+        FileNotFoundError: If the release's manifest no longer exists
+    """
+    if release_id is None:
+        metadata_path = os.path.join(link_path, 'promotion_metadata.json')
+        if os.path.exists(metadata_path):
+            with open(metadata_path) as f:
+                release_id = json.load(f).get('previous_release')
+
+    if not release_id:
+        raise ValueError(f"No previous release known for {link_path}")
+
+    release_dir = publish_release(store, release_id, releases_dir_for(link_path))
+    replaced = activate_release(link_path, release_dir)
+
+    return {
+        'success': True,
+        'release_id': release_id,
+        'replaced_release': replaced,
+        'timestamp': datetime.now().isoformat(),
+    }
+
+
+def prune_releases(releases_dir: str, keep: List[str]) -> List[str]:
+    """
+    Remove release directories not in keep.
+
+    Args:
+        releases_dir: Directory holding the release directories
+        keep: Release ids to keep (active releases and retained manifests)
+
+    Returns:
+        Removed release ids
+    """
+    if not os.path.isdir(releases_dir):
+        return []
+
+    removed = []
+    for release_id in os.listdir(releases_dir):
+        if release_id not in keep:
+            shutil.rmtree(os.path.join(releases_dir, release_id))
+            removed.append(release_id)
+
+    if removed:
+        logger.info(f"Pruned {len(removed)} release directories")
+
+    return removed
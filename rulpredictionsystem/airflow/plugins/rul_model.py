@@ -0,0 +1,253 @@
+"""
+RUL Model Definitions
+
+This module defines the PyTorch models trained by the pipeline: the CNN-LSTM
+teacher and the compact CNN student distilled from it. It is kept
+separate from the training utilities so that pickled models can be loaded
+by any process that can import ``plugins.rul_model``.
+
+Author: RUL Prediction System
+Version: 1.0.0
+"""
+
+from typing import Any, Dict, Optional
+
+import numpy as np
+import torch
+import torch.nn as nn
+
+
+class RULRegressor(nn.Module):
+    """
+    Base class for RUL regressors.
+
+    Holds the feature and target standardization buffers and the batched
+    numpy prediction interface shared by all model variants.
+    """
+
+    def __init__(self, input_dim: int):
+        super().__init__()
+
+        # Feature standardization, fitted on the training split
+        self.register_buffer('feature_mean', torch.zeros(input_dim))
+        self.register_buffer('feature_std', torch.ones(input_dim))
+        self.register_buffer('target_mean', torch.zeros(()))
+        self.register_buffer('target_std', torch.ones(()))
+
+    def set_normalization(
+        self,
+        mean: np.ndarray,
+        std: np.ndarray,
+        target_mean: float = 0.0,
+        target_std: float = 1.0
+    ) -> None:
+        """
+        Set feature and target standardization statistics.
+
+        Args:
+            mean: Per-feature mean of the training data
+            std: Per-feature standard deviation of the training data
+            target_mean: Mean RUL of the training data
+            target_std: RUL standard deviation of the training data
+        """
+        std = np.where(np.asarray(std) > 1e-8, std, 1.0)
+        self.feature_mean.copy_(torch.as_tensor(mean, dtype=torch.float32))
+        self.feature_std.copy_(torch.as_tensor(std, dtype=torch.float32))
+        self.target_mean.fill_(float(target_mean))
+        self.target_std.fill_(float(target_std) if target_std > 1e-8 else 1.0)
+
+    def _normalize(self, x: torch.Tensor) -> torch.Tensor:
+        """Standardize a (batch, features) or (batch, time, features) input"""
+        if x.dim() == 2:
+            x = x.unsqueeze(1)
+
+        return (x - self.feature_mean) / self.feature_std
+
+    def _denormalize(self, output: torch.Tensor) -> torch.Tensor:
+        """Map a standardized (batch, 1) output back to RUL units"""
+        return output.squeeze(-1) * self.target_std + self.target_mean
+
+    def predict(self, X: Any, batch_size: int = 1024) -> np.ndarray:
+        """
+        Predict RUL values for a feature array.
+
+        Args:
+            X: Feature array (may be a memory-mapped array)
+            batch_size: Number of samples per forward pass
+
+        Returns:
+            Predicted RUL values of shape (n_samples,)
+        """
+        self.eval()
+        outputs = []
+
+        with torch.no_grad():
+            for start in range(0, len(X), batch_size):
+                batch = np.asarray(X[start:start + batch_size], dtype=np.float32)
+                outputs.append(self(torch.from_numpy(batch)).numpy())
+
+        if not outputs:
+            return np.empty(0, dtype=np.float32)
+
+        return np.concatenate(outputs)
+
+
+class CNNLSTMRegressor(RULRegressor):
+    """
+    CNN-LSTM regressor for Remaining Useful Life prediction.
+
+    A 1-D convolution extracts local patterns along the time axis, a stacked
+    (optionally bidirectional) LSTM models the degradation trend and an
+    attention layer pools the sequence into a single RUL estimate.
+
+    Inputs of shape (batch, features) are treated as sequences of length one,
+    inputs of shape (batch, time, features) are used as-is.
+    """
+
+    def __init__(
+        self,
+        input_dim: int,
+        hidden_dim: int = 128,
+        num_layers: int = 3,
+        dropout: float = 0.3,
+        bidirectional: bool = True,
+        use_attention: bool = True,
+        conv_channels: int = 64,
+    ):
+        super().__init__(input_dim)
+
+        self.config = {
+            'input_dim': input_dim,
+            'hidden_dim': hidden_dim,
+            'num_layers': num_layers,
+            'dropout': dropout,
+            'bidirectional': bidirectional,
+            'use_attention': use_attention,
+            'conv_channels': conv_channels,
+        }
+
+        self.conv = nn.Sequential(
+            nn.Conv1d(input_dim, conv_channels, kernel_size=3, padding=1),
+            nn.ReLU(),
+        )
+
+        self.lstm = nn.LSTM(
+            input_size=conv_channels,
+            hidden_size=hidden_dim,
+            num_layers=num_layers,
+            dropout=dropout if num_layers > 1 else 0.0,
+            bidirectional=bidirectional,
+            batch_first=True,
+        )
+
+        lstm_output_dim = hidden_dim * (2 if bidirectional else 1)
+
+        self.attention = nn.Sequential(
+            nn.Linear(lstm_output_dim, lstm_output_dim // 2),
+            nn.Tanh(),
+            nn.Linear(lstm_output_dim // 2, 1),
+        ) if use_attention else None
+
+        self.head = nn.Sequential(
+            nn.Linear(lstm_output_dim, lstm_output_dim // 2),
+            nn.ReLU(),
+            nn.Dropout(dropout),
+            nn.Linear(lstm_output_dim // 2, 1),
+        )
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        x = self._normalize(x)
+
+        # Conv1d expects (batch, channels, time)
+        x = self.conv(x.transpose(1, 2)).transpose(1, 2)
+        output, _ = self.lstm(x)
+
+        if self.attention is not None:
+            weights = torch.softmax(self.attention(output), dim=1)
+            pooled = (weights * output).sum(dim=1)
+        else:
+            pooled = output[:, -1]
+
+        return self._denormalize(self.head(pooled))
+
+
+class CompactCNNRegressor(RULRegressor):
+    """
+    Compact 1-D CNN regressor used as a distilled student.
+
+    A few narrow convolutions followed by global average pooling over the
+    time axis; a small fraction of the CNN-LSTM's parameters and latency.
+    """
+
+    def __init__(self, input_dim: int, channels: int = 32, num_layers: int = 2):
+        super().__init__(input_dim)
+
+        self.config = {
+            'input_dim': input_dim,
+            'channels': channels,
+            'num_layers': num_layers,
+        }
+
+        layers = []
+        in_channels = input_dim
+        for _ in range(num_layers):
+            layers.extend([
+                nn.Conv1d(in_channels, channels, kernel_size=3, padding=1),
+                nn.ReLU(),
+            ])
+            in_channels = channels
+
+        self.conv = nn.Sequential(*layers)
+        self.head = nn.Linear(channels, 1)
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        x = self._normalize(x)
+
+        # Conv1d expects (batch, channels, time); pool over time
+        pooled = self.conv(x.transpose(1, 2)).mean(dim=2)
+
+        return self._denormalize(self.head(pooled))
+
+
+def build_model(input_dim: int, model_config: Optional[Dict[str, Any]] = None) -> CNNLSTMRegressor:
+    """
+    Build a CNN-LSTM regressor from a model configuration.
+
+    Args:
+        input_dim: Number of input features
+        model_config: Optional architecture overrides
+
+    Returns:
+        Untrained model
+    """
+    model_config = model_config or {}
+
+    return CNNLSTMRegressor(
+        input_dim=input_dim,
+        hidden_dim=model_config.get('hidden_dim', 128),
+        num_layers=model_config.get('num_layers', 3),
+        dropout=model_config.get('dropout', 0.3),
+        bidirectional=model_config.get('bidirectional', True),
+        use_attention=model_config.get('use_attention', True),
+        conv_channels=model_config.get('conv_channels', 64),
+    )
+
+
+def build_student_model(input_dim: int, student_config: Optional[Dict[str, Any]] = None) -> CompactCNNRegressor:
+    """
+    Build a compact 1-D CNN student from a student configuration.
+
+    Args:
+        input_dim: Number of input features
+        student_config: Optional architecture overrides
+
+    Returns:
+        Untrained student model
+    """
+    student_config = student_config or {}
+
+    return CompactCNNRegressor(
+        input_dim=input_dim,
+        channels=student_config.get('channels', 32),
+        num_layers=student_config.get('num_layers', 2),
+    )
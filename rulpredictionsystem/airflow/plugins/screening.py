@@ -0,0 +1,273 @@
+"""
+Stratified Screening Stage for Model Evaluation
+
+This module provides the first stage of the two-stage evaluation gate:
+- Stratified subsampling of the test set by RUL bucket and bearing
+- Stratified estimates and confidence bounds of the paired MAE and RMSE
+  deltas between a candidate and the production model
+- A screening decision: 'reject' when even the optimistic bound misses the
+  promotion thresholds, 'continue' to full evaluation otherwise
+
+Author: RUL Prediction System
+Version: 1.0.0
+"""
+
+import logging
+from statistics import NormalDist
+from typing import Dict, Any, Optional, Tuple
+
+import numpy as np
+
+from .metrics import MetricsAccumulator
+
+logger = logging.getLogger(__name__)
+
+
+# RUL bucket edges used for stratification
+DEFAULT_RUL_BUCKET_EDGES = (50, 100, 150)
+
+# Default screening settings
+DEFAULT_SAMPLE_FRACTION = 0.1
+DEFAULT_CONFIDENCE_LEVEL = 0.95
+MIN_SAMPLES_PER_STRATUM = 5
+
+
+def stratified_sample(
+    y: np.ndarray,
+    groups: Optional[np.ndarray] = None,
+    sample_fraction: float = DEFAULT_SAMPLE_FRACTION,
+    min_per_stratum: int = MIN_SAMPLES_PER_STRATUM,
+    rul_bucket_edges: Tuple[float, ...] = DEFAULT_RUL_BUCKET_EDGES,
+    random_seed: int = 42
+) -> Dict[str, np.ndarray]:
+    """
+    Draw a stratified random sample by RUL bucket (and bearing, if given).
+
+    Every stratum contributes sample_fraction of its rows, but at least
+    min_per_stratum rows (or all of them if it is smaller).
+
+    Args:
+        y: RUL labels
+        groups: Optional bearing id per row
+        sample_fraction: Fraction of each stratum to sample
+        min_per_stratum: Minimum rows per stratum
+        rul_bucket_edges: RUL bucket boundaries
+        random_seed: Random seed
+
+    Returns:
+        Dictionary with sorted sample 'rows', their 'strata' codes and the
+        per-stratum population and sample sizes ('stratum_sizes',
+        'sample_sizes')
+    """
+    y = np.asarray(y).ravel()
+    rng = np.random.default_rng(random_seed)
+
+    strata = np.digitize(y, rul_bucket_edges)
+    if groups is not None:
+        _, group_codes = np.unique(np.asarray(groups), return_inverse=True)
+        strata = strata * (group_codes.max() + 1) + group_codes
+
+    _, strata = np.unique(strata, return_inverse=True)
+    stratum_sizes = np.bincount(strata)
+
+    sample_sizes = np.maximum(
+        np.round(stratum_sizes * sample_fraction).astype(np.int64),
+        min_per_stratum
+    )
+    sample_sizes = np.minimum(sample_sizes, stratum_sizes)
+
+    # Random order within each stratum, then keep the first n_h rows of each
+    order = np.lexsort((rng.random(len(y)), strata))
+    stratum_starts = np.concatenate([[0], np.cumsum(stratum_sizes)[:-1]])
+    rank_in_stratum = np.arange(len(y)) - stratum_starts[strata[order]]
+    selected = order[rank_in_stratum < sample_sizes[strata[order]]]
+
+    rows = np.sort(selected)
+
+    return {
+        'rows': rows,
+        'strata': strata[rows],
+        'stratum_sizes': stratum_sizes,
+        'sample_sizes': sample_sizes,
+    }
+
+
+def stratified_mean(
+    values: np.ndarray,
+    strata: np.ndarray,
+    stratum_sizes: np.ndarray,
+    sample_sizes: np.ndarray,
+    confidence_level: float = DEFAULT_CONFIDENCE_LEVEL
+) -> Dict[str, float]:
+    """
+    Stratified estimate of a population mean with a normal confidence interval.
+
+    Args:
+        values: Per-sample values of the sampled rows
+        strata: Stratum code of each sampled row
+        stratum_sizes: Population size of each stratum
+        sample_sizes: Sample size of each stratum
+        confidence_level: Confidence level of the interval
+
+    Returns:
+        Dictionary with 'estimate', 'lower' and 'upper'
+    """
+    n_strata = len(stratum_sizes)
+    weights = stratum_sizes / stratum_sizes.sum()
+
+    sums = np.bincount(strata, weights=values, minlength=n_strata)
+    sums_sq = np.bincount(strata, weights=values * values, minlength=n_strata)
+
+    n_h = np.maximum(sample_sizes, 1)
+    means = sums / n_h
+
+    # Sample variance per stratum (zero for single-row strata)
+    variances = np.where(
+        sample_sizes > 1,
+        (sums_sq - n_h * means ** 2) / np.maximum(n_h - 1, 1),
+        0.0
+    )
+    finite_population = 1 - sample_sizes / stratum_sizes
+
+    estimate = float(np.sum(weights * means))
+    std_error = float(np.sqrt(np.sum(weights ** 2 * np.maximum(variances, 0) / n_h * finite_population)))
+    z = NormalDist().inv_cdf((1 + confidence_level) / 2)
+
+    return {
+        'estimate': estimate,
+        'lower': estimate - z * std_error,
+        'upper': estimate + z * std_error,
+    }
+
+
+def screen_models(
+    candidate_model: Any,
+    baseline_model: Any,
+    X: np.ndarray,
+    y: np.ndarray,
+    thresholds: Dict[str, float],
+    groups: Optional[np.ndarray] = None,
+    sample_fraction: float = DEFAULT_SAMPLE_FRACTION,
+    confidence_level: float = DEFAULT_CONFIDENCE_LEVEL,
+    random_seed: int = 42
+) -> Dict[str, Any]:
+    """
+    Screen a candidate against the baseline on a stratified subsample.
+
+    MAE and RMSE improvements (in %, positive when the candidate is better)
+    are estimated with confidence bounds from paired per-sample error
+    differences. The candidate is rejected when the upper bound of either
+    improvement is below its promotion threshold.
+
+    Args:
+        candidate_model: Candidate (staging) model
+        baseline_model: Baseline (production) model
+        X: Test features (may be memory-mapped)
+        y: Test labels
+        thresholds: Promotion thresholds (mae_improvement, rmse_improvement)
+        groups: Optional bearing id per test row
+        sample_fraction: Fraction of each stratum to score
+        confidence_level: Confidence level of the bounds
+        random_seed: Random seed
+
+    Returns:
+        Screening results with decision ('reject' or 'continue'), subsample
+        metrics of both models, improvement bounds and reasons
+    """
+    sample = stratified_sample(
+        np.asarray(y), groups, sample_fraction=sample_fraction, random_seed=random_seed
+    )
+    rows, strata = sample['rows'], sample['strata']
+    bounds_args = (strata, sample['stratum_sizes'], sample['sample_sizes'], confidence_level)
+
+    X_sample = np.asarray(X[rows], dtype=np.float32)
+    y_sample = np.asarray(y[rows], dtype=np.float64).ravel()
+
+    candidate_errors = y_sample - np.asarray(candidate_model.predict(X_sample), dtype=np.float64).ravel()
+    baseline_errors = y_sample - np.asarray(baseline_model.predict(X_sample), dtype=np.float64).ravel()
+
+    candidate_abs, baseline_abs = np.abs(candidate_errors), np.abs(baseline_errors)
+    candidate_sq, baseline_sq = candidate_errors ** 2, baseline_errors ** 2
+
+    baseline_mae = stratified_mean(baseline_abs, *bounds_args)['estimate']
+    baseline_mse = stratified_mean(baseline_sq, *bounds_args)['estimate']
+    candidate_mae = stratified_mean(candidate_abs, *bounds_args)['estimate']
+    candidate_mse = stratified_mean(candidate_sq, *bounds_args)['estimate']
+
+    mae_delta = stratified_mean(candidate_abs - baseline_abs, *bounds_args)
+    mse_delta = stratified_mean(candidate_sq - baseline_sq, *bounds_args)
+
+    results = {
+        'stage': 'screening',
+        'n_samples': len(rows),
+        'n_strata': len(sample['stratum_sizes']),
+        'sample_fraction': sample_fraction,
+        'confidence_level': confidence_level,
+        'candidate_metrics': _sample_metrics(y_sample, candidate_errors, candidate_mae, candidate_mse),
+        'baseline_metrics': _sample_metrics(y_sample, baseline_errors, baseline_mae, baseline_mse),
+    }
+
+    if baseline_mae <= 0 or baseline_mse <= 0:
+        results.update({
+            'decision': 'continue',
+            'reasons': ["Baseline has zero error on the subsample, screening skipped"],
+        })
+        return results
+
+    # Improvement bounds in %; the upper improvement bound comes from the lower delta bound
+    baseline_rmse = np.sqrt(baseline_mse)
+    mae_improvement = {
+        key: float(-mae_delta[bound] / baseline_mae * 100)
+        for key, bound in (('estimate', 'estimate'), ('lower', 'upper'), ('upper', 'lower'))
+    }
+    rmse_improvement = {
+        key: float((baseline_rmse - np.sqrt(max(baseline_mse + mse_delta[bound], 0.0))) / baseline_rmse * 100)
+        for key, bound in (('estimate', 'estimate'), ('lower', 'upper'), ('upper', 'lower'))
+    }
+
+    reasons = []
+    for metric, improvement in (('MAE', mae_improvement), ('RMSE', rmse_improvement)):
+        required = thresholds.get(f'{metric.lower()}_improvement', 0) * 100
+        if improvement['upper'] < required:
+            reasons.append(
+                f"{metric} improvement upper bound ({improvement['upper']:.2f}%) "
+                f"does not meet threshold ({required:.2f}%) at screening stage"
+            )
+
+    rejected = bool(reasons)
+
+    if not rejected:
+        reasons.append(
+            f"Plausible improvement (MAE {mae_improvement['estimate']:.2f}%, "
+            f"RMSE {rmse_improvement['estimate']:.2f}%), continuing to full evaluation"
+        )
+
+    results.update({
+        'decision': 'reject' if rejected else 'continue',
+        'mae_improvement_pct': mae_improvement,
+        'rmse_improvement_pct': rmse_improvement,
+        'reasons': reasons,
+    })
+
+    logger.info(f"Screening decision: {results['decision']} ({reasons})")
+
+    return results
+
+
+def _sample_metrics(
+    y_sample: np.ndarray,
+    errors: np.ndarray,
+    mae: float,
+    mse: float
+) -> Dict[str, float]:
+    """
+    Subsample metrics with MAE/MSE/RMSE replaced by stratified estimates.
+    """
+    metrics = MetricsAccumulator().update(y_sample, y_sample - errors).compute()
+    metrics.update({
+        'mae': float(mae),
+        'mse': float(mse),
+        'rmse': float(np.sqrt(mse)),
+    })
+
+    return metrics
@@ -0,0 +1,200 @@
+"""
+Training Step Profiler for the RUL Prediction Model
+
+This module provides a lightweight profiler that the training loop calls
+after every step and epoch. It records:
+- Per-step time split into data fetch, host-to-tensor conversion,
+  forward, backward and optimizer phases
+- Per-epoch throughput and validation time
+- Peak resident set size (RSS) of the training process
+
+The resulting profile tells whether a training run was input-bound or
+compute-bound.
+
+Author: RUL Prediction System
+Version: 1.0.0
+"""
+
+import os
+import json
+import time
+import logging
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+# Phases of a training step, in execution order
+TRAINING_PHASES = ['data_fetch', 'host_to_tensor', 'forward', 'backward', 'optimizer']
+
+# Phases that count as input pipeline time
+INPUT_PHASES = ['data_fetch', 'host_to_tensor']
+
+# Input share above which an epoch is reported as input-bound
+INPUT_BOUND_THRESHOLD = 0.5
+
+
+def get_peak_rss_mb() -> float:
+    """
+    Get the peak resident set size of the current process in MB.
+    """
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except (ImportError, OSError):
+        return 0.0
+
+    # ru_maxrss is reported in KB on Linux and in bytes on macOS
+    if os.uname().sysname == 'Darwin':
+        return peak / (1024 * 1024)
+
+    return peak / 1024
+
+
+class TrainingProfiler:
+    """
+    Collects step and epoch timings from the training loop.
+
+    The training loop calls ``start_epoch`` at the beginning of every epoch,
+    ``record_step`` after every optimizer step and ``end_epoch`` once
+    validation has finished.
+    """
+
+    def __init__(self):
+        self.epochs: List[Dict[str, Any]] = []
+        self._step_times: Dict[str, List[float]] = {phase: [] for phase in TRAINING_PHASES}
+        self._samples = 0
+        self._epoch_start: Optional[float] = None
+
+    def start_epoch(self) -> None:
+        """Reset per-epoch counters"""
+        self._step_times = {phase: [] for phase in TRAINING_PHASES}
+        self._samples = 0
+        self._epoch_start = time.perf_counter()
+
+    def record_step(self, timings: Dict[str, float], n_samples: int) -> None:
+        """
+        Record the phase timings of one training step.
+
+        Args:
+            timings: Seconds spent in each training phase
+            n_samples: Number of samples in the step's batch
+        """
+        for phase in TRAINING_PHASES:
+            self._step_times[phase].append(timings.get(phase, 0.0))
+
+        self._samples += n_samples
+
+    def end_epoch(self, epoch: int, validation_seconds: float = 0.0) -> Dict[str, Any]:
+        """
+        Summarize the current epoch.
+
+        Args:
+            epoch: Epoch number
+            validation_seconds: Time spent on validation
+
+        Returns:
+            Epoch performance summary
+        """
+        wall_time = time.perf_counter() - (self._epoch_start or time.perf_counter())
+
+        phases = {}
+        for phase, times in self._step_times.items():
+            times = np.asarray(times) if times else np.zeros(1)
+            phases[phase] = {
+                'total_seconds': round(float(times.sum()), 4),
+                'mean_ms': round(float(times.mean() * 1000), 3),
+                'p50_ms': round(float(np.percentile(times, 50) * 1000), 3),
+                'p95_ms': round(float(np.percentile(times, 95) * 1000), 3),
+            }
+
+        step_seconds = sum(phase['total_seconds'] for phase in phases.values())
+        input_seconds = sum(phases[phase]['total_seconds'] for phase in INPUT_PHASES)
+        input_share = input_seconds / step_seconds if step_seconds > 0 else 0.0
+
+        summary = {
+            'epoch': epoch,
+            'steps': len(self._step_times['forward']),
+            'samples': self._samples,
+            'wall_time_seconds': round(wall_time, 4),
+            'validation_seconds': round(validation_seconds, 4),
+            'samples_per_second': round(self._samples / wall_time, 2) if wall_time > 0 else 0.0,
+            'phases': phases,
+            'input_share': round(input_share, 4),
+            'bottleneck': 'input' if input_share > INPUT_BOUND_THRESHOLD else 'compute',
+            'peak_rss_mb': round(get_peak_rss_mb(), 2),
+        }
+
+        self.epochs.append(summary)
+
+        logger.info(
+            f"Epoch {epoch}: {summary['samples_per_second']} samples/s, "
+            f"input share {input_share:.1%} ({summary['bottleneck']}-bound), "
+            f"peak RSS {summary['peak_rss_mb']} MB"
+        )
+
+        return summary
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Aggregate the per-epoch summaries of the whole run.
+        """
+        if not self.epochs:
+            return {}
+
+        total_samples = sum(epoch['samples'] for epoch in self.epochs)
+        total_wall = sum(epoch['wall_time_seconds'] for epoch in self.epochs)
+
+        phase_seconds = {
+            phase: round(sum(epoch['phases'][phase]['total_seconds'] for epoch in self.epochs), 4)
+            for phase in TRAINING_PHASES
+        }
+        step_seconds = sum(phase_seconds.values())
+        input_share = (
+            sum(phase_seconds[phase] for phase in INPUT_PHASES) / step_seconds
+            if step_seconds > 0 else 0.0
+        )
+
+        return {
+            'epochs': len(self.epochs),
+            'steps': sum(epoch['steps'] for epoch in self.epochs),
+            'samples': total_samples,
+            'wall_time_seconds': round(total_wall, 4),
+            'samples_per_second': round(total_samples / total_wall, 2) if total_wall > 0 else 0.0,
+            'phase_seconds': phase_seconds,
+            'phase_share': {
+                phase: round(seconds / step_seconds, 4) if step_seconds > 0 else 0.0
+                for phase, seconds in phase_seconds.items()
+            },
+            'input_share': round(input_share, 4),
+            'bottleneck': 'input' if input_share > INPUT_BOUND_THRESHOLD else 'compute',
+            'peak_rss_mb': max(epoch['peak_rss_mb'] for epoch in self.epochs),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Full profile: run summary plus per-epoch reports"""
+        return {
+            'summary': self.summary(),
+            'epochs': self.epochs,
+        }
+
+    def save(self, profile_path: str) -> str:
+        """
+        Save the profile as JSON.
+
+        Args:
+            profile_path: Output path (typically next to the model)
+
+        Returns:
+            Path to the saved profile
+        """
+        os.makedirs(os.path.dirname(profile_path), exist_ok=True)
+
+        with open(profile_path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+        logger.info(f"Training profile saved to: {profile_path}")
+
+        return profile_path
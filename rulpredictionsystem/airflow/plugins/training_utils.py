@@ -0,0 +1,532 @@
+"""
+Training Utilities for the RUL Prediction Model
+
+This module provides utility functions for:
+- Mini-batch training of the CNN-LSTM model
+- Bearing-grouped train/validation splits
+- Parallel grouped cross-validation over a memory-mapped feature store
+
+Author: RUL Prediction System
+Version: 1.0.0
+"""
+
+import os
+import time
+import logging
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+from .worker_pool import spawn_pool, threads_per_worker
+
+logger = logging.getLogger(__name__)
+
+
+# Metrics summarized across cross-validation folds
+CV_SUMMARY_METRICS = ['mae', 'rmse', 'mse', 'r2', 'mape', 'max_error']
+
+
+# ============================================================================
+# Data Helpers
+# ============================================================================
+
+def load_feature_store(
+    features_dir: str,
+    mmap_mode: Optional[str] = 'r'
+) -> Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]:
+    """
+    Load features, labels and bearing groups from the feature store.
+
+    Args:
+        features_dir: Directory containing features.npy, labels.npy and
+            optionally groups.npy
+        mmap_mode: Memory-map mode passed to np.load (None loads into memory)
+
+    Returns:
+        Tuple of (features, labels, groups). groups is None when the feature
+        store has no bearing assignment.
+
+    Raises:
+        FileNotFoundError: If features or labels are missing
+    """
+    features_path = os.path.join(features_dir, 'features.npy')
+    labels_path = os.path.join(features_dir, 'labels.npy')
+    groups_path = os.path.join(features_dir, 'groups.npy')
+
+    for path in (features_path, labels_path):
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Feature store file not found: {path}")
+
+    X = np.load(features_path, mmap_mode=mmap_mode)
+    y = np.load(labels_path, mmap_mode=mmap_mode)
+    groups = np.load(groups_path, mmap_mode=mmap_mode) if os.path.exists(groups_path) else None
+
+    if len(X) != len(y):
+        raise ValueError(f"Features ({len(X)}) and labels ({len(y)}) are not aligned")
+
+    return X, y, groups
+
+
+def grouped_train_val_split(
+    n_samples: int,
+    groups: Optional[np.ndarray],
+    validation_split: float = 0.2,
+    random_seed: int = 42
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Split sample indices into train and validation sets.
+
+    When bearing groups are available, all windows of a bearing end up on
+    the same side of the split. Otherwise a random split is used.
+
+    Args:
+        n_samples: Number of samples
+        groups: Optional bearing group per sample
+        validation_split: Fraction of samples (or groups) held out
+        random_seed: Random seed
+
+    Returns:
+        Tuple of (train_indices, val_indices)
+    """
+    indices = np.arange(n_samples)
+
+    if groups is not None and len(np.unique(groups)) > 1:
+        from sklearn.model_selection import GroupShuffleSplit
+
+        splitter = GroupShuffleSplit(
+            n_splits=1,
+            test_size=validation_split,
+            random_state=random_seed
+        )
+        train_idx, val_idx = next(splitter.split(indices, groups=np.asarray(groups)))
+        return train_idx, val_idx
+
+    from sklearn.model_selection import train_test_split
+
+    train_idx, val_idx = train_test_split(
+        indices,
+        test_size=validation_split,
+        random_state=random_seed
+    )
+
+    return np.sort(train_idx), np.sort(val_idx)
+
+
+def compute_feature_stats(
+    X: np.ndarray,
+    indices: np.ndarray,
+    chunk_size: int = 65536
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute per-feature mean and standard deviation over selected rows.
+
+    Rows are read in chunks so memory-mapped feature stores are never
+    materialized in full.
+
+    Args:
+        X: Feature array
+        indices: Row indices to include
+        chunk_size: Number of rows per chunk
+
+    Returns:
+        Tuple of (mean, std)
+    """
+    indices = np.sort(indices)
+    total = np.zeros(X.shape[1:], dtype=np.float64)
+    total_sq = np.zeros(X.shape[1:], dtype=np.float64)
+
+    for start in range(0, len(indices), chunk_size):
+        chunk = np.asarray(X[indices[start:start + chunk_size]], dtype=np.float64)
+        total += chunk.sum(axis=0)
+        total_sq += np.square(chunk).sum(axis=0)
+
+    n = max(len(indices), 1)
+    mean = total / n
+    std = np.sqrt(np.maximum(total_sq / n - np.square(mean), 0.0))
+
+    # Sequence inputs are standardized per feature across all time steps
+    if mean.ndim > 1:
+        mean = mean.mean(axis=0)
+        std = std.mean(axis=0)
+
+    return mean, std
+
+
+# ============================================================================
+# Training Loop
+# ============================================================================
+
+def fit_model(
+    model: Any,
+    X: np.ndarray,
+    y: np.ndarray,
+    train_idx: np.ndarray,
+    val_idx: Optional[np.ndarray],
+    training_config: Dict[str, Any],
+    rank: int = 0,
+    world_size: int = 1,
+    profiler: Optional[Any] = None
+) -> Dict[str, Any]:
+    """
+    Train a PyTorch model on rows of a (possibly memory-mapped) feature store.
+
+    Batches are gathered from X by index so only the current batch is held
+    in memory. The best weights by validation loss are restored at the end.
+
+    For data-parallel training, pass a DistributedDataParallel model together
+    with this process' rank and the world size. Every rank draws the same
+    permutation and trains on its own equal-sized shard, with the global
+    batch size split across ranks. Losses are all-reduced so early stopping
+    decisions agree on every rank.
+
+    Args:
+        model: PyTorch model (optionally wrapped in DistributedDataParallel)
+        X: Feature array
+        y: Label array
+        train_idx: Training row indices
+        val_idx: Validation row indices (None disables early stopping)
+        training_config: Training configuration (epochs, batch_size,
+            learning_rate, early_stopping_patience, random_seed)
+        rank: Rank of this process in the process group
+        world_size: Number of processes in the process group
+        profiler: Optional TrainingProfiler receiving step and epoch timings
+
+    Returns:
+        Training history summary
+    """
+    import torch
+
+    epochs = int(training_config.get('epochs', 100))
+    batch_size = int(training_config.get('batch_size', 32))
+    learning_rate = float(training_config.get('learning_rate', 0.001))
+    patience = int(training_config.get('early_stopping_patience', 10))
+    seed = int(training_config.get('random_seed', 42))
+
+    distributed = world_size > 1
+
+    # Decided on the global validation set, so every rank validates (and
+    # joins the loss all-reduce) even if its own shard is empty
+    validate = val_idx is not None and len(val_idx) > 0
+
+    if distributed:
+        batch_size = max(1, batch_size // world_size)
+        if validate:
+            val_idx = val_idx[rank::world_size]
+
+    # Validation runs on the bare module so it issues no collectives
+    eval_model = getattr(model, 'module', model)
+
+    torch.manual_seed(seed)
+    rng = np.random.default_rng(seed)
+
+    optimizer = torch.optim.Adam(model.parameters(), lr=learning_rate)
+    loss_fn = torch.nn.MSELoss()
+
+    start_time = time.time()
+    best_val_loss = float('inf')
+    best_state = None
+    epochs_without_improvement = 0
+    train_loss = float('nan')
+    val_loss = float('nan')
+    epoch = 0
+
+    for epoch in range(1, epochs + 1):
+        model.train()
+        order = rng.permutation(train_idx)
+        epoch_loss = 0.0
+
+        if distributed:
+            # Equal shards keep the gradient all-reduces in lockstep
+            shard_size = len(order) // world_size
+            order = order[rank * shard_size:(rank + 1) * shard_size]
+
+        if profiler is not None:
+            profiler.start_epoch()
+
+        for start in range(0, len(order), batch_size):
+            t_start = time.perf_counter()
+
+            # Sorted indices keep memory-mapped reads sequential
+            batch_idx = np.sort(order[start:start + batch_size])
+            X_rows = X[batch_idx]
+            y_rows = y[batch_idx]
+            t_fetched = time.perf_counter()
+
+            X_batch = torch.from_numpy(np.asarray(X_rows, dtype=np.float32))
+            y_batch = torch.from_numpy(np.asarray(y_rows, dtype=np.float32))
+            t_converted = time.perf_counter()
+
+            loss = loss_fn(model(X_batch), y_batch)
+            t_forward = time.perf_counter()
+
+            optimizer.zero_grad()
+            loss.backward()
+            t_backward = time.perf_counter()
+
+            optimizer.step()
+            t_optimizer = time.perf_counter()
+
+            epoch_loss += loss.item() * len(batch_idx)
+
+            if profiler is not None:
+                profiler.record_step({
+                    'data_fetch': t_fetched - t_start,
+                    'host_to_tensor': t_converted - t_fetched,
+                    'forward': t_forward - t_converted,
+                    'backward': t_backward - t_forward,
+                    'optimizer': t_optimizer - t_backward,
+                }, len(batch_idx))
+
+        train_loss_sum, n_train = _reduce_sums([epoch_loss, len(order)], distributed)
+        train_loss = train_loss_sum / max(n_train, 1)
+
+        if not validate:
+            if profiler is not None:
+                profiler.end_epoch(epoch)
+            continue
+
+        t_validation = time.perf_counter()
+        val_sse, n_val = _reduce_sums(
+            _squared_error_sum(eval_model, X, y, val_idx, batch_size=max(batch_size, 1024))
+            if len(val_idx) else [0.0, 0],
+            distributed
+        )
+        val_loss = val_sse / max(n_val, 1)
+
+        if profiler is not None:
+            profiler.end_epoch(epoch, validation_seconds=time.perf_counter() - t_validation)
+
+        if val_loss < best_val_loss:
+            best_val_loss = val_loss
+            best_state = {k: v.detach().clone() for k, v in model.state_dict().items()}
+            epochs_without_improvement = 0
+        else:
+            epochs_without_improvement += 1
+            if epochs_without_improvement >= patience:
+                logger.info(f"Early stopping at epoch {epoch}")
+                break
+
+    if best_state is not None:
+        model.load_state_dict(best_state)
+
+    return {
+        'epochs_completed': epoch,
+        'final_train_loss': float(train_loss),
+        'final_val_loss': float(val_loss),
+        'best_val_loss': float(best_val_loss),
+        'training_time_seconds': round(time.time() - start_time, 2),
+    }
+
+
+def evaluate_loss(
+    model: Any,
+    X: np.ndarray,
+    y: np.ndarray,
+    indices: np.ndarray,
+    batch_size: int = 1024
+) -> float:
+    """
+    Compute the mean squared error of a model over selected rows.
+    """
+    total, count = _squared_error_sum(model, X, y, indices, batch_size)
+
+    return total / max(count, 1)
+
+
+def _squared_error_sum(
+    model: Any,
+    X: np.ndarray,
+    y: np.ndarray,
+    indices: np.ndarray,
+    batch_size: int = 1024
+) -> List[float]:
+    """
+    Compute the sum of squared errors and the row count over selected rows.
+    """
+    import torch
+
+    model.eval()
+    total = 0.0
+
+    with torch.no_grad():
+        for start in range(0, len(indices), batch_size):
+            batch_idx = indices[start:start + batch_size]
+            X_batch = torch.from_numpy(np.asarray(X[batch_idx], dtype=np.float32))
+            y_batch = torch.from_numpy(np.asarray(y[batch_idx], dtype=np.float32))
+            total += torch.sum((model(X_batch) - y_batch) ** 2).item()
+
+    return [total, len(indices)]
+
+
+def _reduce_sums(values: List[float], distributed: bool) -> List[float]:
+    """
+    Sum values across all ranks of the default process group.
+    """
+    if not distributed:
+        return values
+
+    import torch
+    import torch.distributed as dist
+
+    tensor = torch.tensor(values, dtype=torch.float64)
+    dist.all_reduce(tensor, op=dist.ReduceOp.SUM)
+
+    return tensor.tolist()
+
+
+def train_rul_model(
+    X: np.ndarray,
+    y: np.ndarray,
+    train_idx: np.ndarray,
+    val_idx: Optional[np.ndarray],
+    training_config: Dict[str, Any],
+    profiler: Optional[Any] = None
+) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Build, normalize and train a CNN-LSTM model.
+
+    Args:
+        X: Feature array
+        y: Label array
+        train_idx: Training row indices
+        val_idx: Validation row indices
+        training_config: Training configuration, optionally with a
+            'model_config' entry of architecture overrides
+        profiler: Optional TrainingProfiler for step timings
+
+    Returns:
+        Tuple of (trained model, training history)
+    """
+    from .rul_model import build_model
+
+    model = build_model(X.shape[-1], training_config.get('model_config'))
+
+    y_train = np.asarray(y[np.sort(train_idx)], dtype=np.float64)
+    model.set_normalization(
+        *compute_feature_stats(X, train_idx),
+        target_mean=float(y_train.mean()),
+        target_std=float(y_train.std())
+    )
+
+    history = fit_model(model, X, y, train_idx, val_idx, training_config, profiler=profiler)
+
+    return model, history
+
+
+# ============================================================================
+# Cross-Validation
+# ============================================================================
+
+def _train_fold(
+    fold: int,
+    features_dir: str,
+    train_idx: np.ndarray,
+    val_idx: np.ndarray,
+    training_config: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Train and score a single cross-validation fold in a worker process.
+
+    The worker memory-maps the feature store itself, so only fold indices
+    cross the process boundary.
+    """
+    from .model_utils import calculate_metrics
+
+    X, y, _ = load_feature_store(features_dir, mmap_mode='r')
+
+    model, history = train_rul_model(X, y, train_idx, val_idx, training_config)
+    y_pred = model.predict(X[val_idx])
+
+    return {
+        'fold': fold,
+        'n_train_samples': len(train_idx),
+        'n_val_samples': len(val_idx),
+        'history': history,
+        'metrics': calculate_metrics(np.asarray(y[val_idx]), y_pred),
+    }
+
+
+def grouped_cross_validate(
+    features_dir: str,
+    training_config: Dict[str, Any],
+    n_folds: int = 5,
+    n_workers: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Run bearing-grouped k-fold cross-validation with parallel fold workers.
+
+    Folds are built with GroupKFold so no bearing contributes windows to
+    both the training and validation side of a fold. Each fold is trained
+    in its own process over the shared memory-mapped feature store.
+
+    Args:
+        features_dir: Feature store directory (must contain groups.npy)
+        training_config: Training configuration
+        n_folds: Number of folds
+        n_workers: Number of worker processes (defaults to one per fold,
+            capped by the CPU count)
+
+    Returns:
+        Per-fold results plus mean and standard deviation of fold metrics
+
+    Raises:
+        ValueError: If bearing groups are missing or too few for two folds
+    """
+    from sklearn.model_selection import GroupKFold
+
+    X, y, groups = load_feature_store(features_dir, mmap_mode='r')
+
+    if groups is None:
+        raise ValueError(f"Grouped cross-validation requires groups.npy in {features_dir}")
+
+    groups = np.asarray(groups)
+    n_groups = len(np.unique(groups))
+    n_folds = min(n_folds, n_groups)
+
+    if n_folds < 2:
+        raise ValueError(f"Grouped cross-validation needs at least 2 bearings, found {n_groups}")
+
+    splitter = GroupKFold(n_splits=n_folds)
+    folds = list(splitter.split(np.zeros(len(groups)), groups=groups))
+
+    n_workers = max(1, min(n_workers or n_folds, n_folds, os.cpu_count() or 1))
+    n_threads = threads_per_worker(n_workers)
+
+    logger.info(
+        f"Running {n_folds}-fold grouped cross-validation over {n_groups} bearings "
+        f"with {n_workers} workers ({n_threads} threads each)"
+    )
+
+    start_time = time.time()
+
+    with spawn_pool(n_workers, n_threads) as executor:
+        futures = [
+            executor.submit(
+                _train_fold, fold, features_dir, train_idx, val_idx, training_config
+            )
+            for fold, (train_idx, val_idx) in enumerate(folds)
+        ]
+        fold_results = [future.result() for future in futures]
+
+    cv_results = {
+        'n_folds': n_folds,
+        'n_groups': n_groups,
+        'n_workers': n_workers,
+        'folds': fold_results,
+        'metrics_mean': {},
+        'metrics_std': {},
+        'wall_time_seconds': round(time.time() - start_time, 2),
+    }
+
+    for metric in CV_SUMMARY_METRICS:
+        values = [fold['metrics'][metric] for fold in fold_results if metric in fold['metrics']]
+        if values:
+            cv_results['metrics_mean'][metric] = float(np.mean(values))
+            cv_results['metrics_std'][metric] = float(np.std(values))
+
+    logger.info(
+        f"Cross-validation completed: mean={cv_results['metrics_mean']}, "
+        f"std={cv_results['metrics_std']}"
+    )
+
+    return cv_results
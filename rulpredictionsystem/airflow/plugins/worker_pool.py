@@ -0,0 +1,51 @@
+"""
+Process Pools for CPU-Bound Plugin Work
+
+This module provides the worker pool shared by cross-validation, concurrent
+evaluation, permutation importance and benchmark cards:
+- Workers are spawned rather than forked, so they don't inherit the
+  parent's framework thread pools (forking after torch has started its
+  threads can deadlock the child)
+- Each worker limits its framework threads on start-up, so the workers
+  together use the CPUs once instead of oversubscribing them
+
+Author: RUL Prediction System
+Version: 1.0.0
+"""
+
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+
+def threads_per_worker(n_workers: int) -> int:
+    """Framework threads per worker when n_workers share the CPUs"""
+    return max(1, (os.cpu_count() or 1) // n_workers)
+
+
+def set_worker_threads(n_threads: int) -> None:
+    """Limit the framework threads of the current process (torch, if installed)"""
+    try:
+        import torch
+        torch.set_num_threads(n_threads)
+    except ImportError:
+        pass
+
+
+def spawn_pool(n_workers: int, n_threads: int) -> ProcessPoolExecutor:
+    """
+    Process pool of spawned workers, each limited to n_threads framework threads.
+
+    Args:
+        n_workers: Number of worker processes
+        n_threads: Framework threads per worker
+
+    Returns:
+        ProcessPoolExecutor (use as a context manager)
+    """
+    return ProcessPoolExecutor(
+        max_workers=n_workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=set_worker_threads,
+        initargs=(n_threads,)
+    )
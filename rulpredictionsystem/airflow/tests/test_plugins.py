@@ -0,0 +1,1066 @@
+"""
+Unit Tests for Airflow Plugins
+
+This module contains unit tests for the training, evaluation and
+model management utilities in the plugins package.
+
+Usage:
+    pytest tests/test_plugins.py -v
+"""
+
+import os
+import sys
+import pytest
+import numpy as np
+
+# Add project paths
+AIRFLOW_HOME = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, AIRFLOW_HOME)
+
+
+@pytest.fixture
+def feature_store(tmp_path):
+    """Create a small feature store with 8 bearings"""
+    rng = np.random.default_rng(0)
+    n_samples = 160
+
+    X = rng.normal(size=(n_samples, 6)).astype(np.float32)
+    y = (50 + 10 * X[:, 0]).astype(np.float32)
+    groups = np.array([f"B{i % 8:03d}" for i in range(n_samples)])
+
+    np.save(tmp_path / 'features.npy', X)
+    np.save(tmp_path / 'labels.npy', y)
+    np.save(tmp_path / 'groups.npy', groups)
+
+    return tmp_path
+
+
+@pytest.fixture
+def small_training_config():
+    """Training configuration for a tiny, fast model"""
+    return {
+        'epochs': 2,
+        'batch_size': 32,
+        'learning_rate': 0.01,
+        'model_config': {'hidden_dim': 8, 'num_layers': 1, 'conv_channels': 8},
+    }
+
+
+@pytest.fixture
+def trained_model(feature_store, small_training_config, tmp_path):
+    """Train a tiny model on the feature store (profiled) and save it to staging/model.pt"""
+    pytest.importorskip('torch')
+    from plugins.model_utils import save_model
+    from plugins.training_profiler import TrainingProfiler
+    from plugins.training_utils import (
+        load_feature_store,
+        grouped_train_val_split,
+        train_rul_model,
+    )
+
+    X, y, groups = load_feature_store(str(feature_store))
+    train_idx, val_idx = grouped_train_val_split(len(X), groups)
+
+    profiler = TrainingProfiler()
+    model, _ = train_rul_model(X, y, train_idx, val_idx, small_training_config, profiler=profiler)
+
+    model_path = str(tmp_path / 'staging' / 'model.pt')
+    save_model(model, model_path)
+
+    return {
+        'model': model,
+        'model_path': model_path,
+        'X': X,
+        'train_idx': train_idx,
+        'profiler': profiler,
+    }
+
+
+class TestMetricsAccumulator:
+    """Test streaming metrics accumulator"""
+
+    def test_matches_full_array_metrics(self):
+        """Test streamed, merged metrics equal metrics over the full arrays"""
+        sklearn_metrics = pytest.importorskip('sklearn.metrics')
+        from plugins.metrics import MetricsAccumulator
+
+        rng = np.random.default_rng(1)
+        y_true = rng.uniform(1, 300, size=10000)
+        y_pred = y_true + rng.normal(0, 15, size=10000)
+
+        # Two workers stream alternating batches, then merge
+        left, right = MetricsAccumulator(), MetricsAccumulator()
+        for i, rows in enumerate(np.array_split(np.arange(10000), 15)):
+            (left if i % 2 else right).update(y_true[rows], y_pred[rows])
+
+        metrics = left.merge(right).compute_detailed()
+        residuals = y_true - y_pred
+
+        assert len(left) == 10000
+        assert metrics['mae'] == pytest.approx(sklearn_metrics.mean_absolute_error(y_true, y_pred))
+        assert metrics['mse'] == pytest.approx(sklearn_metrics.mean_squared_error(y_true, y_pred))
+        assert metrics['r2'] == pytest.approx(sklearn_metrics.r2_score(y_true, y_pred))
+        assert metrics['mape'] == pytest.approx(
+            sklearn_metrics.mean_absolute_percentage_error(y_true, y_pred) * 100
+        )
+        assert metrics['max_error'] == pytest.approx(np.abs(residuals).max())
+        assert metrics['residual_mean'] == pytest.approx(residuals.mean())
+        assert metrics['residual_std'] == pytest.approx(residuals.std())
+        assert metrics['median_error'] == pytest.approx(np.median(np.abs(residuals)), rel=0.02)
+
+    def test_empty_accumulator(self):
+        """Test computing metrics without samples is rejected"""
+        from plugins.metrics import MetricsAccumulator
+
+        with pytest.raises(ValueError):
+            MetricsAccumulator().compute()
+
+
+class TestEvaluation:
+    """Test batched model evaluation"""
+
+    def test_batched_evaluation(self, tmp_path):
+        """Test batched, memory-capped evaluation matches full-array metrics"""
+        from plugins.evaluation import load_test_set, evaluate_model_batched
+        from plugins.model_utils import calculate_metrics
+
+        class LinearModel:
+            def predict(self, X):
+                return X @ np.arange(1, 7, dtype=np.float32)
+
+        rng = np.random.default_rng(2)
+        X = rng.normal(size=(5000, 6)).astype(np.float32)
+        y = X @ np.arange(1, 7) + rng.normal(size=5000) + 100
+
+        np.save(tmp_path / 'test_features.npy', X)
+        np.save(tmp_path / 'test_labels.npy', y)
+
+        X_test, y_test = load_test_set(
+            str(tmp_path / 'test_features.npy'),
+            str(tmp_path / 'test_labels.npy')
+        )
+        assert isinstance(X_test, np.memmap)
+
+        # A tiny ceiling forces many small batches
+        accumulator, stats = evaluate_model_batched(
+            LinearModel(), X_test, y_test, batch_size=4096, memory_limit_mb=0.5
+        )
+
+        assert stats['n_batches'] > 1
+        assert stats['rows_per_second'] > 0
+        assert accumulator.compute()['mae'] == pytest.approx(
+            calculate_metrics(y, LinearModel().predict(X))['mae']
+        )
+
+    def test_concurrent_evaluation(self, tmp_path):
+        """Test co-scheduled evaluation returns one result per model"""
+        pytest.importorskip('sklearn')
+        import joblib
+        from sklearn.linear_model import LinearRegression
+        from plugins.evaluation import evaluate_models_concurrently, score_model_file
+
+        rng = np.random.default_rng(3)
+        X = rng.normal(size=(2000, 6)).astype(np.float32)
+        y = X @ np.arange(1, 7) + rng.normal(size=2000)
+
+        np.save(tmp_path / 'test_features.npy', X)
+        np.save(tmp_path / 'test_labels.npy', y)
+
+        # Production model is fitted on a few noisy rows, so it scores worse
+        models = {
+            'staging_model': LinearRegression().fit(X, y),
+            'production_model': LinearRegression().fit(X[:20], y[:20] + rng.normal(0, 20, size=20)),
+        }
+        model_paths = {}
+        for name, model in models.items():
+            model_paths[name] = str(tmp_path / f'{name}.pkl')
+            joblib.dump(model, model_paths[name])
+
+        features_path = str(tmp_path / 'test_features.npy')
+        labels_path = str(tmp_path / 'test_labels.npy')
+
+        results = evaluate_models_concurrently(model_paths, features_path, labels_path, n_workers=2)
+
+        assert set(results) == set(model_paths)
+        for name, model_path in model_paths.items():
+            assert results[name]['model_name'] == name
+            assert results[name]['metrics']['mae'] == pytest.approx(
+                score_model_file(model_path, name, features_path, labels_path)['metrics']['mae']
+            )
+        assert results['staging_model']['metrics']['mae'] < results['production_model']['metrics']['mae']
+
+
+class TestPredictionCache:
+    """Test prediction cache"""
+
+    def test_cache_hit_and_appended_rows(self, tmp_path):
+        """Test cached predictions are reused and only appended rows are scored"""
+        from plugins.prediction_cache import PredictionCache
+
+        model_path = tmp_path / 'model.pkl'
+        model_path.write_bytes(b'model-v1')
+
+        scored_rows = []
+
+        def predict_fn(X):
+            scored_rows.append(len(X))
+            return X.sum(axis=1)
+
+        rng = np.random.default_rng(4)
+        X = rng.normal(size=(300, 6)).astype(np.float32)
+        cache = PredictionCache(str(tmp_path / 'cache'))
+
+        predictions, info = cache.get_or_predict(str(model_path), X, predict_fn)
+        assert info == {'status': 'miss', 'rows_predicted': 300}
+
+        cached, info = cache.get_or_predict(str(model_path), X, predict_fn)
+        assert info['status'] == 'hit'
+        np.testing.assert_array_equal(cached, predictions)
+
+        # Appended rows: only the new rows are scored
+        X_grown = np.concatenate([X, rng.normal(size=(50, 6)).astype(np.float32)])
+        grown, info = cache.get_or_predict(str(model_path), X_grown, predict_fn)
+        assert info == {'status': 'partial', 'rows_predicted': 50}
+        np.testing.assert_allclose(grown, X_grown.sum(axis=1), rtol=1e-6)
+
+        # A changed model artifact misses
+        model_path.write_bytes(b'model-v2')
+        _, info = cache.get_or_predict(str(model_path), X_grown, predict_fn)
+        assert info['status'] == 'miss'
+        assert scored_rows == [300, 50, 350]
+
+
+class TestModelCache:
+    """Test in-process model cache"""
+
+    def test_hits_invalidation_and_eviction(self, tmp_path):
+        """Test repeated loads hit, changed artifacts reload and LRU entries are evicted"""
+        from plugins.model_cache import ModelCache
+
+        loads = []
+
+        def loader(path):
+            loads.append(os.path.basename(path))
+            return {'path': path}
+
+        paths = []
+        for name in ('a.pkl', 'b.pkl', 'c.pkl'):
+            path = tmp_path / name
+            path.write_bytes(b'x' * 400 * 1024)
+            paths.append(str(path))
+
+        cache = ModelCache(max_memory_mb=1)
+
+        model = cache.get(paths[0], loader)
+        assert cache.get(paths[0], loader) is model
+        assert loads == ['a.pkl']
+
+        # A rewritten artifact is a new identity and replaces the old entry
+        os.utime(paths[0], ns=(0, 0))
+        assert cache.get(paths[0], loader) is not model
+        assert loads == ['a.pkl', 'a.pkl']
+        assert len(cache) == 1
+
+        # 3 x 400 KB exceeds 1 MB: the least recently used model is evicted
+        cache.get(paths[1], loader)
+        cache.get(paths[0], loader)
+        cache.get(paths[2], loader)
+        assert loads[-2:] == ['b.pkl', 'c.pkl']
+
+        stats = cache.stats()
+        assert stats['entries'] == 2
+        assert stats['evictions'] == 1
+        assert stats['hits'] == 2
+        assert stats['misses'] == 4
+
+        cache.get(paths[1], loader)
+        assert loads[-1] == 'b.pkl'
+
+
+class TestArtifactStore:
+    """Test content-addressed model artifact store"""
+
+    def test_promotion_backup_and_gc(self, tmp_path):
+        """Test promotions link deduplicated blobs and GC removes only unreferenced ones"""
+        from plugins.artifact_store import ArtifactStore, collect_artifact_garbage
+        from plugins.model_utils import promote_model, backup_previous_model
+
+        staging_dir = tmp_path / 'staging'
+        production_dir = tmp_path / 'production'
+        staging_dir.mkdir()
+        (staging_dir / 'model.pkl').write_bytes(b'model-v1')
+        (staging_dir / 'student.pt').write_bytes(b'student-v1')
+
+        first = promote_model(str(staging_dir), str(production_dir))
+        assert first['backup_manifest'] is None
+        assert sorted(first['promoted_files']) == ['model.pkl', 'student.pt']
+
+        store = ArtifactStore.for_models_dir(str(tmp_path))
+        manifest = store.load_manifest(first['manifest_id'])
+        blob_path = store.blob_path(manifest['files']['model.pkl']['digest'])
+        assert os.path.samefile(production_dir / 'model.pkl', blob_path)
+
+        # New model without a student: production is backed up and the stale variant removed
+        (staging_dir / 'model.pkl').write_bytes(b'model-v2')
+        (staging_dir / 'student.pt').unlink()
+        second = promote_model(str(staging_dir), str(production_dir))
+        assert second['backup_manifest'] is not None
+        assert (production_dir / 'model.pkl').read_bytes() == b'model-v2'
+        assert not (production_dir / 'student.pt').exists()
+
+        # Backing up unchanged staging content stores no new blobs
+        n_blobs = sum(len(files) for _, _, files in os.walk(store.blobs_dir))
+        assert backup_previous_model(str(tmp_path))['backup_created']
+        assert sum(len(files) for _, _, files in os.walk(store.blobs_dir)) == n_blobs
+
+        # Old manifests and releases expire; the v1 blobs go, the active v2 release stays
+        results = collect_artifact_garbage(str(tmp_path), keep_last=0)
+        assert results['blobs_removed'] == 2
+        assert results['releases_removed'] == [first['manifest_id']]
+        assert (production_dir / 'model.pkl').read_bytes() == b'model-v2'
+        assert not os.path.exists(blob_path)
+
+
+class TestReleases:
+    """Test release directories and atomic promotion"""
+
+    def test_symlink_promotion_and_rollback(self, tmp_path):
+        """Test promotion flips the production link and rollback restores the previous release"""
+        from plugins.model_utils import promote_model, rollback_model
+        from plugins.releases import current_release, list_releases
+
+        staging_dir = tmp_path / 'staging'
+        production_dir = tmp_path / 'production'
+        staging_dir.mkdir()
+
+        # Legacy production directory is recorded as a backup and replaced by a link
+        production_dir.mkdir()
+        (production_dir / 'model.pkl').write_bytes(b'model-v0')
+
+        (staging_dir / 'model.pkl').write_bytes(b'model-v1')
+        first = promote_model(str(staging_dir), str(production_dir))
+        assert os.path.islink(production_dir)
+        assert current_release(str(production_dir)) == first['manifest_id']
+        assert first['previous_release'].startswith('backup_')
+
+        (staging_dir / 'model.pkl').write_bytes(b'model-v2')
+        second = promote_model(str(staging_dir), str(production_dir))
+        assert second['previous_release'] == first['manifest_id']
+        assert (production_dir / 'model.pkl').read_bytes() == b'model-v2'
+
+        # Releases are immutable: the v1 release still holds v1
+        assert (tmp_path / 'releases' / first['manifest_id'] / 'model.pkl').read_bytes() == b'model-v1'
+        assert [r['active'] for r in list_releases(str(production_dir))] == [True, False]
+
+        rollback = rollback_model(str(production_dir))
+        assert rollback['release_id'] == first['manifest_id']
+        assert (production_dir / 'model.pkl').read_bytes() == b'model-v1'
+
+        # The legacy backup is re-materialized from its manifest
+        rollback_model(str(production_dir))
+        assert (production_dir / 'model.pkl').read_bytes() == b'model-v0'
+
+
+class TestModelRegistry:
+    """Test model registry bookkeeping"""
+
+    class _FakeCursor:
+        def __init__(self, conn):
+            self.conn = conn
+            self.description = None
+            self.rowcount = 0
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            return False
+
+        def execute(self, sql, parameters):
+            self.conn.statements.append((' '.join(sql.split()), parameters))
+            self.rowcount = self.conn.rowcount
+            self.description = [('id',), ('status',)] if 'RETURNING' in sql else None
+
+        def fetchall(self):
+            return [('id-1', 'candidate')]
+
+    class _FakeHook:
+        def __init__(self, rowcount=1):
+            self.statements = []
+            self.rowcount = rowcount
+            self.committed = False
+            self.rolled_back = False
+
+        def get_conn(self):
+            return self
+
+        def cursor(self):
+            return TestModelRegistry._FakeCursor(self)
+
+        def commit(self):
+            self.committed = True
+
+        def rollback(self):
+            self.rolled_back = True
+
+        def close(self):
+            pass
+
+    def test_register_model_links_training_run(self, tmp_path):
+        """Test models are versioned by content hash and linked to their run"""
+        from plugins.model_registry import ModelRegistry
+        from plugins.artifact_checksum import file_content_hash
+
+        model_path = tmp_path / 'model.pkl'
+        model_path.write_bytes(b'model-v1')
+
+        hook = self._FakeHook()
+        registered = ModelRegistry(hook=hook).register_model(
+            str(model_path), metrics={'mae': 1.5, 'r2': 0.9}, run_id='run_1'
+        )
+
+        assert registered['model_version'] == file_content_hash(str(model_path))[:12]
+        assert registered['status'] == 'candidate'
+        assert hook.committed
+
+        insert, link = hook.statements
+        assert 1.5 in insert[1] and 0.9 in insert[1]
+        assert link[1] == ('run_1', 'rul_cnn_lstm', registered['model_version'])
+
+    def test_set_production_requires_registered_model(self):
+        """Test an unknown version leaves the production model unchanged"""
+        from plugins.model_registry import ModelRegistry
+
+        hook = self._FakeHook(rowcount=0)
+
+        with pytest.raises(ValueError):
+            ModelRegistry(hook=hook).set_production('0123456789ab')
+
+        assert hook.rolled_back and not hook.committed
+
+    def test_candidates_newest_first(self):
+        """Test candidates are the unevaluated models, newest first"""
+        from plugins.model_registry import ModelRegistry
+
+        hook = self._FakeHook()
+        ModelRegistry(hook=hook).candidates(limit=5)
+
+        (sql, parameters), = hook.statements
+        assert "status = 'candidate'" in sql
+        assert 'ORDER BY created_at DESC LIMIT %s' in sql
+        assert parameters == ('rul_cnn_lstm', 5)
+
+    def test_promotion_sets_production_model(self, tmp_path):
+        """Test promotion registers the released model from its manifest digest"""
+        from plugins.model_utils import promote_model
+        from plugins.artifact_checksum import file_content_hash
+
+        class Registry:
+            def register_model(self, model_path, content_hash, status):
+                self.registered = (model_path, content_hash, status)
+                return {'model_version': content_hash[:12]}
+
+            def set_production(self, model_version, release_id):
+                self.production = (model_version, release_id)
+
+        staging_dir = tmp_path / 'staging'
+        staging_dir.mkdir()
+        (staging_dir / 'model.pkl').write_bytes(b'model-v1')
+
+        registry = Registry()
+        result = promote_model(str(staging_dir), str(tmp_path / 'production'), registry=registry)
+
+        content_hash = file_content_hash(str(staging_dir / 'model.pkl'))
+        assert registry.registered[1] == content_hash
+        assert registry.production == (content_hash[:12], result['manifest_id'])
+        assert result['model_version'] == content_hash[:12]
+
+
+class TestArtifactChecksum:
+    """Test artifact checksums and verification"""
+
+    def test_checksum_is_content_hash(self, tmp_path):
+        """Test the checksum is the plain SHA-256 and the cache detects changes"""
+        import hashlib
+        from plugins.artifact_checksum import file_content_hash, ChecksumCache
+
+        file_path = tmp_path / 'model.bin'
+        data = bytearray(np.random.default_rng(0).bytes(10_000))
+        file_path.write_bytes(bytes(data))
+
+        expected = hashlib.sha256(bytes(data)).hexdigest()
+        assert file_content_hash(str(file_path), chunk_bytes=1024) == expected
+
+        cache = ChecksumCache()
+        assert cache.checksum(str(file_path)) == expected
+        cache.checksum(str(file_path))
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        data[5000] ^= 1
+        file_path.write_bytes(bytes(data))
+        assert cache.checksum(str(file_path)) != expected
+
+    def test_truncated_model_fails_to_load(self, tmp_path):
+        """Test save_model records a checksum that load_model verifies"""
+        from plugins.model_utils import save_model, load_model
+        from plugins.artifact_checksum import ArtifactIntegrityError, recorded_checksum
+
+        model_path = str(tmp_path / 'model.pkl')
+        save_model({'weights': list(range(1000))}, model_path, metadata={'mae': 1.0})
+        assert recorded_checksum(model_path)['size'] == os.path.getsize(model_path)
+
+        assert load_model(model_path, use_cache=False)['weights'][-1] == 999
+
+        with open(model_path, 'r+b') as f:
+            f.truncate(os.path.getsize(model_path) // 2)
+
+        with pytest.raises(ArtifactIntegrityError):
+            load_model(model_path, use_cache=False)
+
+    def test_corrupt_model_is_not_promoted(self, tmp_path):
+        """Test promotion refuses a model that doesn't match its checksum"""
+        from plugins.model_utils import save_model, promote_model
+        from plugins.artifact_checksum import ArtifactIntegrityError
+
+        staging_dir = tmp_path / 'staging'
+        production_dir = tmp_path / 'production'
+        save_model({'version': 1}, str(staging_dir / 'model.pkl'))
+
+        first = promote_model(str(staging_dir), str(production_dir))
+        assert first['verified_files'] == ['model.pkl']
+        assert 'model_metadata.json' in first['promoted_files']
+
+        # Same size, different content
+        content = bytearray((staging_dir / 'model.pkl').read_bytes())
+        content[-2] ^= 1
+        (staging_dir / 'model.pkl').write_bytes(bytes(content))
+
+        with pytest.raises(ArtifactIntegrityError):
+            promote_model(str(staging_dir), str(production_dir))
+
+        assert os.readlink(production_dir).endswith(first['manifest_id'])
+
+
+class TestScreening:
+    """Test stratified screening stage"""
+
+    class _NoisyModel:
+        def __init__(self, noise, seed):
+            self.noise = noise
+            self.rng = np.random.default_rng(seed)
+
+        def predict(self, X):
+            return X[:, 0] + self.rng.normal(scale=self.noise, size=len(X))
+
+    def test_stratified_sample_covers_strata(self):
+        """Test every RUL bucket and bearing stratum is sampled"""
+        from plugins.screening import stratified_sample
+
+        rng = np.random.default_rng(5)
+        y = rng.uniform(0, 200, size=2000)
+        groups = rng.integers(0, 4, size=2000)
+
+        sample = stratified_sample(y, groups, sample_fraction=0.1)
+
+        assert len(sample['stratum_sizes']) == 16
+        assert np.all(np.bincount(sample['strata']) == sample['sample_sizes'])
+        assert np.all(sample['sample_sizes'] >= 5)
+        assert len(np.unique(sample['rows'])) == len(sample['rows'])
+
+    def test_screening_decision(self):
+        """Test a clearly worse candidate is rejected and a better one continues"""
+        from plugins.screening import screen_models
+
+        rng = np.random.default_rng(6)
+        y = rng.uniform(0, 200, size=5000)
+        X = np.column_stack([y, rng.normal(size=5000)]).astype(np.float32)
+        thresholds = {'mae_improvement': 0.05, 'rmse_improvement': 0.05}
+
+        worse = screen_models(self._NoisyModel(20, 1), self._NoisyModel(5, 2), X, y, thresholds)
+        assert worse['decision'] == 'reject'
+        assert worse['stage'] == 'screening'
+        assert worse['n_samples'] < len(y)
+
+        better = screen_models(self._NoisyModel(5, 1), self._NoisyModel(20, 2), X, y, thresholds)
+        assert better['decision'] == 'continue'
+        assert better['mae_improvement_pct']['lower'] > 5
+
+
+class TestBootstrap:
+    """Test paired bootstrap significance testing"""
+
+    def test_paired_bootstrap(self):
+        """Test a real improvement is significant and an equal model is not"""
+        from plugins.bootstrap import paired_bootstrap
+        from plugins.model_utils import compare_models
+
+        rng = np.random.default_rng(7)
+        y = rng.uniform(0, 200, size=20000)
+        baseline = y + rng.normal(scale=10, size=len(y))
+
+        better = paired_bootstrap(y, y + rng.normal(scale=8, size=len(y)), baseline, n_boot=500)
+        mae = better['mae_improvement_pct']
+        assert mae['lower'] < mae['estimate'] < mae['upper']
+        assert 10 < mae['estimate'] < 30
+        assert mae['p_value'] < 0.01
+
+        same = paired_bootstrap(y, y + rng.normal(scale=10, size=len(y)), baseline, n_boot=500)
+        assert same['mae_improvement_pct']['lower'] < 0 < same['mae_improvement_pct']['upper']
+
+        # A point-estimate improvement that is not significant blocks promotion
+        metrics = {'mae': 5.0, 'rmse': 6.0, 'r2': 0.95}
+        baseline_metrics = {'mae': 6.0, 'rmse': 7.0, 'r2': 0.93}
+        thresholds = {'mae_improvement': 0.05, 'rmse_improvement': 0.05, 'max_p_value': 0.05}
+
+        assert compare_models(metrics, baseline_metrics, thresholds, better)['should_promote']
+        assert not compare_models(metrics, baseline_metrics, thresholds, same)['should_promote']
+
+
+class TestSlicedMetrics:
+    """Test sliced evaluation metrics"""
+
+    def test_sliced_metrics_match_per_slice_metrics(self, tmp_path):
+        """Test per-slice metrics match direct computation and reach the report"""
+        from plugins.sliced_metrics import compute_sliced_metrics
+        from plugins.model_utils import generate_evaluation_report
+
+        rng = np.random.default_rng(8)
+        y = rng.uniform(0, 200, size=3000)
+        y_pred = y + rng.normal(scale=5, size=len(y))
+        bearings = rng.integers(0, 100, size=len(y))
+        equipment = rng.choice(np.array(['Motor', 'Pump', 'Fan']), size=len(y))
+
+        sliced = compute_sliced_metrics(
+            y, y_pred, {'bearing': bearings, 'equipment_type': equipment}, max_reported_slices=10
+        )
+
+        assert [s['slice'] for s in sliced['rul_band']['slices']] == ['<50', '50-100', '>100']
+        near_eol = y < 50
+        assert sliced['rul_band']['slices'][0]['count'] == near_eol.sum()
+        assert sliced['rul_band']['slices'][0]['mae'] == pytest.approx(
+            np.abs(y_pred - y)[near_eol].mean(), abs=1e-4
+        )
+
+        pump = sliced['equipment_type']['slices'][2]
+        assert pump['slice'] == 'Pump'
+        assert pump['bias'] == pytest.approx((y_pred - y)[equipment == 'Pump'].mean(), abs=1e-4)
+
+        # Many slices: worst MAE first, truncated
+        assert sliced['bearing']['n_slices'] == 100
+        maes = [s['mae'] for s in sliced['bearing']['slices']]
+        assert len(maes) == 10 and maes == sorted(maes, reverse=True)
+
+        report_path = generate_evaluation_report(
+            {'sliced_metrics': {'candidate_b': sliced}, 'winner': {'model_name': 'candidate_b'}},
+            str(tmp_path)
+        )
+        html = open(report_path.replace('.json', '.html')).read()
+        assert 'Sliced Metrics (candidate_b)' in html and '50-100' in html
+
+
+class TestModelRanking:
+    """Test tournament ranking of candidate models"""
+
+    def test_rank_models(self):
+        """Test candidates meeting the thresholds rank first, by improvement"""
+        from plugins.model_utils import rank_models
+
+        baseline = {'mae': 10.0, 'rmse': 12.0, 'r2': 0.9}
+        thresholds = {'mae_improvement': 0.05, 'rmse_improvement': 0.05, 'min_r2_score': 0.85, 'max_mae': 10.0}
+
+        ranking = rank_models(
+            {
+                'staging_model': {'mae': 9.0, 'rmse': 11.0, 'r2': 0.92},
+                'candidate_large': {'mae': 8.0, 'rmse': 10.0, 'r2': 0.80},
+                'candidate_student': {'mae': 8.5, 'rmse': 10.5, 'r2': 0.93},
+            },
+            baseline,
+            thresholds
+        )
+
+        assert [entry['model_name'] for entry in ranking] == [
+            'candidate_student', 'staging_model', 'candidate_large'
+        ]
+        assert [entry['rank'] for entry in ranking] == [1, 2, 3]
+        assert not ranking[-1]['should_promote']
+
+    def test_rank_models_checks_significance_and_latency(self):
+        """Test contenders failing significance or latency rank below an eligible one"""
+        from plugins.model_utils import rank_models
+
+        baseline = {'mae': 10.0, 'rmse': 12.0, 'r2': 0.9}
+        thresholds = {
+            'mae_improvement': 0.05, 'rmse_improvement': 0.05, 'min_r2_score': 0.85,
+            'max_mae': 10.0, 'max_p_value': 0.05, 'max_p99_regression': 1.5,
+        }
+
+        def bootstrap(p_value):
+            interval = {'p_value': p_value, 'lower': -1.0, 'upper': 20.0}
+            return {'mae_improvement_pct': interval, 'rmse_improvement_pct': interval, 'confidence_level': 0.95}
+
+        def card(p99_ms):
+            return {'hardware': 'cpu', 'isolated': True, 'latency': {'batch_1': {'p99_ms': p99_ms}}}
+
+        ranking = rank_models(
+            {
+                'candidate_noisy': {'mae': 7.0, 'rmse': 9.0, 'r2': 0.95},
+                'candidate_slow': {'mae': 7.5, 'rmse': 9.5, 'r2': 0.95},
+                'staging_model': {'mae': 9.0, 'rmse': 11.0, 'r2': 0.92},
+            },
+            baseline,
+            thresholds,
+            bootstrap_results={
+                'candidate_noisy': bootstrap(0.2),
+                'candidate_slow': bootstrap(0.001),
+                'staging_model': bootstrap(0.001),
+            },
+            benchmarks={
+                'candidate_noisy': card(1.0),
+                'candidate_slow': card(3.0),
+                'staging_model': card(1.2),
+            },
+            baseline_benchmark=card(1.0)
+        )
+
+        assert [entry['model_name'] for entry in ranking] == [
+            'staging_model', 'candidate_noisy', 'candidate_slow'
+        ]
+        assert ranking[0]['should_promote'] and ranking[0]['latency']['within_budget']
+        assert ranking[1]['significance']['mae_improvement_pct']['p_value'] == 0.2
+        assert not ranking[2]['latency']['within_budget']
+
+
+class TestFeatureImportance:
+    """Test permutation feature importance"""
+
+    def test_permutation_importance(self, tmp_path):
+        """Test informative features rank above noise, across workers"""
+        pytest.importorskip('sklearn')
+        import joblib
+        from sklearn.linear_model import LinearRegression
+        from plugins.feature_importance import permutation_importance
+
+        rng = np.random.default_rng(9)
+        X = rng.normal(size=(3000, 4)).astype(np.float32)
+        y = 5 * X[:, 0] + 2 * X[:, 1] + rng.normal(scale=0.1, size=3000)
+
+        np.save(tmp_path / 'test_features.npy', X)
+        np.save(tmp_path / 'test_labels.npy', y)
+        joblib.dump(LinearRegression().fit(X, y), tmp_path / 'model.pkl')
+
+        args = (str(tmp_path / 'model.pkl'), str(tmp_path / 'test_features.npy'), str(tmp_path / 'test_labels.npy'))
+        names = ['rms', 'kurtosis', 'noise_a', 'noise_b']
+
+        results = permutation_importance(*args, feature_names=names, n_samples=1000, n_workers=2, batch_size=256)
+
+        assert [entry['feature_name'] for entry in results['importances'][:2]] == ['rms', 'kurtosis']
+        assert results['n_samples'] == 1000
+        assert abs(results['importances'][-1]['importance_score']) < 0.05
+
+        # Scores do not depend on how features are split across workers
+        single = permutation_importance(*args, feature_names=names, n_samples=1000, n_workers=1, batch_size=256)
+        assert single['importances'] == results['importances']
+
+
+class TestTrainingUtils:
+    """Test training utilities"""
+
+    def test_grouped_split_keeps_bearings_together(self, feature_store):
+        """Test no bearing appears in both train and validation sets"""
+        from plugins.training_utils import load_feature_store, grouped_train_val_split
+
+        X, y, groups = load_feature_store(str(feature_store))
+        train_idx, val_idx = grouped_train_val_split(len(X), groups)
+
+        assert len(train_idx) + len(val_idx) == len(X)
+        assert not set(groups[train_idx]) & set(groups[val_idx])
+
+    def test_misaligned_feature_store(self, feature_store):
+        """Test misaligned features and labels are rejected"""
+        from plugins.training_utils import load_feature_store
+
+        np.save(feature_store / 'labels.npy', np.zeros(3))
+
+        with pytest.raises(ValueError):
+            load_feature_store(str(feature_store))
+
+    def test_grouped_cross_validation(self, feature_store, small_training_config):
+        """Test grouped cross-validation reports mean and spread of fold metrics"""
+        pytest.importorskip('torch')
+        pytest.importorskip('sklearn')
+        from plugins.training_utils import grouped_cross_validate
+
+        results = grouped_cross_validate(
+            str(feature_store),
+            small_training_config,
+            n_folds=4,
+            n_workers=2
+        )
+
+        assert results['n_folds'] == 4
+        assert len(results['folds']) == 4
+        assert set(results['metrics_mean']) == set(results['metrics_std'])
+        assert results['metrics_std']['mae'] >= 0
+
+    def test_data_parallel_training(self, feature_store, small_training_config):
+        """Test data-parallel training over two local gloo processes"""
+        pytest.importorskip('torch')
+        import socket
+        from plugins.training_utils import load_feature_store, grouped_train_val_split
+        from plugins.distributed_training import train_distributed
+
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+
+        X, y, groups = load_feature_store(str(feature_store))
+        train_idx, val_idx = grouped_train_val_split(len(X), groups)
+
+        config = dict(small_training_config, ddp_processes=2, ddp_master_port=port)
+        model, history = train_distributed(str(feature_store), train_idx, val_idx, config)
+
+        assert history['world_size'] == 2
+        assert model.predict(X[:4]).shape == (4,)
+
+    def test_data_parallel_training_single_validation_row(self, feature_store, small_training_config):
+        """Test ranks with an empty validation shard still join the loss all-reduce"""
+        pytest.importorskip('torch')
+        import socket
+        from plugins.training_utils import load_feature_store, grouped_train_val_split
+        from plugins.distributed_training import train_distributed
+
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+
+        X, y, groups = load_feature_store(str(feature_store))
+        train_idx, val_idx = grouped_train_val_split(len(X), groups)
+
+        # Rank 1 gets no validation rows
+        config = dict(small_training_config, ddp_processes=2, ddp_master_port=port)
+        model, history = train_distributed(str(feature_store), train_idx, val_idx[:1], config)
+
+        assert history['world_size'] == 2
+        assert np.isfinite(history['best_val_loss'])
+
+
+class TestTrainingProfiler:
+    """Test training step profiler"""
+
+    def test_profile_phases(self, trained_model, small_training_config, tmp_path):
+        """Test profiler splits step time into phases per epoch"""
+        import json
+        from plugins.training_profiler import TRAINING_PHASES
+
+        profiler = trained_model['profiler']
+
+        assert len(profiler.epochs) == small_training_config['epochs']
+        assert set(profiler.epochs[0]['phases']) == set(TRAINING_PHASES)
+        assert profiler.epochs[0]['samples'] == len(trained_model['train_idx'])
+
+        summary = profiler.summary()
+        assert summary['bottleneck'] in ('input', 'compute')
+        assert summary['samples_per_second'] > 0
+        assert summary['peak_rss_mb'] > 0
+
+        profile_path = profiler.save(str(tmp_path / 'staging' / 'training_profile.json'))
+        with open(profile_path) as f:
+            assert json.load(f)['summary'] == summary
+
+
+class TestTrainingRunRecord:
+    """Test recording training runs in Postgres"""
+
+    def test_non_finite_values_stored_as_null(self, monkeypatch):
+        """Test NaN and infinite losses of a diverged run are recorded as null"""
+        import json
+        import types
+        from datetime import datetime
+        from plugins.model_utils import record_training_run
+
+        executed = []
+
+        class FakePostgresHook:
+            def __init__(self, postgres_conn_id):
+                pass
+
+            def run(self, sql, parameters):
+                executed.append(parameters)
+
+        hook_module = types.ModuleType('airflow.providers.postgres.hooks.postgres')
+        hook_module.PostgresHook = FakePostgresHook
+        monkeypatch.setitem(sys.modules, 'airflow.providers.postgres.hooks.postgres', hook_module)
+
+        record_training_run(
+            'run-1', datetime(2024, 1, 1), datetime(2024, 1, 1, 0, 5),
+            {'final_train_loss': float('nan'), 'final_val_loss': float('inf'), 'n_train_samples': 10},
+            profile={'epochs': [{'loss': 1.5}, {'loss': float('nan')}]},
+        )
+
+        assert len(executed) == 1
+        parameters = executed[0]
+        assert parameters[5] is None and parameters[6] is None
+
+        metrics = json.loads(parameters[7])
+        assert metrics['training']['final_train_loss'] is None
+        assert metrics['profile']['epochs'] == [{'loss': 1.5}, {'loss': None}]
+
+
+class TestQuantization:
+    """Test post-training quantization"""
+
+    def test_quantization_gate(self, trained_model, feature_store, tmp_path):
+        """Test the int8 model is saved only when it passes the accuracy gate"""
+        pytest.importorskip('sklearn')
+        from plugins.quantization import quantize_and_validate
+
+        model_path = trained_model['model_path']
+        int8_path = str(tmp_path / 'staging' / 'model_int8.pt')
+
+        results = quantize_and_validate(
+            model_path, str(feature_store), int8_path,
+            quantization_config={'mae_tolerance': 10.0, 'rmse_tolerance': 10.0}
+        )
+        assert results['accepted']
+        assert os.path.exists(int8_path)
+        assert set(results['int8_metrics']) == set(results['float_metrics'])
+
+        # A negative tolerance demands an improvement the int8 model cannot make
+        results = quantize_and_validate(
+            model_path, str(feature_store), int8_path,
+            quantization_config={'mae_tolerance': -1.0, 'rmse_tolerance': -1.0}
+        )
+        assert not results['accepted']
+        assert not os.path.exists(int8_path)
+
+
+class TestOnnxExport:
+    """Test ONNX export and ONNX Runtime inference"""
+
+    def test_export_and_load(self, trained_model, feature_store, tmp_path):
+        """Test the exported ONNX model matches the PyTorch model through load_model"""
+        pytest.importorskip('sklearn')
+        pytest.importorskip('onnxruntime')
+        from plugins.model_utils import load_model
+        from plugins.onnx_export import export_and_validate, OnnxModel
+
+        model, X = trained_model['model'], trained_model['X']
+        onnx_path = str(tmp_path / 'staging' / 'model.onnx')
+
+        results = export_and_validate(trained_model['model_path'], str(feature_store), onnx_path)
+        assert results['accepted']
+        assert results['max_abs_diff'] <= 0.01
+
+        onnx_model = load_model(onnx_path)
+        assert isinstance(onnx_model, OnnxModel)
+        np.testing.assert_allclose(
+            onnx_model.predict(X[:300]), model.predict(X[:300]), atol=0.01
+        )
+
+        single_threaded = OnnxModel(onnx_path, intra_op_threads=1, inter_op_threads=1)
+        assert single_threaded.predict(X[:1]).shape == (1,)
+
+
+class TestDistillation:
+    """Test knowledge distillation"""
+
+    def test_distill_student(self, trained_model, feature_store, small_training_config, tmp_path):
+        """Test the student is saved with its own metrics and latency benchmark, then registered"""
+        pytest.importorskip('sklearn')
+        import json
+        from plugins.model_utils import load_model
+        from plugins.model_registry import ModelRegistry
+        from plugins.artifact_checksum import file_content_hash
+        from plugins.distillation import distill_student, register_student, STUDENT_MODEL_NAME
+
+        X = trained_model['X']
+        teacher_path = trained_model['model_path']
+        student_path = str(tmp_path / 'staging' / 'student.pt')
+
+        config = dict(small_training_config, distillation={
+            'epochs': 2,
+            'student_config': {'channels': 4, 'num_layers': 1},
+        })
+        results = distill_student(teacher_path, str(feature_store), student_path, config)
+
+        assert results['student_parameters'] < results['teacher_parameters']
+        assert set(results['student_metrics']) == set(results['teacher_metrics'])
+        assert 'p95_ms' in results['student_latency']['batch_1']
+        assert os.path.exists(tmp_path / 'staging' / 'student_metadata.json')
+        assert load_model(student_path).predict(X[:4]).shape == (4,)
+        assert results['teacher_model_version'] == file_content_hash(teacher_path)[:12]
+
+        # Registered under the student model name, referencing its teacher
+        hook = TestModelRegistry._FakeHook()
+        registered = register_student(
+            student_path, results, registry=ModelRegistry(model_name=STUDENT_MODEL_NAME, hook=hook)
+        )
+
+        assert registered['model_version'] == file_content_hash(student_path)[:12]
+        (_, insert), = hook.statements
+        assert insert[0] == STUDENT_MODEL_NAME != 'rul_cnn_lstm'
+        assert json.loads(insert[9])['teacher_model_version'] == results['teacher_model_version']
+
+
+class TestModelBenchmark:
+    """Test benchmark cards and the latency budget"""
+
+    @staticmethod
+    def _card(p99_ms):
+        return {
+            'latency': {f'batch_{size}': {'p99_ms': p99_ms * size ** 0.5} for size in (1, 8, 64, 512)},
+            'hardware': {'cpu_count': 4},
+            'isolated': True,
+        }
+
+    def test_benchmark_card(self, tmp_path):
+        """Test the card covers the standard batch sizes and is stored in the metadata"""
+        pytest.importorskip('sklearn')
+        from sklearn.linear_model import LinearRegression
+        from plugins.model_utils import save_model
+        from plugins.model_benchmark import (
+            benchmark_card, record_benchmark_card, load_benchmark_card, CARD_BATCH_SIZES
+        )
+
+        rng = np.random.default_rng(0)
+        X = rng.normal(size=(64, 5)).astype(np.float32)
+        features_path = str(tmp_path / 'features.npy')
+        np.save(features_path, X)
+
+        model_path = str(tmp_path / 'model.pkl')
+        save_model(LinearRegression().fit(X, X.sum(axis=1)), model_path)
+
+        card = benchmark_card(model_path, features_path, n_repeats=5)
+        assert card['isolated']
+        assert list(card['latency']) == [f'batch_{size}' for size in CARD_BATCH_SIZES]
+        assert all(
+            latency['p50_ms'] <= latency['p95_ms'] <= latency['p99_ms']
+            for latency in card['latency'].values()
+        )
+        assert card['load_seconds'] > 0 and card['peak_rss_mb'] > 0 and card['file_size_mb'] > 0
+
+        record_benchmark_card(model_path, card)
+        assert load_benchmark_card(model_path) == card
+
+    def test_latency_regression_blocks_promotion(self):
+        """Test a more accurate model with a 3x p99 regression is rejected"""
+        from plugins.model_utils import compare_models
+
+        thresholds = {'mae_improvement': 0.01, 'rmse_improvement': 0.01, 'max_p99_regression': 1.5}
+        staging = {'mae': 4.9, 'rmse': 6.9, 'r2': 0.9}
+        production = {'mae': 5.0, 'rmse': 7.0, 'r2': 0.89}
+
+        fast = compare_models(
+            staging, production, thresholds,
+            model1_benchmark=self._card(1.1), model2_benchmark=self._card(1.0)
+        )
+        assert fast['should_promote']
+        assert fast['latency']['within_budget']
+
+        slow = compare_models(
+            staging, production, thresholds,
+            model1_benchmark=self._card(3.0), model2_benchmark=self._card(1.0)
+        )
+        assert not slow['should_promote']
+        assert slow['latency']['p99_ratios']['batch_1'] == 3.0
+        assert any('latency budget' in reason for reason in slow['reasons'])
@@ -84,9 +84,17 @@ CREATE TABLE IF NOT EXISTS models (
     mae FLOAT,
     rmse FLOAT,
     r2_score FLOAT,
+    metrics JSONB,
     model_path VARCHAR(500),
-    status VARCHAR(50) DEFAULT 'active',
+    content_hash VARCHAR(64),
+    -- Latency, load time, peak RSS and size from the benchmark harness
+    benchmark JSONB,
+    -- candidate, evaluated, rejected, production or archived
+    status VARCHAR(50) DEFAULT 'candidate',
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    evaluated_at TIMESTAMP,
+    promoted_at TIMESTAMP,
+    release_id VARCHAR(100),
     UNIQUE(model_name, model_version)
 );
 
@@ -107,6 +115,18 @@ CREATE TABLE IF NOT EXISTS training_runs (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Feature importance table (permutation importance per evaluated model)
+CREATE TABLE IF NOT EXISTS feature_importance (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    model_version VARCHAR(50) NOT NULL,
+    feature_name VARCHAR(100) NOT NULL,
+    importance_score FLOAT NOT NULL,
+    importance_std FLOAT,
+    details JSONB,
+    computed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(model_version, feature_name)
+);
+
 -- Alerts table
 CREATE TABLE IF NOT EXISTS alerts (
     id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
@@ -173,12 +193,20 @@ CREATE INDEX idx_predictions_status ON predictions(status);
 -- Models indexes
 CREATE INDEX idx_models_name_version ON models(model_name, model_version);
 CREATE INDEX idx_models_status ON models(status);
+CREATE INDEX idx_models_content_hash ON models(content_hash);
+-- Newest unevaluated candidate
+CREATE INDEX idx_models_candidates ON models(model_name, created_at DESC) WHERE status = 'candidate';
+-- At most one production model per name
+CREATE UNIQUE INDEX idx_models_production ON models(model_name) WHERE status = 'production';
 
 -- Training runs indexes
 CREATE INDEX idx_training_runs_model_id ON training_runs(model_id);
 CREATE INDEX idx_training_runs_start_time ON training_runs(start_time DESC);
 CREATE INDEX idx_training_runs_status ON training_runs(status);
 
+-- Feature importance indexes
+CREATE INDEX idx_feature_importance_computed_at ON feature_importance(computed_at DESC);
+
 -- Alerts indexes
 CREATE INDEX idx_alerts_bearing_id ON alerts(bearing_id);
 CREATE INDEX idx_alerts_created_at ON alerts(created_at DESC);
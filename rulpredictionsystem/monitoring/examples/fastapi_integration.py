@@ -5,6 +5,9 @@ This demonstrates how to integrate the monitoring stack with your FastAPI applic
 
 from fastapi import FastAPI, HTTPException
 from fastapi.responses import JSONResponse
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import threading
 import time
 import random
 from datetime import datetime
@@ -18,12 +21,24 @@ from exporters.fastapi_exporter import (
     PrometheusMiddleware,
     setup_metrics_endpoint,
     track_prediction,
+    track_shadow_prediction,
+    update_shadow_agreement,
+    track_model_reload,
+    track_inference_batch,
+    track_inference_rejected,
+    update_inference_queue_depth,
+    update_inference_in_flight,
     update_model_metrics,
     update_model_info,
     update_bearing_health,
     WEBSOCKET_CONNECTIONS
 )
 
+# Streaming metrics accumulator (airflow/plugins/metrics.py, a standalone
+# module). The API image copies it next to this file; to run the example
+# from a checkout, put airflow/plugins on PYTHONPATH.
+from metrics import MetricsAccumulator
+
 # Create FastAPI app
 app = FastAPI(
     title="RUL Prediction API with Monitoring",
@@ -45,44 +60,623 @@ update_model_info(
     training_date=datetime.now().isoformat()
 )
 
+# Bearings whose student estimate falls below this RUL are re-scored by the
+# teacher; the student handles routine fleet scans on its own
+CRITICAL_RUL_BAND = 120
+
+# Share of live requests also scored by the staging model in shadow mode
+SHADOW_SAMPLE_RATE = float(os.getenv("SHADOW_SAMPLE_RATE", "0.1"))
+
+# Shadow requests queued or running at most; further ones are dropped
+SHADOW_MAX_PENDING = int(os.getenv("SHADOW_MAX_PENDING", "32"))
+
+# Production model link (a symlink to the active release, flipped atomically
+# on promotion) and how often it is checked for a new release
+PRODUCTION_MODEL_DIR = os.getenv("PRODUCTION_MODEL_DIR")
+MODEL_RELOAD_POLL_SECONDS = float(os.getenv("MODEL_RELOAD_POLL_SECONDS", "10"))
+
+# Micro-batching of /predict: a batch is dispatched when it holds
+# PREDICT_MAX_BATCH_SIZE requests or PREDICT_MAX_WAIT_MS after its first one
+PREDICT_MAX_BATCH_SIZE = int(os.getenv("PREDICT_MAX_BATCH_SIZE", "32"))
+PREDICT_MAX_WAIT_MS = float(os.getenv("PREDICT_MAX_WAIT_MS", "5"))
+
+# Batches scored at once on the inference threads, off the event loop
+INFERENCE_WORKERS = int(os.getenv("INFERENCE_WORKERS", "2"))
+
+# Requests waiting for a batch at most; further ones are rejected with 503
+INFERENCE_MAX_QUEUE = int(os.getenv("INFERENCE_MAX_QUEUE", "256"))
+
+
 # Simulated model
 class MockModel:
     """Mock ML model for demonstration"""
 
-    def __init__(self):
-        self.version = "1.0.0"
+    def __init__(self, version: str = "1.0.0", latency_range: tuple = (0.05, 0.5)):
+        self.version = version
+        self.latency_range = latency_range
 
     def predict(self, features: dict) -> dict:
         """Simulate prediction"""
-        # Simulate inference time
-        inference_time = random.uniform(0.05, 0.5)
-        time.sleep(inference_time)
+        return self.predict_batch([features])[0]
 
-        # Simulate RUL prediction
-        rul = random.uniform(0, 300)
+    def predict_batch(self, features_batch: list) -> list:
+        """
+        Simulate a batched prediction.
 
-        # Determine confidence
-        if rul < 50:
-            confidence = random.choice(["high", "medium"])
-        elif rul < 150:
-            confidence = random.choice(["high", "medium", "low"])
-        else:
-            confidence = "high"
+        Like a batched NN kernel, the call has a fixed cost and each
+        extra sample adds only a little to it.
+        """
+        # Simulate inference time
+        inference_time = random.uniform(*self.latency_range) * (1 + 0.02 * (len(features_batch) - 1))
+        time.sleep(inference_time)
 
         # Simulate occasional failures
         if random.random() < 0.02:  # 2% failure rate
             raise Exception("Model prediction failed")
 
+        timestamp = datetime.now().isoformat()
+        results = []
+
+        for _ in features_batch:
+            # Simulate RUL prediction
+            rul = random.uniform(0, 300)
+
+            # Determine confidence
+            if rul < 50:
+                confidence = random.choice(["high", "medium"])
+            elif rul < 150:
+                confidence = random.choice(["high", "medium", "low"])
+            else:
+                confidence = "high"
+
+            results.append({
+                "rul": rul,
+                "confidence": confidence,
+                "inference_time": inference_time,
+                "timestamp": timestamp
+            })
+
+        return results
+
+
+# Initialize models: CNN-LSTM teacher and distilled compact student
+model = MockModel()
+student_model = MockModel(version="1.0.0-student", latency_range=(0.005, 0.05))
+
+
+class ShadowScorer:
+    """
+    Score a share of live requests with a shadow (staging) model.
+
+    Shadow predictions run on their own executor after the primary result
+    is known, so they never add latency to the response. When the shadow
+    backlog is full, new shadow work is dropped rather than queued. Paired
+    shadow and primary predictions stream into a MetricsAccumulator, with
+    the primary prediction as reference.
+    """
+
+    def __init__(
+        self,
+        shadow_model: MockModel,
+        sample_rate: float = SHADOW_SAMPLE_RATE,
+        max_pending: int = SHADOW_MAX_PENDING,
+        max_workers: int = 1
+    ):
+        self.shadow_model = shadow_model
+        self.sample_rate = sample_rate
+        self.max_pending = max_pending
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="shadow")
+        self.accumulator = MetricsAccumulator()
+        self.pending = 0
+        self.dropped = 0
+        self.failed = 0
+        self._lock = threading.Lock()
+
+    def submit(self, features: dict, primary_rul: float) -> bool:
+        """
+        Queue shadow scoring of a request without waiting for it.
+
+        Returns:
+            True if the request was queued for shadow scoring
+        """
+        if random.random() >= self.sample_rate:
+            return False
+
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.dropped += 1
+                track_shadow_prediction(self.shadow_model.version, "dropped")
+                return False
+            self.pending += 1
+
+        self.executor.submit(self._score, features, primary_rul)
+        return True
+
+    def _score(self, features: dict, primary_rul: float) -> None:
+        """Score one request with the shadow model and update the agreement"""
+        start_time = time.time()
+
+        try:
+            shadow_rul = self.shadow_model.predict(features)["rul"]
+            duration = time.time() - start_time
+
+            with self._lock:
+                self.accumulator.update([primary_rul], [shadow_rul])
+                metrics = self.accumulator.compute()
+                # Residuals are primary - shadow; bias is the shadow's offset
+                bias = -self.accumulator.residual_mean
+                n_samples = len(self.accumulator)
+
+            track_shadow_prediction(self.shadow_model.version, "scored", duration)
+            update_shadow_agreement(self.shadow_model.version, {
+                "mae": metrics["mae"],
+                "rmse": metrics["rmse"],
+                "bias": bias,
+                "max_error": metrics["max_error"],
+                "samples": n_samples,
+            })
+
+        except Exception:
+            with self._lock:
+                self.failed += 1
+            track_shadow_prediction(self.shadow_model.version, "failed")
+
+        finally:
+            with self._lock:
+                self.pending -= 1
+
+    def stats(self) -> dict:
+        """Shadow scoring statistics and agreement metrics"""
+        with self._lock:
+            metrics = self.accumulator.compute() if len(self.accumulator) else {}
+            return {
+                "shadow_model_version": self.shadow_model.version,
+                "sample_rate": self.sample_rate,
+                "scored": len(self.accumulator),
+                "dropped": self.dropped,
+                "failed": self.failed,
+                "pending": self.pending,
+                "agreement": metrics,
+            }
+
+    def shutdown(self) -> None:
+        """Stop the shadow executor, discarding queued work"""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Staging model scored in shadow mode (A/B comparison on live traffic)
+staging_model = MockModel(version="1.1.0-staging")
+shadow_scorer = ShadowScorer(staging_model)
+
+
+def load_release_model(release_dir: str) -> MockModel:
+    """
+    Load the model of a release directory.
+
+    Simulated: the model is versioned by its release id. A real service
+    would load the release's model file here (e.g. model.onnx).
+    """
+    return MockModel(version=os.path.basename(release_dir))
+
+
+def set_primary_model(new_model: MockModel) -> None:
+    """Swap the primary model; requests already running keep the old one"""
+    global model
+    model = new_model
+
+    update_model_info(
+        version=new_model.version,
+        algorithm="Random Forest",
+        features=50,
+        training_date=datetime.now().isoformat()
+    )
+
+
+class ModelReloader:
+    """
+    Hot-reload the primary model when the production release changes.
+
+    A watcher thread polls the release the production link points to, and
+    a reload can be requested through /admin/reload. The new model is
+    loaded and warmed up in the background, then swapped in with a single
+    reference assignment: in-flight requests finish on the model they
+    started with, new requests use the new one. A failed load or warm-up
+    keeps the current model.
+    """
+
+    def __init__(
+        self,
+        link_path: str,
+        loader=load_release_model,
+        on_swap=set_primary_model,
+        poll_seconds: float = MODEL_RELOAD_POLL_SECONDS
+    ):
+        self.link_path = link_path
+        self.loader = loader
+        self.on_swap = on_swap
+        self.poll_seconds = poll_seconds
+        self.active_release = None
+        self.reloads = 0
+        self.last_error = None
+        self._reload_lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def start(self) -> None:
+        """Load the active release and start watching for new ones"""
+        self.reload()
+        threading.Thread(target=self._watch, name="model-reloader", daemon=True).start()
+
+    def stop(self) -> None:
+        """Stop watching the production link"""
+        self._stop.set()
+
+    def _watch(self) -> None:
+        """Reload whenever the production link points to another release"""
+        while not self._stop.wait(self.poll_seconds):
+            if os.path.realpath(self.link_path) != self.active_release:
+                self.reload()
+
+    def request_reload(self) -> bool:
+        """
+        Start a reload in the background.
+
+        Returns:
+            False if a reload is already running
+        """
+        if self._reload_lock.locked():
+            return False
+
+        threading.Thread(target=self.reload, name="model-reload", daemon=True).start()
+        return True
+
+    def reload(self) -> bool:
+        """
+        Load, warm up and swap in the model of the active release.
+
+        Returns:
+            True if a new model was swapped in
+        """
+        if not self._reload_lock.acquire(blocking=False):
+            return False
+
+        start_time = time.time()
+
+        try:
+            release_dir = os.path.realpath(self.link_path)
+            new_model = self.loader(release_dir)
+
+            # Warm up before the model takes traffic
+            new_model.predict({"temperature": 45.0, "vibration": 0.2, "speed": 1800})
+
+            self.on_swap(new_model)
+            self.active_release = release_dir
+            self.reloads += 1
+            self.last_error = None
+            track_model_reload("success", time.time() - start_time)
+            return True
+
+        except Exception as e:
+            self.last_error = str(e)
+            track_model_reload("failed")
+            return False
+
+        finally:
+            self._reload_lock.release()
+
+    def status(self) -> dict:
+        """Active release and reload statistics"""
         return {
-            "rul": rul,
-            "confidence": confidence,
-            "inference_time": inference_time,
-            "timestamp": datetime.now().isoformat()
+            "production_link": self.link_path,
+            "active_release": os.path.basename(self.active_release) if self.active_release else None,
+            "model_version": model.version,
+            "reloads": self.reloads,
+            "reloading": self._reload_lock.locked(),
+            "last_error": self.last_error,
         }
 
 
-# Initialize model
-model = MockModel()
+# Hot reload of the primary model (only when a production link is configured)
+model_reloader = ModelReloader(PRODUCTION_MODEL_DIR) if PRODUCTION_MODEL_DIR else None
+
+
+def route_batch(features_batch: list) -> list:
+    """
+    Score with the student and escalate near-critical bearings to the teacher.
+
+    Both models are called once per batch; only the escalated rows are
+    sent to the teacher.
+
+    Returns:
+        List of (prediction result, model that produced it), one per row
+    """
+    # One reference for the whole batch, even if a reload swaps the model
+    primary_model = model
+    routed = [(result, student_model) for result in student_model.predict_batch(features_batch)]
+
+    critical = [i for i, (result, _) in enumerate(routed) if result["rul"] < CRITICAL_RUL_BAND]
+    if critical:
+        teacher_results = primary_model.predict_batch([features_batch[i] for i in critical])
+        for i, result in zip(critical, teacher_results):
+            routed[i] = (result, primary_model)
+
+    return routed
+
+
+class InferenceQueueFull(Exception):
+    """The inference queue is full; the request is rejected, not queued"""
+
+
+class MicroBatcher:
+    """
+    Score concurrent /predict requests in batched model calls.
+
+    Each request is queued with a future. A worker task takes the oldest
+    request, gathers more until the batch holds max_batch_size requests
+    or max_wait_ms have passed, scores the batch with one call and
+    resolves each future with its row. Under load batches fill at once;
+    a lone request waits at most max_wait_ms. When the batched call
+    fails, every request of the batch fails with its error.
+
+    Batches are scored on a dedicated thread pool, so blocking inference
+    never stalls the event loop (/health and /metrics stay responsive).
+    At most max_concurrency batches run at once; while all are busy,
+    requests wait in the queue, up to max_queue of them. Beyond that,
+    submit fails fast with InferenceQueueFull. Bulk requests are admitted
+    as a whole and score their rows with score_rows instead; their rows
+    still waiting count against max_queue like queued requests.
+    """
+
+    def __init__(
+        self,
+        predict_batch=route_batch,
+        max_batch_size: int = PREDICT_MAX_BATCH_SIZE,
+        max_wait_ms: float = PREDICT_MAX_WAIT_MS,
+        max_concurrency: int = INFERENCE_WORKERS,
+        max_queue: int = INFERENCE_MAX_QUEUE
+    ):
+        self.predict_batch = predict_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.executor = None
+        self.batches = 0
+        self.requests = 0
+        self.failed_batches = 0
+        self.rejected = 0
+        self.in_flight = 0
+        self.bulk_rows = 0
+        self._queue = None
+        self._slots = None
+        self._dispatches = set()
+        self._worker = None
+        self._loop = None
+
+    def _ensure_worker(self) -> None:
+        """Start the worker on the running event loop if it isn't running there"""
+        loop = asyncio.get_running_loop()
+
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrency, thread_name_prefix="inference"
+            )
+
+        if self._worker is None or self._worker.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+            self._worker = loop.create_task(self._run())
+
+    def _pending(self) -> int:
+        """Requests queued plus bulk rows not scored yet"""
+        return self._queue.qsize() + self.bulk_rows
+
+    def _reject(self) -> InferenceQueueFull:
+        """Count a rejected request and build its error"""
+        self.rejected += 1
+        track_inference_rejected()
+        return InferenceQueueFull(f"{self.max_queue} prediction requests already queued")
+
+    async def submit(self, features: dict) -> tuple:
+        """
+        Queue a request and wait for its row of the batch result.
+
+        Returns:
+            Tuple of (prediction result, model that produced it)
+
+        Raises:
+            InferenceQueueFull: If max_queue requests or bulk rows are
+                already waiting
+        """
+        self._ensure_worker()
+
+        if self._pending() >= self.max_queue:
+            raise self._reject()
+
+        future = self._loop.create_future()
+
+        try:
+            self._queue.put_nowait((features, future, time.time()))
+        except asyncio.QueueFull:
+            raise self._reject()
+
+        update_inference_queue_depth(self._queue.qsize())
+
+        return await future
+
+    async def _collect(self) -> list:
+        """Wait for a request, then gather a batch behind it"""
+        batch = [await self._queue.get()]
+        deadline = self._loop.time() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+
+            timeout = deadline - self._loop.time()
+            if timeout <= 0:
+                break
+
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _run(self) -> None:
+        """Dispatch batches until cancelled"""
+        while True:
+            # Collect the next batch only when an inference thread is free,
+            # so requests keep queueing (and batches grow) while all are busy
+            await self._slots.acquire()
+
+            try:
+                batch = await self._collect()
+            except BaseException:
+                self._slots.release()
+                raise
+
+            # Callers that went away (client disconnects) are not scored
+            batch = [item for item in batch if not item[1].done()]
+            if not batch:
+                self._slots.release()
+                continue
+
+            dispatch_time = time.time()
+            track_inference_batch(
+                len(batch),
+                self._queue.qsize(),
+                [dispatch_time - queued_at for _, _, queued_at in batch]
+            )
+
+            # Keep a reference until the batch is scored
+            task = self._loop.create_task(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, batch: list) -> None:
+        """Score a batch on the inference threads and resolve its futures"""
+        self.in_flight += 1
+        update_inference_in_flight(self.in_flight)
+
+        try:
+            rows = await self._loop.run_in_executor(
+                self.executor, self.predict_batch, [features for features, _, _ in batch]
+            )
+        except Exception as e:
+            self.failed_batches += 1
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            self.in_flight -= 1
+            update_inference_in_flight(self.in_flight)
+            self._slots.release()
+
+        self.batches += 1
+        self.requests += len(batch)
+
+        for (_, future, _), row in zip(batch, rows):
+            if not future.done():
+                future.set_result(row)
+
+    async def score_rows(self, features_batch: list) -> list:
+        """
+        Score the rows of one bulk request, max_batch_size rows per call.
+
+        The request is admitted as a whole while fewer than max_queue
+        requests and bulk rows are waiting, so it never sheds its own rows
+        and a lone request larger than max_queue is still scored. Its rows
+        count against max_queue until scored, so /predict requests and
+        other bulk requests arriving meanwhile are rejected rather than
+        piling up behind it. Chunks are scored one after another on the
+        inference threads; they don't wait for an inference slot, which the
+        idle worker holds while it waits for requests, so the thread pool
+        alone bounds concurrency. When a chunk fails, each of its rows gets
+        the error.
+
+        Returns:
+            Per row, (prediction result, model that produced it) or the
+            exception of its chunk
+
+        Raises:
+            InferenceQueueFull: If max_queue requests or bulk rows are
+                already waiting
+        """
+        self._ensure_worker()
+
+        if self._pending() >= self.max_queue:
+            raise self._reject()
+
+        rows = []
+        waiting = len(features_batch)
+        self.bulk_rows += waiting
+
+        try:
+            for start in range(0, len(features_batch), self.max_batch_size):
+                chunk = features_batch[start:start + self.max_batch_size]
+
+                self.in_flight += 1
+                update_inference_in_flight(self.in_flight)
+
+                try:
+                    rows.extend(await self._loop.run_in_executor(self.executor, self.predict_batch, chunk))
+                except Exception as e:
+                    self.failed_batches += 1
+                    rows.extend([e] * len(chunk))
+                    continue
+                finally:
+                    self.in_flight -= 1
+                    self.bulk_rows -= len(chunk)
+                    waiting -= len(chunk)
+                    update_inference_in_flight(self.in_flight)
+
+                self.batches += 1
+                self.requests += len(chunk)
+        finally:
+            # Rows of chunks never scored (the request was cancelled)
+            self.bulk_rows -= waiting
+
+        return rows
+
+    def stats(self) -> dict:
+        """Batching configuration and statistics"""
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000,
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "bulk_rows": self.bulk_rows,
+            "in_flight": self.in_flight,
+            "batches": self.batches,
+            "failed_batches": self.failed_batches,
+            "rejected": self.rejected,
+            "requests": self.requests,
+            "mean_batch_size": round(self.requests / self.batches, 2) if self.batches else 0.0,
+        }
+
+    async def stop(self) -> None:
+        """Stop the worker and the inference threads; requests still queued are cancelled"""
+        if self._worker is not None:
+            self._worker.cancel()
+
+            while not self._queue.empty():
+                _, future, _ = self._queue.get_nowait()
+                future.cancel()
+
+            update_inference_queue_depth(0)
+
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+
+# Batches /predict requests into single model calls
+batcher = MicroBatcher()
 
 
 @app.get("/")
@@ -102,7 +696,9 @@ async def health_check():
     return {
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
-        "model_version": model.version
+        "model_version": model.version,
+        "student_model_version": student_model.version,
+        "shadow_model_version": staging_model.version
     }
 
 
@@ -128,55 +724,117 @@ async def predict(data: dict):
         bearing_id = data.get("bearing_id", "unknown")
         features = data.get("features", {})
 
-        # Make prediction
-        result = model.predict(features)
-        duration = time.time() - start_time
-
-        # Track metrics
-        track_prediction(
-            model_version=model.version,
-            rul_value=result["rul"],
-            confidence=result["confidence"],
-            duration=duration,
-            success=True
-        )
-
-        # Update bearing health
-        if result["rul"] < 50:
-            status = "critical"
-        elif result["rul"] < 100:
-            status = "degrading"
-        else:
-            status = "healthy"
-
-        update_bearing_health(bearing_id, status)
-
-        # Return response
-        return {
-            "bearing_id": bearing_id,
-            "rul": round(result["rul"], 2),
-            "confidence": result["confidence"],
-            "status": status,
-            "inference_time": round(duration, 3),
-            "timestamp": result["timestamp"]
-        }
+        # Make prediction (scored in a batch with concurrent requests,
+        # on the inference threads)
+        result, scoring_model = await batcher.submit(features)
+
+        return _prediction_response(bearing_id, features, result, scoring_model, start_time)
+
+    except InferenceQueueFull as e:
+        # Shed load instead of queueing without bound
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
 
     except Exception as e:
-        duration = time.time() - start_time
-
-        # Track failed prediction
-        track_prediction(
-            model_version=model.version,
-            rul_value=0,
-            confidence="low",
-            duration=duration,
-            success=False,
-            error_type=type(e).__name__
-        )
+        _track_failed_prediction(e, start_time)
 
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _prediction_response(
+    bearing_id: str,
+    features: dict,
+    result: dict,
+    scoring_model: MockModel,
+    start_time: float
+) -> dict:
+    """Track a scored prediction and build its response"""
+    duration = time.time() - start_time
+
+    # Track metrics
+    track_prediction(
+        model_version=scoring_model.version,
+        rul_value=result["rul"],
+        confidence=result["confidence"],
+        duration=duration,
+        success=True
+    )
+
+    # Shadow-score a share of requests off the response path
+    shadow_scorer.submit(features, result["rul"])
+
+    # Update bearing health
+    if result["rul"] < 50:
+        status = "critical"
+    elif result["rul"] < 100:
+        status = "degrading"
+    else:
+        status = "healthy"
+
+    update_bearing_health(bearing_id, status)
+
+    # Return response
+    return {
+        "bearing_id": bearing_id,
+        "rul": round(result["rul"], 2),
+        "confidence": result["confidence"],
+        "status": status,
+        "model_version": scoring_model.version,
+        "inference_time": round(duration, 3),
+        "timestamp": result["timestamp"]
+    }
+
+
+def _track_failed_prediction(error: Exception, start_time: float) -> None:
+    """Track a failed prediction"""
+    track_prediction(
+        model_version=model.version,
+        rul_value=0,
+        confidence="low",
+        duration=time.time() - start_time,
+        success=False,
+        error_type=type(error).__name__
+    )
+
+
+async def _predict_bulk(bearings: list) -> list:
+    """
+    Predict RUL for the bearings of one bulk request.
+
+    The request is admitted as a whole: its rows are scored with
+    batcher.score_rows rather than queued one by one, so it isn't
+    rejected for holding more than INFERENCE_MAX_QUEUE bearings. It is
+    rejected with 503 while the queue is full, pending bulk rows included.
+
+    Returns:
+        Prediction response, or bearing_id and error, per bearing
+    """
+    start_time = time.time()
+
+    try:
+        rows = await batcher.score_rows([bearing_data.get("features", {}) for bearing_data in bearings])
+    except InferenceQueueFull as e:
+        # Shed load instead of queueing without bound
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+
+    results = []
+    for bearing_data, row in zip(bearings, rows):
+        bearing_id = bearing_data.get("bearing_id", "unknown")
+
+        try:
+            if isinstance(row, Exception):
+                raise row
+
+            results.append(
+                _prediction_response(bearing_id, bearing_data.get("features", {}), *row, start_time)
+            )
+
+        except Exception as e:
+            _track_failed_prediction(e, start_time)
+            results.append({"bearing_id": bearing_id, "error": str(e)})
+
+    return results
+
+
 @app.post("/batch_predict")
 async def batch_predict(data: dict):
     """
@@ -191,17 +849,8 @@ async def batch_predict(data: dict):
     }
     """
     bearings = data.get("bearings", [])
-    results = []
 
-    for bearing_data in bearings:
-        try:
-            result = await predict(bearing_data)
-            results.append(result)
-        except HTTPException as e:
-            results.append({
-                "bearing_id": bearing_data.get("bearing_id", "unknown"),
-                "error": str(e.detail)
-            })
+    results = await _predict_bulk(bearings)
 
     return {
         "total": len(bearings),
@@ -211,6 +860,65 @@ async def batch_predict(data: dict):
     }
 
 
+@app.get("/shadow/stats")
+async def shadow_stats():
+    """Shadow scoring statistics and agreement with the primary model"""
+    return shadow_scorer.stats()
+
+
+@app.on_event("shutdown")
+async def shutdown_shadow_scorer():
+    """Stop shadow scoring"""
+    shadow_scorer.shutdown()
+
+
+@app.get("/batching/stats")
+async def batching_stats():
+    """Micro-batching configuration and statistics of /predict"""
+    return batcher.stats()
+
+
+@app.on_event("shutdown")
+async def stop_batcher():
+    """Stop the micro-batching worker"""
+    await batcher.stop()
+
+
+@app.on_event("startup")
+async def start_model_reloader():
+    """Load the active production release and watch for new ones"""
+    if model_reloader is not None:
+        model_reloader.start()
+
+
+@app.on_event("shutdown")
+async def stop_model_reloader():
+    """Stop watching the production link"""
+    if model_reloader is not None:
+        model_reloader.stop()
+
+
+@app.post("/admin/reload", status_code=202)
+async def reload_model():
+    """Load the active production release in the background and swap it in"""
+    if model_reloader is None:
+        raise HTTPException(status_code=404, detail="No production model link configured")
+
+    if not model_reloader.request_reload():
+        raise HTTPException(status_code=409, detail="A reload is already in progress")
+
+    return {"status": "reloading", "production_link": model_reloader.link_path}
+
+
+@app.get("/admin/release")
+async def release_status():
+    """Active production release and reload statistics"""
+    if model_reloader is None:
+        return {"production_link": None, "model_version": model.version}
+
+    return model_reloader.status()
+
+
 @app.get("/model/info")
 async def model_info():
     """Get model information"""
@@ -261,24 +969,20 @@ async def simulate_load(requests: int = 100):
     Simulate load for testing monitoring
     Makes multiple predictions to generate metrics
     """
-    results = []
-
-    for i in range(requests):
-        bearing_id = f"B{i:03d}"
-        features = {
-            "temperature": random.uniform(30, 60),
-            "vibration": random.uniform(0.1, 0.5),
-            "speed": random.uniform(1500, 2000)
+    bearings = [
+        {
+            "bearing_id": f"B{i:03d}",
+            "features": {
+                "temperature": random.uniform(30, 60),
+                "vibration": random.uniform(0.1, 0.5),
+                "speed": random.uniform(1500, 2000)
+            }
         }
+        for i in range(requests)
+    ]
 
-        try:
-            result = await predict({
-                "bearing_id": bearing_id,
-                "features": features
-            })
-            results.append(result)
-        except Exception as e:
-            results.append({"bearing_id": bearing_id, "error": str(e)})
+    # Scored in batches, as one admitted request
+    results = await _predict_bulk(bearings)
 
     return {
         "total_requests": requests,
@@ -86,6 +86,74 @@ PREDICTION_FAILED = Counter(
     ['model_version', 'error_type']
 )
 
+# Shadow scoring metrics (staging model scored off the response path)
+SHADOW_PREDICTIONS = Counter(
+    'model_shadow_predictions_total',
+    'Total number of shadow predictions by outcome (scored, dropped, failed)',
+    ['model_version', 'status']
+)
+
+SHADOW_DURATION = Histogram(
+    'model_shadow_inference_duration_seconds',
+    'Shadow model inference duration in seconds',
+    ['model_version'],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0)
+)
+
+SHADOW_AGREEMENT = Gauge(
+    'model_shadow_agreement',
+    'Agreement of shadow with primary predictions (mae, rmse, bias, max_error, samples)',
+    ['model_version', 'metric']
+)
+
+# Model hot reload metrics (new production release loaded in the background)
+MODEL_RELOADS = Counter(
+    'model_reloads_total',
+    'Total number of model reloads by outcome (success, failed)',
+    ['status']
+)
+
+MODEL_RELOAD_DURATION = Histogram(
+    'model_reload_duration_seconds',
+    'Duration of loading and warming up a new model release in seconds',
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+)
+
+# Micro-batching metrics (concurrent requests scored in one model call)
+INFERENCE_QUEUE_DEPTH = Gauge(
+    'model_inference_queue_depth',
+    'Number of prediction requests waiting to be batched'
+)
+
+INFERENCE_QUEUE_DEPTH_AT_DISPATCH = Histogram(
+    'model_inference_queue_depth_at_dispatch',
+    'Requests left waiting when a batch is dispatched',
+    buckets=(0, 1, 2, 4, 8, 16, 32, 64, 128, 256)
+)
+
+INFERENCE_BATCH_SIZE = Histogram(
+    'model_inference_batch_size',
+    'Number of requests scored per batched model call',
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128)
+)
+
+INFERENCE_BATCH_WAIT = Histogram(
+    'model_inference_batch_wait_seconds',
+    'Time a request waits in the queue before its batch is dispatched',
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+)
+
+# Inference offloading metrics (batches scored on a bounded thread pool)
+INFERENCE_IN_FLIGHT = Gauge(
+    'model_inference_batches_in_flight',
+    'Number of batches being scored on the inference threads'
+)
+
+INFERENCE_REJECTED = Counter(
+    'model_inference_rejected_total',
+    'Total number of prediction requests rejected because the inference queue was full'
+)
+
 # Model performance metrics
 MODEL_ACCURACY = Gauge(
     'model_prediction_accuracy',
@@ -265,6 +333,65 @@ def track_prediction(
         ).inc()
 
 
+def track_shadow_prediction(
+    model_version: str,
+    status: str,
+    duration: float = None
+):
+    """Track a shadow prediction (status: scored, dropped or failed)"""
+    SHADOW_PREDICTIONS.labels(
+        model_version=model_version,
+        status=status
+    ).inc()
+
+    if duration is not None:
+        SHADOW_DURATION.labels(
+            model_version=model_version
+        ).observe(duration)
+
+
+def update_shadow_agreement(model_version: str, metrics: dict):
+    """Update shadow vs primary agreement metrics"""
+    for metric, value in metrics.items():
+        SHADOW_AGREEMENT.labels(
+            model_version=model_version,
+            metric=metric
+        ).set(value)
+
+
+def track_model_reload(status: str, duration: float = None):
+    """Track a model reload (status: success or failed)"""
+    MODEL_RELOADS.labels(status=status).inc()
+
+    if duration is not None:
+        MODEL_RELOAD_DURATION.observe(duration)
+
+
+def update_inference_queue_depth(depth: int):
+    """Update the number of requests waiting to be batched"""
+    INFERENCE_QUEUE_DEPTH.set(depth)
+
+
+def track_inference_batch(batch_size: int, queue_depth: int, wait_times: list):
+    """Track a dispatched batch: its size, the queue left behind and each request's wait"""
+    INFERENCE_BATCH_SIZE.observe(batch_size)
+    INFERENCE_QUEUE_DEPTH_AT_DISPATCH.observe(queue_depth)
+    INFERENCE_QUEUE_DEPTH.set(queue_depth)
+
+    for wait_time in wait_times:
+        INFERENCE_BATCH_WAIT.observe(wait_time)
+
+
+def update_inference_in_flight(batches: int):
+    """Update the number of batches being scored"""
+    INFERENCE_IN_FLIGHT.set(batches)
+
+
+def track_inference_rejected():
+    """Track a prediction request rejected because the inference queue was full"""
+    INFERENCE_REJECTED.inc()
+
+
 def update_model_metrics(
     accuracy: float = None,
     mae: float = None,
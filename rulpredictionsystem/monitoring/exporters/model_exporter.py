@@ -78,6 +78,7 @@ class ModelMetricsCollector:
             'password': os.getenv('DB_PASSWORD', 'postgres')
         }
         self.model_path = os.getenv('MODEL_PATH', '/models/latest')
+        self.model_name = os.getenv('RUL_MODEL_NAME', 'rul_cnn_lstm')
         self.metrics_interval = int(os.getenv('METRICS_INTERVAL', '60'))
 
     def connect_db(self):
@@ -97,18 +98,30 @@ class ModelMetricsCollector:
                 return
 
             with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                # Get latest model metrics
+                # Production model from the model registry (partial index
+                # idx_models_production) and the training run that produced it
                 cur.execute("""
                     SELECT
-                        accuracy, mae, rmse, mape, r2_score,
-                        precision, recall, f1_score,
-                        training_loss, validation_loss,
-                        training_timestamp, training_duration,
-                        model_version, algorithm, feature_count
-                    FROM model_metrics
-                    ORDER BY training_timestamp DESC
-                    LIMIT 1
-                """)
+                        m.accuracy, m.mae, m.rmse, m.r2_score,
+                        (m.metrics->>'mape')::float AS mape,
+                        (m.metrics->>'precision')::float AS precision,
+                        (m.metrics->>'recall')::float AS recall,
+                        (m.metrics->>'f1_score')::float AS f1_score,
+                        r.training_loss, r.validation_loss,
+                        m.training_date AS training_timestamp,
+                        r.duration_seconds AS training_duration,
+                        m.model_version, m.algorithm,
+                        (m.metrics->>'n_features')::int AS feature_count
+                    FROM models m
+                    LEFT JOIN LATERAL (
+                        SELECT training_loss, validation_loss, duration_seconds
+                        FROM training_runs
+                        WHERE model_id = m.id
+                        ORDER BY start_time DESC
+                        LIMIT 1
+                    ) r ON TRUE
+                    WHERE m.model_name = %s AND m.status = 'production'
+                """, (self.model_name,))
 
                 result = cur.fetchone()
 
@@ -155,18 +168,26 @@ class ModelMetricsCollector:
                 return
 
             with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                # Scores of the production model, else the latest evaluated model
                 cur.execute("""
                     SELECT feature_name, importance_score
                     FROM feature_importance
-                    WHERE model_version = (
-                        SELECT model_version
-                        FROM model_metrics
-                        ORDER BY training_timestamp DESC
-                        LIMIT 1
+                    WHERE model_version = COALESCE(
+                        (
+                            SELECT model_version
+                            FROM models
+                            WHERE model_name = %s AND status = 'production'
+                        ),
+                        (
+                            SELECT model_version
+                            FROM feature_importance
+                            ORDER BY computed_at DESC
+                            LIMIT 1
+                        )
                     )
                     ORDER BY importance_score DESC
                     LIMIT 20
-                """)
+                """, (self.model_name,))
 
                 results = cur.fetchall()
 
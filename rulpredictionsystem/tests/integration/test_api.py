@@ -8,8 +8,19 @@ Tests cover:
 - Authentication
 - Rate limiting
 - Error handling
+- Micro-batching and load shedding of the monitoring example API
+- Bulk prediction requests
+- Shadow scoring of live requests
+- Hot reload of the primary model
 """
 
+import os
+import sys
+import time
+import asyncio
+import threading
+from pathlib import Path
+
 import pytest
 from fastapi.testclient import TestClient
 import json
@@ -160,3 +171,399 @@ class TestWebSocket:
     async def test_websocket_connection(self):
         """Test WebSocket connection"""
         pytest.skip("WebSocket testing requires async setup")
+
+
+# ==================== Monitoring Example API ====================
+
+MONITORING_DIR = Path(__file__).parent.parent.parent / "monitoring"
+
+
+@pytest.fixture(scope="module")
+def monitoring_api():
+    """The monitoring example API module (monitoring/examples/fastapi_integration.py)"""
+    pytest.importorskip("prometheus_client")
+
+    for path in (MONITORING_DIR / "examples", MONITORING_DIR.parent / "airflow" / "plugins"):
+        if str(path) not in sys.path:
+            sys.path.insert(0, str(path))
+
+    import fastapi_integration
+    return fastapi_integration
+
+
+@pytest.fixture
+def monitoring_client(monitoring_api, monkeypatch):
+    """Test client of the monitoring API with its own shadow scorer and no reloader"""
+    monkeypatch.setattr(monitoring_api, "shadow_scorer", monitoring_api.ShadowScorer(FakeModel(), sample_rate=0))
+    monkeypatch.setattr(monitoring_api, "model_reloader", None)
+
+    with TestClient(monitoring_api.app) as client:
+        yield client
+
+
+class FakeModel:
+    """Model predicting a fixed RUL (or features["rul"]), optionally blocking until released"""
+
+    def __init__(self, rul: float = 150.0, version: str = "fake", release: threading.Event = None):
+        self.rul = rul
+        self.version = version
+        self.release = release
+
+    def predict(self, features: dict) -> dict:
+        return self.predict_batch([features])[0]
+
+    def predict_batch(self, features_batch: list) -> list:
+        if self.release is not None:
+            self.release.wait(5)
+
+        return [
+            {"rul": features.get("rul", self.rul), "confidence": "high", "timestamp": "2024-01-01T00:00:00"}
+            for features in features_batch
+        ]
+
+
+class RecordingPredictor:
+    """predict_batch recording batch sizes and peak concurrency, failing batches with a 'fail' row"""
+
+    def __init__(self, model: FakeModel = None, latency: float = 0.0, release: threading.Event = None):
+        self.model = model or FakeModel()
+        self.latency = latency
+        self.release = release
+        self.batch_sizes = []
+        self.running = 0
+        self.peak_running = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, features_batch: list) -> list:
+        with self._lock:
+            self.batch_sizes.append(len(features_batch))
+            self.running += 1
+            self.peak_running = max(self.peak_running, self.running)
+
+        try:
+            if self.release is not None:
+                self.release.wait(5)
+            time.sleep(self.latency)
+
+            if any(features.get("fail") for features in features_batch):
+                raise ValueError("batch failed")
+
+            return [(row, self.model) for row in self.model.predict_batch(features_batch)]
+
+        finally:
+            with self._lock:
+                self.running -= 1
+
+
+@pytest.mark.api
+@pytest.mark.asyncio
+class TestMicroBatcher:
+    """Test micro-batching of /predict requests"""
+
+    async def test_dispatches_full_batches(self, monitoring_api):
+        """Test queued requests are scored max_batch_size at a time, each getting its own row"""
+        predictor = RecordingPredictor()
+        batcher = monitoring_api.MicroBatcher(
+            predict_batch=predictor, max_batch_size=4, max_wait_ms=1000, max_concurrency=1
+        )
+
+        try:
+            rows = await asyncio.gather(*(batcher.submit({"rul": float(i)}) for i in range(8)))
+        finally:
+            await batcher.stop()
+
+        assert [result["rul"] for result, _ in rows] == [float(i) for i in range(8)]
+        assert predictor.batch_sizes == [4, 4]
+        assert batcher.stats()["mean_batch_size"] == 4.0
+
+    async def test_dispatches_after_max_wait(self, monitoring_api):
+        """Test a lone request is scored once max_wait_ms have passed"""
+        predictor = RecordingPredictor()
+        batcher = monitoring_api.MicroBatcher(predict_batch=predictor, max_batch_size=32, max_wait_ms=50)
+
+        start = time.perf_counter()
+        try:
+            result, _ = await batcher.submit({"rul": 80.0})
+        finally:
+            await batcher.stop()
+
+        assert result["rul"] == 80.0
+        assert predictor.batch_sizes == [1]
+        assert 0.04 <= time.perf_counter() - start < 1.0
+
+    async def test_failed_batch_fails_each_request(self, monitoring_api):
+        """Test every request of a failed batch gets the error"""
+        batcher = monitoring_api.MicroBatcher(
+            predict_batch=RecordingPredictor(), max_batch_size=3, max_wait_ms=1000
+        )
+
+        try:
+            outcomes = await asyncio.gather(
+                *(batcher.submit({"fail": True}) for _ in range(3)),
+                return_exceptions=True
+            )
+        finally:
+            await batcher.stop()
+
+        assert all(isinstance(outcome, ValueError) for outcome in outcomes)
+        assert batcher.stats()["failed_batches"] == 1
+
+    async def test_max_concurrency(self, monitoring_api):
+        """Test at most max_concurrency batches are scored at once, off the event loop"""
+        predictor = RecordingPredictor(latency=0.05)
+        batcher = monitoring_api.MicroBatcher(
+            predict_batch=predictor, max_batch_size=1, max_wait_ms=0, max_concurrency=2
+        )
+
+        try:
+            rows = await asyncio.gather(*(batcher.submit({}) for _ in range(6)))
+        finally:
+            await batcher.stop()
+
+        assert len(rows) == 6
+        assert predictor.peak_running == 2
+
+    async def test_queue_bound(self, monitoring_api):
+        """Test requests beyond max_queue are rejected while the inference threads are busy"""
+        release = threading.Event()
+        batcher = monitoring_api.MicroBatcher(
+            predict_batch=RecordingPredictor(release=release),
+            max_batch_size=1, max_wait_ms=0, max_concurrency=1, max_queue=2
+        )
+
+        try:
+            # The first request occupies the only inference thread, two more wait
+            first = asyncio.ensure_future(batcher.submit({}))
+            await asyncio.sleep(0.05)
+            queued = [asyncio.ensure_future(batcher.submit({})) for _ in range(2)]
+            await asyncio.sleep(0.05)
+
+            with pytest.raises(monitoring_api.InferenceQueueFull):
+                await batcher.submit({})
+
+            release.set()
+            rows = await asyncio.gather(first, *queued)
+        finally:
+            release.set()
+            await batcher.stop()
+
+        assert len(rows) == 3
+        assert batcher.stats()["rejected"] == 1
+
+    async def test_bulk_rows_count_against_queue_bound(self, monitoring_api):
+        """Test requests arriving while a bulk request's rows are pending are rejected"""
+        release = threading.Event()
+        batcher = monitoring_api.MicroBatcher(
+            predict_batch=RecordingPredictor(release=release),
+            max_batch_size=2, max_wait_ms=0, max_concurrency=1, max_queue=2
+        )
+
+        try:
+            # Larger than max_queue, yet admitted as a whole
+            bulk = asyncio.ensure_future(batcher.score_rows([{} for _ in range(3)]))
+            await asyncio.sleep(0.05)
+            assert batcher.stats()["bulk_rows"] == 3
+
+            with pytest.raises(monitoring_api.InferenceQueueFull):
+                await batcher.score_rows([{}])
+            with pytest.raises(monitoring_api.InferenceQueueFull):
+                await batcher.submit({})
+
+            release.set()
+            rows = await bulk
+        finally:
+            release.set()
+            await batcher.stop()
+
+        assert len(rows) == 3
+        stats = batcher.stats()
+        assert stats["rejected"] == 2
+        assert stats["bulk_rows"] == 0
+
+
+@pytest.mark.api
+class TestLoadShedding:
+    """Test /predict load shedding and bulk requests"""
+
+    def test_queue_full_returns_503(self, monitoring_api, monitoring_client, monkeypatch):
+        """Test a full inference queue answers 503 with Retry-After"""
+        async def queue_full(features):
+            raise monitoring_api.InferenceQueueFull("queue full")
+
+        monkeypatch.setattr(monitoring_api.batcher, "submit", queue_full)
+
+        response = monitoring_client.post("/predict", json={"bearing_id": "B001", "features": {}})
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+
+
+@pytest.mark.api
+class TestBulkRequests:
+    """Test bulk prediction requests, admitted as a whole"""
+
+    def test_batch_predict_beyond_queue_bound(self, monitoring_api, monitoring_client, monkeypatch):
+        """Test a bulk request larger than the queue is scored in max_batch_size chunks"""
+        predictor = RecordingPredictor()
+        monkeypatch.setattr(monitoring_api, "batcher", monitoring_api.MicroBatcher(
+            predict_batch=predictor, max_batch_size=8, max_queue=2
+        ))
+
+        response = monitoring_client.post("/batch_predict", json={
+            "bearings": [{"bearing_id": f"B{i:03d}", "features": {}} for i in range(20)]
+        })
+
+        assert response.status_code == 200
+        assert response.json()["successful"] == 20
+        assert predictor.batch_sizes == [8, 8, 4]
+        assert monitoring_api.batcher.stats()["rejected"] == 0
+
+    def test_batch_predict_failed_chunk(self, monitoring_api, monitoring_client, monkeypatch):
+        """Test a failed chunk only fails its own bearings"""
+        monkeypatch.setattr(monitoring_api, "batcher", monitoring_api.MicroBatcher(
+            predict_batch=RecordingPredictor(), max_batch_size=2
+        ))
+
+        bearings = [{"bearing_id": f"B{i:03d}", "features": {"fail": i == 2}} for i in range(5)]
+        results = monitoring_client.post("/batch_predict", json={"bearings": bearings}).json()["results"]
+
+        assert [result["bearing_id"] for result in results if "error" in result] == ["B002", "B003"]
+        assert all(result["rul"] == 150.0 for result in results if "error" not in result)
+
+    def test_simulate_load_beyond_queue_bound(self, monitoring_api, monitoring_client, monkeypatch):
+        """Test simulated load is not shed by the queue bound"""
+        monkeypatch.setattr(monitoring_api, "batcher", monitoring_api.MicroBatcher(
+            predict_batch=RecordingPredictor(), max_batch_size=4, max_queue=1
+        ))
+
+        response = monitoring_client.get("/simulate_load", params={"requests": 10})
+
+        assert response.json()["successful"] == 10
+
+    def test_batch_predict_queue_full_returns_503(self, monitoring_api, monitoring_client, monkeypatch):
+        """Test a bulk request arriving while the queue is full answers 503 with Retry-After"""
+        async def queue_full(features_batch):
+            raise monitoring_api.InferenceQueueFull("queue full")
+
+        monkeypatch.setattr(monitoring_api.batcher, "score_rows", queue_full)
+
+        response = monitoring_client.post("/batch_predict", json={
+            "bearings": [{"bearing_id": "B001", "features": {}}]
+        })
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+
+
+@pytest.mark.api
+class TestShadowScorer:
+    """Test shadow scoring of live requests"""
+
+    def test_sampling(self, monitoring_api):
+        """Test only the sampled share of requests is shadow-scored"""
+        never = monitoring_api.ShadowScorer(FakeModel(), sample_rate=0)
+        always = monitoring_api.ShadowScorer(FakeModel(), sample_rate=1)
+
+        try:
+            assert not any(never.submit({}, 100.0) for _ in range(20))
+            assert all(always.submit({}, 100.0) for _ in range(20))
+        finally:
+            always.executor.shutdown(wait=True)
+            never.shutdown()
+
+        assert never.stats()["scored"] == 0
+        assert always.stats()["scored"] == 20
+
+    def test_drops_when_backlog_full(self, monitoring_api):
+        """Test shadow work beyond max_pending is dropped, not queued"""
+        release = threading.Event()
+        scorer = monitoring_api.ShadowScorer(FakeModel(release=release), sample_rate=1, max_pending=1)
+
+        try:
+            assert scorer.submit({}, 100.0)
+            assert not scorer.submit({}, 100.0)
+        finally:
+            release.set()
+            scorer.executor.shutdown(wait=True)
+
+        stats = scorer.stats()
+        assert stats["dropped"] == 1
+        assert stats["scored"] == 1
+        assert stats["pending"] == 0
+
+    def test_agreement(self, monitoring_api):
+        """Test agreement metrics compare the shadow prediction with the primary one"""
+        scorer = monitoring_api.ShadowScorer(FakeModel(), sample_rate=1)
+
+        try:
+            for primary_rul in (50.0, 100.0, 150.0):
+                scorer.submit({"rul": primary_rul + 2.0}, primary_rul)
+        finally:
+            scorer.executor.shutdown(wait=True)
+
+        stats = scorer.stats()
+        assert stats["scored"] == 3
+        assert stats["agreement"]["mae"] == pytest.approx(2.0)
+        assert stats["agreement"]["max_error"] == pytest.approx(2.0)
+
+
+@pytest.mark.api
+class TestModelReloader:
+    """Test hot reload of the primary model"""
+
+    @pytest.fixture
+    def production_link(self, tmp_path):
+        """Production link pointing to release r1"""
+        (tmp_path / "releases" / "r1").mkdir(parents=True)
+        os.symlink(tmp_path / "releases" / "r1", tmp_path / "production")
+        return str(tmp_path / "production")
+
+    def test_reload_swaps_model(self, monitoring_api, production_link):
+        """Test the active release's model is loaded, warmed up and swapped in"""
+        swapped = []
+        reloader = monitoring_api.ModelReloader(
+            production_link, loader=lambda release_dir: FakeModel(version=os.path.basename(release_dir)),
+            on_swap=swapped.append
+        )
+
+        assert reloader.reload()
+        assert [new_model.version for new_model in swapped] == ["r1"]
+        assert reloader.status()["active_release"] == "r1"
+
+    def test_failed_load_keeps_model(self, monitoring_api, production_link):
+        """Test a failed load or warm-up keeps the current model"""
+        class BrokenModel(FakeModel):
+            def predict_batch(self, features_batch):
+                raise RuntimeError("warm-up failed")
+
+        def failing_loader(release_dir):
+            raise FileNotFoundError(release_dir)
+
+        swapped = []
+        for loader in (failing_loader, lambda release_dir: BrokenModel()):
+            reloader = monitoring_api.ModelReloader(production_link, loader=loader, on_swap=swapped.append)
+
+            assert not reloader.reload()
+            assert reloader.last_error
+            assert reloader.status()["active_release"] is None
+
+        assert swapped == []
+
+    def test_concurrent_reload_returns_409(self, monitoring_api, monitoring_client, production_link, monkeypatch):
+        """Test /admin/reload is refused while a reload is running"""
+        release = threading.Event()
+        reloader = monitoring_api.ModelReloader(
+            production_link, loader=lambda release_dir: FakeModel(release=release), on_swap=lambda new_model: None
+        )
+        monkeypatch.setattr(monitoring_api, "model_reloader", reloader)
+
+        try:
+            assert monitoring_client.post("/admin/reload").status_code == 202
+            while not reloader.status()["reloading"]:
+                time.sleep(0.01)
+
+            response = monitoring_client.post("/admin/reload")
+        finally:
+            release.set()
+
+        assert response.status_code == 409